@@ -4,19 +4,14 @@ Fichier: backend/api/admin.py
 """
 
 from flask import Blueprint, request, jsonify, g
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 from backend.services.user_service import UserService
+from services.llm_cache import get_llm_cache  # Même module que llm_service (un seul cache)
 from backend.middleware.admin_middleware import admin_required
-from backend.config import Config
+from backend.database import Session
 
 # Créer le Blueprint
 admin_bp = Blueprint('admin', __name__, url_prefix='/api/admin')
 
-# Configuration de la base de données
-engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
-Session = sessionmaker(bind=engine)
-
 @admin_bp.route('/users', methods=['GET'])
 @admin_required
 def get_all_users():
@@ -327,4 +322,27 @@ def get_stats():
         return jsonify({
             'success': False,
             'error': 'Erreur serveur'
-        }), 500
\ No newline at end of file
+        }), 500
+
+@admin_bp.route('/llm-cache', methods=['GET'])
+@admin_required
+def get_llm_cache_stats():
+    """
+    Compteurs du cache de réponses LLM (admin only)
+
+    Response:
+        {
+            "success": true,
+            "enabled": true,
+            "stats": {"backend": "redis", "hits": 12, "misses": 30, "hit_ratio": 0.2857, "entries": 30, ...}
+        }
+    """
+    cache = get_llm_cache()
+    if cache is None:
+        return jsonify({'success': True, 'enabled': False}), 200
+
+    return jsonify({
+        'success': True,
+        'enabled': True,
+        'stats': cache.stats()
+    }), 200
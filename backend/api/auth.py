@@ -4,19 +4,13 @@ Fichier: backend/api/auth.py
 """
 
 from flask import Blueprint, request, jsonify, g
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
 from backend.services.auth_service import AuthService
 from backend.middleware.auth_middleware import token_required
-from backend.config import Config
+from backend.database import Session
 
 # Créer le Blueprint
 auth_bp = Blueprint('auth', __name__, url_prefix='/api/auth')
 
-# Configuration de la base de données
-engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
-Session = sessionmaker(bind=engine)
-
 @auth_bp.route('/login', methods=['POST'])
 def login():
     """
@@ -12,8 +12,10 @@ parent_dir = os.path.dirname(current_dir)
 sys.path.insert(0, parent_dir)
 sys.path.insert(0, current_dir)
 
-from flask import Flask, request, jsonify, g
+from flask import Flask, Response, request, jsonify, g
 from flask_cors import CORS
+import json
+import time
 import logging
 from dotenv import load_dotenv
 
@@ -22,12 +24,15 @@ from backend.api.auth import auth_bp
 from backend.api.admin import admin_bp
 from backend.middleware.auth_middleware import token_required
 from backend.routes.workflow_routes import workflow_bp
+from backend.database import Session
+from backend.config import Config
 
 # Import Celery tasks
 from celery_tasks.workflow_tasks import workflow1_task, workflow2_task, workflow3_task
 
 # Import workflow service
 from services.workflow_service import WorkflowService
+from services.progress_store import ProgressStore
 
 # Import workflow managers (pour preview seulement)
 from workflows.workflow_2.steps.article_scraper import ArticleScraper
@@ -52,6 +57,7 @@ app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
 # Initialize services
 article_scraper = ArticleScraper()
 workflow_service = WorkflowService()
+progress_store = ProgressStore()
 
 # ========================================
 # ENREGISTREMENT DES BLUEPRINTS
@@ -60,6 +66,12 @@ app.register_blueprint(auth_bp)
 app.register_blueprint(admin_bp)
 app.register_blueprint(workflow_bp, url_prefix='/api')
 
+
+@app.teardown_appcontext
+def remove_db_session(exception=None):
+    """Rendre la session SQLAlchemy du thread (et sa connexion) au pool"""
+    Session.remove()
+
 # ========================================
 # ROUTES DE TEST
 # ========================================
@@ -74,43 +86,9 @@ def test():
 
 @app.route('/api/workflow-progress/<workflow_id>', methods=['GET'])
 def get_workflow_progress(workflow_id):
-    """Get real-time progress of a workflow via Celery"""
+    """Get real-time progress of a workflow from the Redis progress store"""
     try:
-        from celery_config import celery_app
-        
-        # Récupérer le résultat de la task Celery
-        task = celery_app.AsyncResult(workflow_id)
-        
-        if task.state == 'PENDING':
-            response = {
-                'status': 'pending',
-                'current_step': 0,
-                'progress_percent': 0
-            }
-        elif task.state == 'PROGRESS':
-            response = {
-                'status': 'in_progress',
-                'current_step': task.info.get('current_step', 0),
-                'total_steps': task.info.get('total_steps', 4),
-                'progress_percent': task.info.get('progress', 0)
-            }
-        elif task.state == 'SUCCESS':
-            response = {
-                'status': 'completed',
-                'result': task.result
-            }
-        elif task.state == 'FAILURE':
-            response = {
-                'status': 'error',
-                'error': str(task.info)
-            }
-        else:
-            response = {
-                'status': task.state.lower(),
-                'info': str(task.info)
-            }
-        
-        return jsonify(response)
+        return jsonify(_current_progress(workflow_id))
         
     except Exception as e:
         logger.error(f"Error getting workflow progress: {str(e)}")
@@ -119,6 +97,119 @@ def get_workflow_progress(workflow_id):
             'message': str(e)
         }), 500
 
+
+@app.route('/api/workflow-progress/<workflow_id>/stream', methods=['GET'])
+def stream_workflow_progress(workflow_id):
+    """
+    Stream workflow progress as Server-Sent Events
+
+    Sends the current state, then a new state after each progress store
+    write (Redis pub/sub), until the workflow completes or fails. Events carry
+    the same JSON as /api/workflow-progress/<id>; idle time costs only a
+    comment line every PROGRESS_STREAM_HEARTBEAT seconds.
+    """
+    try:
+        # Subscribe before the first read so no update falls in between
+        pubsub = progress_store.subscribe(workflow_id)
+    except Exception as e:
+        logger.warning(f"Progress stream unavailable: {str(e)}")
+        return jsonify({
+            'status': 'error',
+            'message': 'Progress stream unavailable'
+        }), 503
+
+    def events():
+        # Reconnect after 3s; the stream is closed after PROGRESS_STREAM_MAX_DURATION
+        # and resumed by the browser from the current state
+        yield 'retry: 3000\n\n'
+        deadline = time.monotonic() + Config.PROGRESS_STREAM_MAX_DURATION
+        try:
+            while True:
+                progress = _current_progress(workflow_id)
+                yield f"data: {json.dumps(progress, ensure_ascii=False)}\n\n"
+                if progress['status'] in ('completed', 'error'):
+                    return
+
+                message = None
+                while message is None:
+                    if time.monotonic() >= deadline:
+                        return
+                    message = pubsub.get_message(timeout=Config.PROGRESS_STREAM_HEARTBEAT)
+                    if message is None:
+                        yield ': keepalive\n\n'
+                while pubsub.get_message() is not None:
+                    pass  # Several writes in a row: send the latest state once
+        except Exception as e:
+            logger.warning(f"Progress stream for {workflow_id} interrupted: {str(e)}")
+        finally:
+            pubsub.close()
+
+    return Response(events(), mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no'  # Nginx: send each event immediately
+    })
+
+
+def _current_progress(workflow_id):
+    """Progress response from the Redis progress store, or Celery if absent"""
+    progress = progress_store.get(workflow_id)
+
+    if progress is None:
+        # Registered at submission, so unknown here and in MySQL means a bogus or purged ID
+        if not workflow_service.workflow_exists(workflow_id):
+            return {
+                'status': 'error',
+                'error': 'Workflow not found'
+            }
+        # Progress expired: ask Celery
+        return _get_celery_progress(workflow_id)
+
+    status = progress['status']
+    response = {
+        'status': 'in_progress' if status == 'processing' else status,
+        'current_step': progress['current_step'],
+        'total_steps': progress['total_steps'],
+        'progress_percent': progress['progress'],
+        'step_details': progress['step_details']
+    }
+
+    if status == 'error':
+        response['error'] = progress.get('error')
+    if 'result' in progress:
+        response['result'] = progress['result']
+
+    return response
+
+
+def _get_celery_progress(workflow_id):
+    """Progress from the Celery result backend (fallback)"""
+    from celery_config import celery_app
+
+    # Récupérer le résultat de la task Celery
+    task = celery_app.AsyncResult(workflow_id)
+
+    if task.state == 'PENDING':
+        return {
+            'status': 'pending',
+            'current_step': 0,
+            'progress_percent': 0
+        }
+    elif task.state == 'SUCCESS':
+        return {
+            'status': 'completed',
+            'result': task.result
+        }
+    elif task.state == 'FAILURE':
+        return {
+            'status': 'error',
+            'error': str(task.info)
+        }
+    else:
+        return {
+            'status': task.state.lower(),
+            'info': str(task.info)
+        }
+
 @app.route('/api/test-post', methods=['POST'])
 def test_post():
     """Test d'envoi de données depuis PHP"""
@@ -204,6 +295,9 @@ def workflow1():
         from datetime import datetime
         workflow_id = f"wf1_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
 
+        # Connu du progress store dès l'envoi : le flux de progression le distingue d'un ID inconnu
+        progress_store.start(workflow_id, total_steps=4)
+
         # Lancer la task Celery
         task = workflow1_task.apply_async(
             args=[workflow_id, g.user_id, data],
@@ -224,6 +318,22 @@ def workflow1():
             'message': str(e)
         }), 500
 
+def _run_async(coro):
+    """
+    Run a coroutine to completion on its own event loop
+
+    Under gevent all greenlets share one OS thread, hence one running asyncio
+    loop: two concurrent requests would collide on it. The coroutine then runs
+    on a real OS thread from the gevent hub threadpool.
+    """
+    import asyncio
+    if 'gevent' in sys.modules:
+        from gevent import get_hub, monkey
+        if monkey.is_module_patched('threading'):
+            return get_hub().threadpool.apply(asyncio.run, (coro,))
+    return asyncio.run(coro)
+
+
 @app.route('/api/preview-article', methods=['POST'])
 @token_required
 def preview_article():
@@ -239,14 +349,7 @@ def preview_article():
             }), 400
 
         # Use async preview method
-        import asyncio
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-        result = loop.run_until_complete(article_scraper.preview_article(article_url))
+        result = _run_async(article_scraper.preview_article(article_url))
         return jsonify(result)
 
     except Exception as e:
@@ -327,6 +430,9 @@ def workflow2():
         from datetime import datetime
         workflow_id = f"wf2_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
 
+        # Connu du progress store dès l'envoi : le flux de progression le distingue d'un ID inconnu
+        progress_store.start(workflow_id, total_steps=3)
+
         # Lancer la task Celery
         task = workflow2_task.apply_async(
             args=[workflow_id, g.user_id, data],
@@ -370,6 +476,9 @@ def workflow3():
         from datetime import datetime
         workflow_id = f"wf3_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
 
+        # Connu du progress store dès l'envoi : le flux de progression le distingue d'un ID inconnu
+        progress_store.start(workflow_id, total_steps=4)
+
         # Lancer la task Celery
         task = workflow3_task.apply_async(
             args=[workflow_id, g.user_id, data],
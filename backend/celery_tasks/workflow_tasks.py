@@ -3,9 +3,11 @@ Celery Tasks pour les Workflows
 """
 from celery_config import celery_app
 from services.workflow_service import WorkflowService
+from services.progress_store import ProgressStore
 from workflows.workflow_1.workflow_manager import WorkflowManager as WorkflowManager1
 from workflows.workflow_2.workflow_manager import WorkflowManager as WorkflowManager2
 from workflows.workflow_3.workflow_manager import WorkflowManager as WorkflowManager3
+import json
 import logging
 import time
 
@@ -13,10 +15,25 @@ logger = logging.getLogger(__name__)
 
 # Initialize services
 workflow_service = WorkflowService()
+progress_store = ProgressStore(on_flush=workflow_service.update_progress)
 workflow_manager_1 = WorkflowManager1()
 workflow_manager_2 = WorkflowManager2()
 workflow_manager_3 = WorkflowManager3()
 
+
+def article_metadata(article):
+    """Metadata file content saved next to each article HTML"""
+    return {
+        'seo_title': article.get('seo_title', ''),
+        'meta_description': article.get('meta_description', ''),
+        'wordpress_excerpt': article.get('wordpress_excerpt', ''),
+        'image_url': article.get('image_url', ''),
+        'faq_json': article.get('faq_json', []),
+        'secondary_keywords': article.get('secondary_keywords', []),
+        'word_count': article.get('word_count', 0)
+    }
+
+
 @celery_app.task(name='celery_tasks.workflow_tasks.workflow1_task', bind=True)
 def workflow1_task(self, workflow_id, user_id, data):
     """
@@ -34,22 +51,11 @@ def workflow1_task(self, workflow_id, user_id, data):
             total_steps=4
         )
         
-        # Progress callback
-        def update_progress(step, status, progress_percent=None):
-            workflow_service.update_progress(
-                workflow_id, 
-                progress_percent or (step * 25), 
-                step
-            )
-            # Update Celery task state
-            self.update_state(
-                state='PROGRESS',
-                meta={
-                    'current_step': step,
-                    'total_steps': 4,
-                    'progress': progress_percent or (step * 25)
-                }
-            )
+        progress_store.start(workflow_id, total_steps=4)
+
+        # Progress callback (Redis, flushed to MySQL at most every PROGRESS_DB_FLUSH_INTERVAL)
+        def update_progress(step, status, progress_percent=None, data=None):
+            progress_store.update(workflow_id, step, status, progress_percent or (step * 25), data)
         
         # Execute workflow
         start_time = time.time()
@@ -59,29 +65,24 @@ def workflow1_task(self, workflow_id, user_id, data):
         # Save to MinIO
         if result.get('status') == 'success' and 'article' in result:
             article = result['article']
-            workflow_service.save_to_minio(workflow_id, 'article_main.html', article.get('html_content', ''), compress=True)
-            
-            import json
-            metadata = {
-                'seo_title': article.get('seo_title', ''),
-                'meta_description': article.get('meta_description', ''),
-                'wordpress_excerpt': article.get('wordpress_excerpt', ''),
-                'image_url': article.get('image_url', ''),
-                'faq_json': article.get('faq_json', []),
-                'secondary_keywords': article.get('secondary_keywords', []),
-                'word_count': article.get('word_count', 0)
-            }
-            workflow_service.save_to_minio(workflow_id, 'metadata.json', json.dumps(metadata, ensure_ascii=False), compress=True)
+            metadata = article_metadata(article)
+            workflow_service.save_artifacts(workflow_id, {
+                'article_main.html': article.get('html_content', ''),
+                'metadata.json': json.dumps(metadata, ensure_ascii=False)
+            }, compress=True)
             
             workflow_service.complete_workflow(workflow_id, result, generation_time)
+            progress_store.complete(workflow_id, {'article': {'word_count': metadata['word_count']}})
             return {'status': 'success', 'workflow_id': workflow_id, 'result': result}
         else:
             workflow_service.fail_workflow(workflow_id, result.get('error', 'Unknown error'))
+            progress_store.fail(workflow_id, result.get('error', 'Unknown error'))
             return {'status': 'error', 'workflow_id': workflow_id, 'error': result.get('error')}
             
     except Exception as e:
         logger.error(f"Workflow1 task failed: {str(e)}", exc_info=True)
         workflow_service.fail_workflow(workflow_id, str(e))
+        progress_store.fail(workflow_id, str(e))
         raise
 
 
@@ -101,16 +102,10 @@ def workflow2_task(self, workflow_id, user_id, data):
             total_steps=3
         )
         
-        def update_progress(step, status, progress_percent=None):
-            workflow_service.update_progress(workflow_id, progress_percent or (step * 33), step)
-            self.update_state(
-                state='PROGRESS',
-                meta={
-                    'current_step': step,
-                    'total_steps': 3,
-                    'progress': progress_percent or (step * 33)
-                }
-            )
+        progress_store.start(workflow_id, total_steps=3)
+
+        def update_progress(step, status, progress_percent=None, data=None):
+            progress_store.update(workflow_id, step, status, progress_percent or (step * 33), data)
         
         start_time = time.time()
         result = workflow_manager_2.execute_workflow2_sync(data, progress_callback=update_progress)
@@ -118,29 +113,24 @@ def workflow2_task(self, workflow_id, user_id, data):
         
         if result.get('status') == 'success' and 'article' in result:
             article = result['article']
-            workflow_service.save_to_minio(workflow_id, 'article_main.html', article.get('html_content', ''), compress=True)
-            
-            import json
-            metadata = {
-                'seo_title': article.get('seo_title', ''),
-                'meta_description': article.get('meta_description', ''),
-                'wordpress_excerpt': article.get('wordpress_excerpt', ''),
-                'image_url': article.get('image_url', ''),
-                'faq_json': article.get('faq_json', []),
-                'secondary_keywords': article.get('secondary_keywords', []),
-                'word_count': article.get('word_count', 0)
-            }
-            workflow_service.save_to_minio(workflow_id, 'metadata.json', json.dumps(metadata, ensure_ascii=False), compress=True)
+            metadata = article_metadata(article)
+            workflow_service.save_artifacts(workflow_id, {
+                'article_main.html': article.get('html_content', ''),
+                'metadata.json': json.dumps(metadata, ensure_ascii=False)
+            }, compress=True)
             
             workflow_service.complete_workflow(workflow_id, result, generation_time)
+            progress_store.complete(workflow_id, {'article': {'word_count': metadata['word_count']}})
             return {'status': 'success', 'workflow_id': workflow_id, 'result': result}
         else:
             workflow_service.fail_workflow(workflow_id, result.get('error', 'Unknown error'))
+            progress_store.fail(workflow_id, result.get('error', 'Unknown error'))
             return {'status': 'error', 'workflow_id': workflow_id, 'error': result.get('error')}
             
     except Exception as e:
         logger.error(f"Workflow2 task failed: {str(e)}", exc_info=True)
         workflow_service.fail_workflow(workflow_id, str(e))
+        progress_store.fail(workflow_id, str(e))
         raise
 
 
@@ -160,64 +150,44 @@ def workflow3_task(self, workflow_id, user_id, data):
             total_steps=4
         )
         
-        def update_progress(step, status, progress_percent=None):
-            workflow_service.update_progress(workflow_id, progress_percent or (step * 25), step)
-            self.update_state(
-                state='PROGRESS',
-                meta={
-                    'current_step': step,
-                    'total_steps': 4,
-                    'progress': progress_percent or (step * 25)
-                }
-            )
+        progress_store.start(workflow_id, total_steps=4)
+
+        def update_progress(step, status, progress_percent=None, data=None):
+            progress_store.update(workflow_id, step, status, progress_percent or (step * 25), data)
         
         start_time = time.time()
         result = workflow_manager_3.execute_workflow3_sync(data, progress_callback=update_progress)
         generation_time = int(time.time() - start_time)
         
         if result.get('status') == 'success' and 'cluster' in result:
-            import json
+            artifacts = {}
             
             # Save pillar
             if 'pillar' in result['cluster']:
                 pillar = result['cluster']['pillar']
-                workflow_service.save_to_minio(workflow_id, 'pillar.html', pillar.get('html_content', ''), compress=True)
-                workflow_service.save_to_minio(workflow_id, 'article_main.html', pillar.get('html_content', ''), compress=True)
-                
-                pillar_metadata = {
-                    'seo_title': pillar.get('seo_title', ''),
-                    'meta_description': pillar.get('meta_description', ''),
-                    'wordpress_excerpt': pillar.get('wordpress_excerpt', ''),
-                    'image_url': pillar.get('image_url', ''),
-                    'faq_json': pillar.get('faq_json', []),
-                    'secondary_keywords': pillar.get('secondary_keywords', []),
-                    'word_count': pillar.get('word_count', 0)
-                }
-                workflow_service.save_to_minio(workflow_id, 'pillar_metadata.json', json.dumps(pillar_metadata, ensure_ascii=False), compress=True)
+                artifacts['pillar.html'] = pillar.get('html_content', '')
+                artifacts['article_main.html'] = pillar.get('html_content', '')  # Same content: stored once
+                artifacts['pillar_metadata.json'] = json.dumps(article_metadata(pillar), ensure_ascii=False)
             
             # Save satellites
             if 'satellites' in result['cluster']:
                 for i, satellite in enumerate(result['cluster']['satellites'], 1):
-                    workflow_service.save_to_minio(workflow_id, f'satellite_{i}.html', satellite.get('html_content', ''), compress=True)
-                    
-                    sat_metadata = {
-                        'seo_title': satellite.get('seo_title', ''),
-                        'meta_description': satellite.get('meta_description', ''),
-                        'wordpress_excerpt': satellite.get('wordpress_excerpt', ''),
-                        'image_url': satellite.get('image_url', ''),
-                        'faq_json': satellite.get('faq_json', []),
-                        'secondary_keywords': satellite.get('secondary_keywords', []),
-                        'word_count': satellite.get('word_count', 0)
-                    }
-                    workflow_service.save_to_minio(workflow_id, f'satellite_{i}_metadata.json', json.dumps(sat_metadata, ensure_ascii=False), compress=True)
+                    artifacts[f'satellite_{i}.html'] = satellite.get('html_content', '')
+                    artifacts[f'satellite_{i}_metadata.json'] = json.dumps(article_metadata(satellite), ensure_ascii=False)
+            
+            # Upload the whole cluster at once (parallel gzip + uploads, one stats update)
+            workflow_service.save_artifacts(workflow_id, artifacts, compress=True)
             
             workflow_service.complete_workflow(workflow_id, result, generation_time)
+            progress_store.complete(workflow_id, {'article': {'word_count': result['cluster'].get('pillar', {}).get('word_count', 0)}})
             return {'status': 'success', 'workflow_id': workflow_id, 'result': result}
         else:
             workflow_service.fail_workflow(workflow_id, result.get('error', 'Unknown error'))
+            progress_store.fail(workflow_id, result.get('error', 'Unknown error'))
             return {'status': 'error', 'workflow_id': workflow_id, 'error': result.get('error')}
             
     except Exception as e:
         logger.error(f"Workflow3 task failed: {str(e)}", exc_info=True)
         workflow_service.fail_workflow(workflow_id, str(e))
+        progress_store.fail(workflow_id, str(e))
         raise
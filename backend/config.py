@@ -34,6 +34,15 @@ class Config:
         f"{DB_HOST}:{DB_PORT}/{DB_NAME}"
     )
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Pool de connexions MySQL (par process)
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))  # Connexions gardées ouvertes
+    DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', 5))  # Connexions supplémentaires en pic
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 1800))  # Renouvellement (secondes, < wait_timeout MySQL)
+    DB_POOL_TIMEOUT = int(os.getenv('DB_POOL_TIMEOUT', 30))  # Attente max d'une connexion libre (secondes)
+
+    # Redis (broker Celery, caches)
+    REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
     
     # APIs LLM
     OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
@@ -52,7 +61,55 @@ class Config:
     MAX_ARTICLE_LENGTH = int(os.getenv('MAX_ARTICLE_LENGTH', 5000))
     TIMEOUT_SECONDS = int(os.getenv('TIMEOUT_SECONDS', 300))
     MAX_RETRIES = int(os.getenv('MAX_RETRIES', 3))
-    
+
+    # LLM
+    LLM_MAX_CONCURRENCY = int(os.getenv('LLM_MAX_CONCURRENCY', 4))  # Appels Claude simultanés par worker
+    LLM_PROMPT_CACHE = os.getenv('LLM_PROMPT_CACHE', 'True') == 'True'  # Cache de prompt Anthropic sur les consignes des templates
+    SATELLITE_MAX_CONCURRENCY = int(os.getenv('SATELLITE_MAX_CONCURRENCY', 3))  # Satellites générés en parallèle
+
+    # Images
+    IMAGE_MAX_CONCURRENCY = int(os.getenv('IMAGE_MAX_CONCURRENCY', 4))  # Requêtes Ideogram simultanées par worker
+
+    # Scraping
+    SCRAPER_MAX_CONCURRENCY = int(os.getenv('SCRAPER_MAX_CONCURRENCY', 6))  # Pages téléchargées en parallèle
+    SCRAPER_PER_HOST_LIMIT = int(os.getenv('SCRAPER_PER_HOST_LIMIT', 2))  # Connexions simultanées par hôte
+    SCRAPER_DEADLINE_SECONDS = int(os.getenv('SCRAPER_DEADLINE_SECONDS', 45))  # Durée max de l'étape de scraping
+    FETCH_MAX_CONNECTIONS = int(os.getenv('FETCH_MAX_CONNECTIONS', 50))  # Taille du pool HTTP partagé par worker
+    FETCH_DNS_CACHE_TTL = int(os.getenv('FETCH_DNS_CACHE_TTL', 300))  # Cache DNS (secondes)
+    FETCH_KEEPALIVE_TIMEOUT = int(os.getenv('FETCH_KEEPALIVE_TIMEOUT', 30))  # Connexions keep-alive (secondes)
+    FETCH_MAX_BYTES = int(os.getenv('FETCH_MAX_BYTES', 5 * 1024 * 1024))  # Taille max lue par page (octets)
+
+    # Parsing HTML
+    PARSER_POOL = os.getenv('PARSER_POOL', 'thread')  # thread, process (isolation mémoire) ou inline
+    PARSER_MAX_WORKERS = int(os.getenv('PARSER_MAX_WORKERS', 2))  # Process/threads de parsing par worker
+
+    # Cache de scraping
+    SCRAPE_CACHE_BACKEND = os.getenv('SCRAPE_CACHE_BACKEND', 'disk')  # disk, redis ou none
+    SCRAPE_CACHE_DIR = os.getenv('SCRAPE_CACHE_DIR', 'temp/scrape_cache')
+    SCRAPE_CACHE_TTL = int(os.getenv('SCRAPE_CACHE_TTL', 3600))  # Servi sans revalidation (secondes)
+    SCRAPE_CACHE_MAX_AGE = int(os.getenv('SCRAPE_CACHE_MAX_AGE', 7 * 24 * 3600))  # Conservé pour revalidation (secondes)
+    SCRAPE_CACHE_MAX_ENTRIES = int(os.getenv('SCRAPE_CACHE_MAX_ENTRIES', 5000))  # Cache disque : au-delà, éviction LRU
+
+    # Cache des analyses de site (workflow 1, étape 2)
+    SITE_ANALYSIS_CACHE_BACKEND = os.getenv('SITE_ANALYSIS_CACHE_BACKEND', 'disk')  # disk, redis ou none
+    SITE_ANALYSIS_CACHE_DIR = os.getenv('SITE_ANALYSIS_CACHE_DIR', 'temp/site_analysis_cache')
+    SITE_ANALYSIS_CACHE_TTL = int(os.getenv('SITE_ANALYSIS_CACHE_TTL', 7 * 24 * 3600))  # Fraîcheur d'une analyse (secondes)
+
+    # Cache des réponses LLM (requêtes identiques)
+    LLM_CACHE_BACKEND = os.getenv('LLM_CACHE_BACKEND', 'none')  # none (défaut), disk ou redis
+    LLM_CACHE_DIR = os.getenv('LLM_CACHE_DIR', 'temp/llm_cache')
+    LLM_CACHE_TTL = int(os.getenv('LLM_CACHE_TTL', 24 * 3600))  # Durée de validité d'une réponse (secondes)
+    LLM_CACHE_MAX_ENTRIES = int(os.getenv('LLM_CACHE_MAX_ENTRIES', 500))  # Au-delà, éviction LRU
+
+    # Progression des workflows
+    PROGRESS_TTL = int(os.getenv('PROGRESS_TTL', 24 * 3600))  # Conservation dans Redis (secondes)
+    PROGRESS_DB_FLUSH_INTERVAL = int(os.getenv('PROGRESS_DB_FLUSH_INTERVAL', 15))  # Écriture MySQL max (secondes)
+    PROGRESS_STREAM_HEARTBEAT = int(os.getenv('PROGRESS_STREAM_HEARTBEAT', 15))  # Commentaire SSE si inactif (secondes)
+    PROGRESS_STREAM_MAX_DURATION = int(os.getenv('PROGRESS_STREAM_MAX_DURATION', 600))  # Reconnexion du navigateur ensuite (secondes)
+
+    # Templates de prompts
+    TEMPLATE_CACHE_CHECK_INTERVAL = int(os.getenv('TEMPLATE_CACHE_CHECK_INTERVAL', 30))  # Vérification des versions actives (secondes)
+
     # Logging
     LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
     LOG_FILE_PATH = os.getenv('LOG_FILE_PATH', 'logs/app.log')
@@ -0,0 +1,34 @@
+"""
+Base de données - Engine SQLAlchemy et sessions partagés par tout le process
+Fichier: backend/database.py
+
+Un seul pool MySQL par process (API, admin, workflows, templates) :
+au plus DB_POOL_SIZE + DB_MAX_OVERFLOW connexions par worker Gunicorn
+ou process Celery.
+
+Toujours importer via `backend.database` pour ne créer qu'un engine.
+"""
+import os
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from backend.config import Config
+
+engine = create_engine(
+    Config.SQLALCHEMY_DATABASE_URI,
+    pool_size=Config.DB_POOL_SIZE,
+    max_overflow=Config.DB_MAX_OVERFLOW,
+    pool_recycle=Config.DB_POOL_RECYCLE,
+    pool_timeout=Config.DB_POOL_TIMEOUT,
+    pool_pre_ping=True,
+    connect_args={'charset': 'utf8mb4'}
+)
+
+# Registre de sessions (une session par thread), libéré en fin de requête Flask
+Session = scoped_session(sessionmaker(bind=engine))
+
+# Après un fork (enfants Celery prefork, workers Gunicorn avec --preload),
+# repartir d'un pool vide sans fermer les sockets du process parent
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=lambda: engine.dispose(close=False))
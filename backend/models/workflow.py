@@ -33,6 +33,7 @@ class Workflow(Base):
     minio_path = Column(String(500))
     total_size_bytes = Column(Integer)
     files_count = Column(SmallInteger, default=0)
+    manifest = Column(JSON)
     compressed = Column(Boolean, default=True)
     
     generation_time_seconds = Column(Integer)
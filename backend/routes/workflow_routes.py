@@ -2,15 +2,22 @@
 Routes API pour la gestion des workflows
 Fichier: backend/routes/workflow_routes.py
 """
-from flask import Blueprint, jsonify, request, g
+from flask import Blueprint, Response, jsonify, request, g
+from minio.error import S3Error
 from backend.middleware.auth_middleware import token_required
 from backend.services.workflow_service import WorkflowService
+import json
 import logging
+import zipfile
+import zlib
 
 logger = logging.getLogger(__name__)
 workflow_bp = Blueprint('workflow', __name__)
 workflow_service = WorkflowService()
 
+FILE_MAX_AGE = 300  # Cache navigateur des fichiers servis (secondes)
+STREAM_CHUNK_SIZE = 64 * 1024
+
 @workflow_bp.route('/workflows', methods=['GET'])
 @token_required
 def get_user_workflows():
@@ -68,24 +75,168 @@ def get_workflow_files(workflow_id):
         logger.error(f"Erreur listage fichiers: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
-@workflow_bp.route('/workflows/<workflow_id>/download', methods=['GET'])
+@workflow_bp.route('/workflows/<workflow_id>/bundle', methods=['GET'])
 @token_required
-def download_workflow_file(workflow_id):
-    """Télécharger un fichier d'un workflow depuis MinIO"""
+def get_workflow_bundle(workflow_id):
+    """
+    Tous les articles d'un workflow et leurs métadonnées en une réponse
+
+    JSON par défaut ; ?format=zip renvoie une archive ZIP produite en flux.
+    """
     try:
-        filename = request.args.get('filename', 'article_main.html.gz')
+        bundle = workflow_service.get_workflow_bundle(workflow_id, g.user_id)
         
-        result = workflow_service.get_file_from_minio(workflow_id, filename, g.user_id)
+        if not bundle['success']:
+            return jsonify(bundle), 404
         
-        if not result['success']:
-            return jsonify(result), 404
+        if request.args.get('format') == 'zip':
+            response = Response(_zip_articles(bundle['articles']), mimetype='application/zip')
+            response.headers['Content-Disposition'] = f'attachment; filename="{workflow_id}.zip"'
+            return response
         
         return jsonify({
             'success': True,
-            'content': result['content'],
-            'filename': filename
+            'articles': bundle['articles'],
+            'workflow_type': bundle['workflow_type']
         }), 200
         
     except Exception as e:
-        logger.error(f"Erreur téléchargement fichier: {e}")
+        logger.error(f"Erreur bundle workflow {workflow_id}: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
+
+@workflow_bp.route('/workflows/<workflow_id>/download', methods=['GET'])
+@token_required
+def download_workflow_file(workflow_id):
+    """
+    Télécharger un fichier d'un workflow (?filename=...)
+
+    Ancienne route, servie comme /workflows/<id>/files/<filename> : fichier
+    transmis tel que stocké, sans décompression ni enveloppe JSON.
+    """
+    filename = request.args.get('filename', 'article_main.html.gz')
+    return get_workflow_file(workflow_id, filename)
+
+
+@workflow_bp.route('/workflows/<workflow_id>/files/<path:filename>', methods=['GET'])
+@token_required
+def get_workflow_file(workflow_id, filename):
+    """
+    Servir un fichier tel que stocké dans MinIO, sans décompression côté Flask
+
+    Les .gz sont transmis en flux avec Content-Encoding: gzip (le navigateur
+    les décode). ?presigned=1 renvoie à la place une URL MinIO signée et
+    temporaire, après la même vérification du propriétaire.
+    """
+    try:
+        located = workflow_service.locate_file(workflow_id, filename, g.user_id)
+        
+        if not located['success']:
+            return jsonify(located), 404
+        
+        if request.args.get('presigned', 0, type=int):
+            return jsonify({
+                'success': True,
+                'url': workflow_service.presigned_file_url(located['object_name'], filename),
+                'expires_in': workflow_service.presigned_expiry
+            }), 200
+        
+        # Fichier du manifest : ETag = hash du contenu, revalidation sans appel MinIO
+        etag = located['sha256']
+        if etag and request.if_none_match.contains(etag):
+            return _not_modified(etag)
+        
+        try:
+            stored = workflow_service.open_file(located['object_name'])
+        except S3Error as e:
+            logger.error(f"Fichier introuvable dans MinIO: {e}")
+            return jsonify({'success': False, 'error': 'Fichier non trouvé'}), 404
+        
+        etag = etag or stored.headers.get('ETag', '').strip('"')
+        if request.if_none_match.contains(etag):
+            _release(stored)
+            return _not_modified(etag)
+        
+        compressed = filename.endswith('.gz')
+        body = _stream_object(stored)
+        if compressed and 'gzip' not in request.accept_encodings:
+            body = _gunzip(body)  # Client sans gzip (rare) : décompression en flux
+        
+        response = Response(body, content_type=workflow_service.file_content_type(filename[:-3] if compressed else filename))
+        if compressed and 'gzip' in request.accept_encodings:
+            response.headers['Content-Encoding'] = 'gzip'
+            if stored.headers.get('Content-Length'):
+                response.headers['Content-Length'] = stored.headers['Content-Length']
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.set_etag(etag)
+        response.cache_control.private = True
+        response.cache_control.max_age = FILE_MAX_AGE
+        return response
+        
+    except Exception as e:
+        logger.error(f"Erreur lecture fichier: {e}")
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
+def _not_modified(etag):
+    """Réponse 304 pour un fichier déjà en cache chez le client"""
+    response = Response(status=304)
+    response.set_etag(etag)
+    response.cache_control.private = True
+    response.cache_control.max_age = FILE_MAX_AGE
+    return response
+
+
+def _stream_object(stored):
+    """Lire un objet MinIO par blocs, puis rendre la connexion au pool"""
+    try:
+        yield from stored.stream(STREAM_CHUNK_SIZE)
+    finally:
+        _release(stored)
+
+
+def _release(stored):
+    stored.close()
+    stored.release_conn()
+
+
+def _gunzip(chunks):
+    """Décompresser un flux gzip bloc par bloc"""
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        yield decompressor.decompress(chunk)
+    yield decompressor.flush()
+
+
+class _ZipStream:
+    """Sortie non seekable pour zipfile : les octets écrits sont envoyés au fil de l'eau"""
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def _zip_articles(articles):
+    """Archive ZIP des articles (HTML) et de leurs métadonnées (JSON), produite article par article"""
+    stream = _ZipStream()
+    with zipfile.ZipFile(stream, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for article in articles:
+            name = article['filename'][:-3] if article['filename'].endswith('.gz') else article['filename']
+            archive.writestr(name, article['content'])
+            if article['metadata'] is not None:
+                archive.writestr(
+                    name.replace('.html', '_metadata.json'),
+                    json.dumps(article['metadata'], ensure_ascii=False, indent=2)
+                )
+            yield stream.drain()
+    yield stream.drain()
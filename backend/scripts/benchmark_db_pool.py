@@ -0,0 +1,90 @@
+"""
+Benchmark : coût DB d'un job de cluster, connexions directes vs pool
+Fichier: backend/scripts/benchmark_db_pool.py
+
+Rejoue la séquence d'accès MySQL d'un workflow 3 (création, progression,
+sauvegarde des fichiers, fin) en requêtes de lecture seule, une fois avec
+pymysql.connect par appel (ancien WorkflowService) et une fois avec le pool.
+
+Usage:
+    python backend/scripts/benchmark_db_pool.py [--jobs 10]
+
+Mesure (--jobs 50, 3 passages, loopback, PyMySQL 2.2.8) contre un serveur
+parlant le protocole MySQL (mysql_mimic, Python) faute d'instance MySQL :
+    pymysql.connect   240 ms/job (17,2 ms/appel)
+    pool               11 ms/job (0,8 ms/appel)   x21
+Le coût de connexion de ce serveur n'est pas celui de MySQL (handshake en
+Python) : refaire la mesure sur une instance MySQL jetable pour des chiffres
+de production.
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Ajouter le répertoire parent (et la racine du projet) au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import pymysql
+
+from backend.config import Config
+from services.db_pool import get_db_pool
+
+# Appels WorkflowService d'un job de cluster : create_workflow, 4 update_progress,
+# 8 save_to_minio (1 connexion chacun), complete_workflow
+CALLS_PER_JOB = 1 + 4 + 8 + 1
+QUERY = "SELECT minio_path FROM workflows WHERE workflow_id = %s"
+
+
+def direct_connection():
+    """Ancien comportement : une connexion MySQL neuve par appel"""
+    return pymysql.connect(
+        host=Config.DB_HOST,
+        port=Config.DB_PORT,
+        user=Config.DB_USER,
+        password=Config.DB_PASSWORD,
+        database=Config.DB_NAME,
+        charset='utf8mb4',
+        cursorclass=pymysql.cursors.DictCursor
+    )
+
+
+def run_job(get_connection) -> None:
+    """Un job = CALLS_PER_JOB emprunts de connexion avec une requête chacun"""
+    for _ in range(CALLS_PER_JOB):
+        conn = get_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(QUERY, ('benchmark',))
+                cursor.fetchone()
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def measure(label: str, get_connection, jobs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(jobs):
+        run_job(get_connection)
+    per_job = (time.perf_counter() - start) / jobs
+    print(f"   {label:<20} {per_job * 1000:8.1f} ms/job | {per_job / CALLS_PER_JOB * 1000:6.2f} ms/appel")
+    return per_job
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du pool MySQL")
+    parser.add_argument('--jobs', type=int, default=10, help='Nombre de jobs simulés')
+    args = parser.parse_args()
+
+    db_pool = get_db_pool()
+
+    print(f"⏱️  Coût DB d'un job de cluster ({CALLS_PER_JOB} appels WorkflowService)")
+    direct = measure('pymysql.connect', direct_connection, args.jobs)
+    pooled = measure('pool', db_pool.connection, args.jobs)
+    print(f"   Gain : x{direct / pooled:.1f} — {db_pool.status()}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,154 @@
+"""
+Benchmark : extraction HTML lxml (utils/html_extractor) vs ancien parcours BeautifulSoup
+Fichier: backend/scripts/benchmark_html_extractor.py
+
+Usage:
+    python backend/scripts/benchmark_html_extractor.py [--size-mb 2] [--runs 5] [page.html ...]
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+from urllib.parse import urljoin
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bs4 import BeautifulSoup
+
+from utils.html_extractor import extract_page, PAGE_SKIP_TAGS, ARTICLE_SKIP_TAGS
+
+WORDS = ('isolation', 'thermique', 'maison', 'rénovation', 'énergie', 'chauffage',
+         'prix', 'devis', 'artisan', 'aide', 'travaux', 'confort', 'économie')
+
+
+def build_page(size_mb: float, seed: int = 42) -> str:
+    """Générer une page HTML synthétique d'environ size_mb Mo"""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+
+    def sentence(n):
+        return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+    parts = [
+        '<!DOCTYPE html><html><head><title>Page de test</title>',
+        '<meta name="description" content="Description de test">',
+        '<style>body { font-family: sans-serif; }</style>',
+        '<script>var tracking = {"id": 42};</script></head><body>',
+        '<header><nav><ul>' + ''.join(f'<li><a href="/p{i}">{sentence(2)}</a></li>' for i in range(30)) + '</ul></nav></header>',
+        '<div class="page-content"><article><h1>Titre principal</h1>'
+    ]
+    size = sum(len(p) for p in parts)
+    i = 0
+
+    while size < target:
+        block = (
+            f'<h2>{sentence(4)}</h2><p>{sentence(60)} <strong>{sentence(3)}</strong> {sentence(40)}</p>'
+            f'<h3>{sentence(3)}</h3><ul><li>{sentence(8)}</li><li>{sentence(8)}</li></ul>'
+            f'<img src="/images/{i}.jpg" alt="{sentence(2)}"><!-- commentaire {i} -->'
+            f'<aside>{sentence(10)}</aside><p>{sentence(50)}</p>'
+        )
+        parts.append(block)
+        size += len(block)
+        i += 1
+
+    parts.append('</article></div><footer>' + sentence(30) + '</footer></body></html>')
+    return ''.join(parts)
+
+
+def legacy_page(html: str, url: str) -> dict:
+    """Ancien parcours de WebsiteScraper._scrape_single_page"""
+    soup = BeautifulSoup(html, 'html.parser')
+    for script in soup(list(PAGE_SKIP_TAGS)):
+        script.decompose()
+
+    title = soup.find('title')
+    meta_description = soup.find('meta', attrs={'name': 'description'})
+    text_content = ' '.join(soup.get_text().split())
+    images = [
+        {'src': urljoin(url, img.get('src')), 'alt': img.get('alt', '')}
+        for img in soup.find_all('img') if img.get('src')
+    ]
+
+    return {
+        'title': title.get_text().strip() if title else '',
+        'meta_description': meta_description.get('content', '') if meta_description else '',
+        'headings': {tag: [h.get_text().strip() for h in soup.find_all(tag)] for tag in ('h1', 'h2', 'h3')},
+        'text': text_content,
+        'images': images
+    }
+
+
+def legacy_article(html: str) -> dict:
+    """Ancien parcours de ArticleScraper._scrape_article_from_url"""
+    soup = BeautifulSoup(html, 'html.parser')
+    for element in soup(list(ARTICLE_SKIP_TAGS)):
+        element.decompose()
+
+    content_soup = (
+        soup.find('article') or
+        soup.find('main') or
+        soup.find('div', class_=lambda c: c and ('content' in c.lower() or 'article' in c.lower())) or
+        soup.find('div', id=lambda i: i and ('content' in i.lower() or 'article' in i.lower())) or
+        soup.find('body') or soup
+    )
+    h1 = content_soup.find('h1')
+
+    return {
+        'h1': h1.get_text().strip() if h1 else None,
+        'text': ' '.join(content_soup.get_text().split()),
+        'html': str(content_soup)
+    }
+
+
+def timed(func, runs: int) -> float:
+    """Durée moyenne (secondes) d'un appel"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def benchmark(name: str, html: str, runs: int):
+    url = 'https://example.com/page'
+    print(f"📄 {name} ({len(html) / 1024 / 1024:.2f} Mo)")
+
+    # Mode page (WebsiteScraper)
+    old = legacy_page(html, url)
+    new = extract_page(html, base_url=url, skip_tags=PAGE_SKIP_TAGS)
+    same = all(old[key] == new[key] for key in old)
+    t_old = timed(lambda: legacy_page(html, url), runs)
+    t_new = timed(lambda: extract_page(html, base_url=url, skip_tags=PAGE_SKIP_TAGS), runs)
+    print(f"   page    : bs4 {t_old * 1000:8.1f} ms | lxml {t_new * 1000:8.1f} ms | x{t_old / t_new:5.1f} | résultats identiques: {same}")
+
+    # Mode article (ArticleScraper / ClusterAnalyzer)
+    old = legacy_article(html)
+    new = extract_page(html, base_url=url, skip_tags=ARTICLE_SKIP_TAGS, main_content=True)['main']
+    same = old['h1'] == new['h1'] and old['text'] == new['text']
+    t_old = timed(lambda: legacy_article(html), runs)
+    t_new = timed(lambda: extract_page(html, base_url=url, skip_tags=ARTICLE_SKIP_TAGS, main_content=True), runs)
+    print(f"   article : bs4 {t_old * 1000:8.1f} ms | lxml {t_new * 1000:8.1f} ms | x{t_old / t_new:5.1f} | texte identique: {same}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'extraction HTML")
+    parser.add_argument('files', nargs='*', help='Pages HTML à mesurer (sinon pages synthétiques)')
+    parser.add_argument('--size-mb', type=float, action='append', help='Taille des pages synthétiques (répétable)')
+    parser.add_argument('--runs', type=int, default=5, help='Nombre de répétitions')
+    args = parser.parse_args()
+
+    print("⏱️  Benchmark extraction HTML : BeautifulSoup(html.parser) vs lxml en un seul parcours")
+    print()
+
+    if args.files:
+        for path in args.files:
+            benchmark(path, Path(path).read_text(encoding='utf-8', errors='replace'), args.runs)
+    else:
+        for size_mb in args.size_mb or [0.1, 1, 5]:
+            benchmark(f"Page synthétique {size_mb} Mo", build_page(size_mb), args.runs)
+
+
+if __name__ == '__main__':
+    main()
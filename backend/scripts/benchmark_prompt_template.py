@@ -0,0 +1,83 @@
+"""
+Benchmark : rendu des prompts, str.replace par variable vs template compilé
+Fichier: backend/scripts/benchmark_prompt_template.py
+
+Usage:
+    python backend/scripts/benchmark_prompt_template.py [--runs 2000] [template.txt]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.prompt_template import PromptTemplate, compile_template
+
+DEFAULT_TEMPLATE = Path(__file__).parent.parent / 'workflows' / 'workflow_1' / 'templates' / 'article_prompt_template.txt'
+
+# Valeurs réalistes (listes formatées, liens, stratégie...) pour le workflow 1
+VARIABLES = {
+    'DOMAIN': 'Rénovation énergétique',
+    'KEYWORD': 'isolation thermique maison',
+    'GUIDELINE': "Article complet pour propriétaires, ton rassurant, chiffres 2025",
+    'SITE_URL': 'https://example.com',
+    'CONTENT_TONE': 'Professionnel et pédagogique',
+    'TARGET_AUDIENCE': 'Propriétaires de maisons individuelles',
+    'MAIN_TOPICS': 'isolation, chauffage, aides, artisans, diagnostic',
+    'SEO_OPPORTUNITIES': '\n'.join(f"- Opportunité SEO {i} sur l'isolation des combles" for i in range(10)),
+    'CONTENT_GAPS': '\n'.join(f"- Lacune {i} : comparatif des isolants biosourcés" for i in range(10)),
+    'CONTENT_STRATEGY': 'Développer un contenu approfondi et structuré ' * 10,
+    'KEYWORD_OPPORTUNITIES': ', '.join(f'isolation mot-clé {i}' for i in range(10)),
+    'INTERNAL_LINKS': '\n'.join(f'- https://example.com/guide-{i}' for i in range(10)),
+    'EXTERNAL_REFS': '\n'.join(f'- source{i}.fr: Étude ADEME {i}' for i in range(10)),
+    'CURRENT_DATE': '2025-01-10'
+}
+
+
+def render_replace(template: str, variables: dict) -> str:
+    """Ancien rendu : une copie complète du prompt par variable"""
+    prompt = template
+    for key, value in variables.items():
+        prompt = prompt.replace(f'{{{key}}}', str(value))
+    return prompt
+
+
+def timed(func, runs: int) -> float:
+    """Durée moyenne (secondes) d'un appel"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du rendu des templates de prompts")
+    parser.add_argument('template', nargs='?', default=str(DEFAULT_TEMPLATE), help='Fichier template')
+    parser.add_argument('--runs', type=int, default=2000, help='Nombre de rendus')
+    args = parser.parse_args()
+
+    template = Path(args.template).read_text(encoding='utf-8')
+    compiled = compile_template(template)
+
+    print(f"⏱️  Rendu de prompt : {len(template)} caractères, {len(compiled.names)} emplacements, {len(VARIABLES)} variables")
+
+    same = render_replace(template, VARIABLES) == compiled.render(VARIABLES)
+    t_replace = timed(lambda: render_replace(template, VARIABLES), args.runs)
+    t_compile = timed(lambda: PromptTemplate(template), args.runs)
+    t_render = timed(lambda: compiled.render(VARIABLES), args.runs)
+
+    print(f"   str.replace x{len(VARIABLES):<9} {t_replace * 1e6:8.1f} µs")
+    print(f"   compilation (une fois) {t_compile * 1e6:8.1f} µs")
+    print(f"   rendu compilé          {t_render * 1e6:8.1f} µs | x{t_replace / t_render:.1f} | résultat identique: {same}")
+
+    # Une valeur contenant {...} n'est pas substituée une seconde fois
+    injected = dict(VARIABLES, DOMAIN='Texte utilisateur avec {KEYWORD}')
+    print(f"   str.replace : {render_replace('{DOMAIN}', injected)!r}")
+    print(f"   compilé     : {compile_template('{DOMAIN}').render(injected)!r}")
+
+
+if __name__ == '__main__':
+    main()
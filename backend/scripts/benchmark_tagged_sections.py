@@ -0,0 +1,91 @@
+"""
+Benchmark : lecture des sections <TAG>...</TAG> des réponses LLM
+Ancien parcours (deux find() par balise) vs utils/tagged_sections en un seul parcours
+(équivalence et cas tronqués / en morceaux : backend/tests/test_tagged_sections.py)
+Fichier: backend/scripts/benchmark_tagged_sections.py
+
+Usage:
+    python backend/scripts/benchmark_tagged_sections.py [--size-kb 60] [--runs 200]
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+# Ajouter le répertoire parent au path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.tagged_sections import parse_sections
+
+# Sections du workflow 1 (ArticleGenerator.SECTIONS), dans l'ordre du template
+TAGS = ['SEO_TITLE', 'META_DESCRIPTION', 'WORDPRESS_EXCERPT', 'HTML_CONTENT', 'FAQ_SECTION', 'FAQ_JSON',
+        'SECONDARY_KEYWORDS', 'ENTITIES', 'INTERNAL_LINKS_USED', 'SCHEMA_MARKUP', 'READABILITY_SCORE']
+
+WORDS = ('isolation', 'thermique', 'maison', 'rénovation', 'énergie', 'chauffage',
+         'prix', 'devis', 'artisan', 'aide', 'travaux', 'confort', 'économie')
+
+
+def build_response(size_kb: float, rng: random.Random) -> tuple:
+    """Générer une réponse balisée d'environ size_kb Ko (le HTML occupe presque tout)"""
+    def sentence(n):
+        return ' '.join(rng.choice(WORDS) for _ in range(n))
+
+    html = []
+    size = 0
+    while size < size_kb * 1024:
+        block = f'<h2>{sentence(5)}</h2>\n<p>{sentence(80)} <strong>{sentence(3)}</strong> {sentence(40)} < 5 % </p>\n'
+        html.append(block)
+        size += len(block)
+
+    expected = {tag: sentence(rng.randint(3, 30)) for tag in TAGS}
+    expected['HTML_CONTENT'] = ''.join(html).strip()
+    expected['FAQ_JSON'] = '[{"question": "%s ?", "answer": "%s"}]' % (sentence(6), sentence(20))
+
+    text = 'Voici l\'article demandé.\n\n' + '\n\n'.join(f'<{tag}>\n{expected[tag]}\n</{tag}>' for tag in TAGS)
+    return text, expected
+
+
+def legacy_parse(response: str, tags) -> dict:
+    """Ancien parcours des _parse_*_response : deux find() par balise, sur toute la réponse"""
+    sections = {}
+    for tag in tags:
+        start_tag = f"<{tag}>"
+        end_tag = f"</{tag}>"
+        start_idx = response.find(start_tag)
+        end_idx = response.find(end_tag)
+        if start_idx != -1 and end_idx != -1:
+            sections[tag] = response[start_idx + len(start_tag):end_idx].strip()
+    return sections
+
+
+def timed(func, runs: int) -> float:
+    """Durée moyenne (secondes) d'un appel"""
+    start = time.perf_counter()
+    for _ in range(runs):
+        func()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du parseur de sections")
+    parser.add_argument('--size-kb', type=float, action='append', help='Taille des réponses synthétiques (répétable)')
+    parser.add_argument('--runs', type=int, default=200, help='Nombre de répétitions')
+    args = parser.parse_args()
+
+    print("⏱️  Lecture des sections : find() par balise vs un seul parcours")
+    print()
+
+    rng = random.Random(42)
+    for size_kb in args.size_kb or [60, 250, 1000]:
+        text, _ = build_response(size_kb, rng)
+        same = parse_sections(text, TAGS)[0] == legacy_parse(text, TAGS)
+        t_old = timed(lambda: legacy_parse(text, TAGS), args.runs)
+        t_new = timed(lambda: parse_sections(text, TAGS), args.runs)
+        print(f"📄 Réponse {len(text) / 1024:7.0f} Ko : find() {t_old * 1000:7.2f} ms | "
+              f"1 parcours {t_new * 1000:7.2f} ms | x{t_old / t_new:5.1f} | résultats identiques: {same}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+DB Pool - Connexions pymysql empruntées au pool de l'engine partagé
+Fichier: backend/services/db_pool.py
+"""
+import logging
+
+import pymysql
+
+from backend.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+class PooledConnection:
+    """
+    Connexion brute empruntée au pool SQLAlchemy
+
+    S'utilise comme une connexion pymysql (curseurs dict par défaut) ;
+    close() la rend au pool avec rollback de toute transaction non validée.
+    """
+
+    def __init__(self, proxied):
+        self._conn = proxied
+
+    def cursor(self, cursor_class=pymysql.cursors.DictCursor):
+        return self._conn.cursor(cursor_class)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+class DBPool:
+    """
+    Accès pymysql au pool du process (celui de backend.database.engine)
+
+    Pré-ping à chaque emprunt, recyclage après DB_POOL_RECYCLE secondes et
+    pool vidé dans les process enfants après un fork.
+    """
+
+    def __init__(self):
+        self.engine = engine
+
+    def connection(self) -> PooledConnection:
+        """Emprunter une connexion au pool"""
+        return PooledConnection(self.engine.raw_connection())
+
+    def status(self) -> str:
+        """État du pool (connexions ouvertes / disponibles)"""
+        return self.engine.pool.status()
+
+
+_db_pool = None
+
+
+def get_db_pool() -> DBPool:
+    """Retourner l'instance DBPool du process (créée au premier appel)"""
+    global _db_pool
+    if _db_pool is None:
+        _db_pool = DBPool()
+    return _db_pool
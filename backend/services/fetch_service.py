@@ -0,0 +1,224 @@
+"""
+Fetch Service - Pool HTTP partagé par tous les scrapers
+Fichier: backend/services/fetch_service.py
+"""
+import re
+import codecs
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional
+
+import aiohttp
+
+from backend.config import Config
+from services.scrape_cache import get_scrape_cache
+from services.parser_pool import get_parser_pool
+from utils.loop_resources import LoopResources
+
+logger = logging.getLogger(__name__)
+
+# Types de contenu acceptés pour une page (les autres sont abandonnés avant lecture du corps)
+HTML_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Déclaration d'encodage dans le HTML (<meta charset> ou http-equiv)
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+CHUNK_SIZE = 64 * 1024
+
+
+class FetchService:
+    """Session HTTP du worker : connexions keep-alive, cache DNS et limites par hôte"""
+
+    def __init__(self):
+        self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        self.timeout = 30
+        self.max_connections = Config.FETCH_MAX_CONNECTIONS
+        self.per_host_limit = Config.SCRAPER_PER_HOST_LIMIT
+        self.dns_cache_ttl = Config.FETCH_DNS_CACHE_TTL
+        self.keepalive_timeout = Config.FETCH_KEEPALIVE_TIMEOUT
+        self.max_bytes = Config.FETCH_MAX_BYTES
+        self.cache = get_scrape_cache()
+        self.parser_pool = get_parser_pool()
+
+        # Une session aiohttp (et son connecteur) par event loop, fermée avec sa loop
+        self._sessions = LoopResources(lambda session: session.close())
+
+    def get_session(self) -> aiohttp.ClientSession:
+        """Récupérer (ou créer) la session partagée de la loop courante"""
+        session = self._sessions.get()
+
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections,
+                    limit_per_host=self.per_host_limit,
+                    ttl_dns_cache=self.dns_cache_ttl,
+                    keepalive_timeout=self.keepalive_timeout
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    'User-Agent': self.user_agent,
+                    'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.1'
+                }
+            )
+            self._sessions.set(session)
+
+        return session
+
+    async def fetch(self, url: str, timeout: Optional[float] = None,
+                    headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        Télécharger une page via le pool partagé
+
+        Args:
+            url: URL à télécharger
+            timeout: Timeout total de la requête (secondes)
+            headers: En-têtes supplémentaires (ex: If-None-Match)
+
+        Returns:
+            Dictionnaire avec url, status, headers, etag, last_modified et text (vide si status != 200)
+
+        Raises:
+            ValueError: Si la réponse n'est pas du HTML (corps non téléchargé)
+        """
+        session = self.get_session()
+        request_timeout = aiohttp.ClientTimeout(total=timeout or self.timeout)
+
+        async with session.get(url, timeout=request_timeout, headers=headers) as response:
+            text = await self._read_text(response) if response.status == 200 else ''
+
+            return {
+                'url': str(response.url),
+                'status': response.status,
+                'headers': dict(response.headers),
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'text': text
+            }
+
+    async def _read_text(self, response: aiohttp.ClientResponse) -> str:
+        """
+        Lire le corps en streaming, décodé au fil de l'eau, jusqu'à max_bytes
+
+        Au-delà, la lecture s'arrête et la connexion est fermée plutôt que de
+        télécharger le reste de la page.
+        """
+        content_type = response.content_type  # application/octet-stream si absent
+        if 'Content-Type' in response.headers and content_type not in HTML_CONTENT_TYPES:
+            response.close()
+            raise ValueError(f"Unsupported content type: {content_type}")
+
+        decoder = None
+        parts = []
+        received = 0
+        truncated = False
+
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            if decoder is None:
+                decoder = self._get_decoder(response.charset, chunk)
+
+            remaining = self.max_bytes - received
+            if len(chunk) > remaining:
+                chunk = chunk[:remaining]
+                truncated = True
+
+            received += len(chunk)
+            parts.append(decoder.decode(chunk))
+
+            if truncated:
+                break
+
+        if truncated:
+            logger.warning(f"Page truncated to {self.max_bytes} bytes: {response.url}")
+            response.close()  # Ne pas vider le reste du corps
+        elif decoder is not None:
+            parts.append(decoder.decode(b'', final=True))
+
+        return ''.join(parts)
+
+    @staticmethod
+    def _get_decoder(charset: Optional[str], first_chunk: bytes):
+        """Décodeur incrémental : charset de l'en-tête, sinon <meta charset>, sinon utf-8"""
+        if not charset:
+            match = META_CHARSET_RE.search(first_chunk[:4096])
+            if match:
+                charset = match.group(1).decode('ascii', errors='ignore')
+
+        try:
+            return codecs.getincrementaldecoder(charset or 'utf-8')(errors='replace')
+        except LookupError:
+            return codecs.getincrementaldecoder('utf-8')(errors='replace')
+
+    async def fetch_page(self, url: str, parse: Callable[[str, str], Dict[str, Any]],
+                         namespace: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Télécharger et parser une page, en passant par le cache de scraping
+
+        Une entrée fraîche est servie sans requête ; une entrée périmée est
+        revalidée par GET conditionnel (If-None-Match / If-Modified-Since).
+
+        Args:
+            url: URL à télécharger
+            parse: Fonction parse(html, url) -> données extraites, exécutée dans le
+                pool de parsing (doit être picklable : fonction de module ou staticmethod)
+            namespace: Type de parsing (fait partie de la clé de cache)
+            timeout: Timeout total de la requête (secondes)
+
+        Returns:
+            Dictionnaire avec status, data (None si status != 200) et cached
+        """
+        entry = None
+        if self.cache is not None:
+            entry = await asyncio.to_thread(self.cache.get, namespace, url)
+
+            if entry is not None and entry['fresh']:
+                logger.info(f"Scrape cache hit: {url}")
+                return {'status': 200, 'data': entry['data'], 'cached': True}
+
+        headers = {}
+        if entry is not None:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = await self.fetch(url, timeout=timeout, headers=headers or None)
+
+        if response['status'] == 304 and entry is not None:
+            logger.info(f"Scrape cache revalidated (304): {url}")
+            await asyncio.to_thread(
+                self.cache.set, namespace, url, entry['data'],
+                response['etag'] or entry.get('etag'),
+                response['last_modified'] or entry.get('last_modified')
+            )
+            return {'status': 200, 'data': entry['data'], 'cached': True}
+
+        if response['status'] != 200:
+            return {'status': response['status'], 'data': None, 'cached': False}
+
+        data = await self.parser_pool.run(parse, response['text'], url)
+
+        if self.cache is not None:
+            await asyncio.to_thread(
+                self.cache.set, namespace, url, data,
+                response['etag'], response['last_modified']
+            )
+
+        return {'status': 200, 'data': data, 'cached': False}
+
+    async def close(self):
+        """Fermer la session de la loop courante"""
+        session = self._sessions.pop()
+        if session is not None:
+            await session.close()
+
+
+_fetch_service = None
+
+
+def get_fetch_service() -> FetchService:
+    """Retourner l'instance FetchService du process (créée au premier appel)"""
+    global _fetch_service
+    if _fetch_service is None:
+        _fetch_service = FetchService()
+    return _fetch_service
@@ -0,0 +1,93 @@
+"""
+Ideogram Service - Pool de requêtes asynchrones vers l'API Ideogram
+Fichier: backend/services/ideogram_service.py
+"""
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+import aiohttp
+
+from backend.config import Config
+from utils.loop_resources import LoopResources
+
+logger = logging.getLogger(__name__)
+
+
+class IdeogramService:
+    """Client Ideogram asynchrone avec connexions persistantes et concurrence bornée"""
+
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: Optional[int] = None):
+        self.api_key = api_key or Config.IDEOGRAM_API_KEY
+        self.api_url = "https://api.ideogram.ai/v1/ideogram-v3/generate"
+        self.max_concurrency = max_concurrency or Config.IMAGE_MAX_CONCURRENCY
+        self.timeout = 60
+
+        # Une session aiohttp (et son pool de connexions) par event loop, fermée avec sa loop
+        self._sessions = LoopResources(lambda entry: entry[0].close())
+
+    def _get_session(self):
+        """Récupérer (ou créer) la session et le sémaphore de la loop courante"""
+        entry = self._sessions.get()
+
+        if entry is None or entry[0].closed:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                headers={
+                    "Api-Key": self.api_key or '',
+                    "Content-Type": "application/json"
+                }
+            )
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            entry = (session, semaphore)
+            self._sessions.set(entry)
+
+        return entry
+
+    async def generate(self, prompt: str, style_type: str, resolution: str) -> Dict[str, Any]:
+        """
+        Générer une image via Ideogram v3
+
+        Args:
+            prompt: Prompt de génération
+            style_type: Style Ideogram (REALISTIC, ...)
+            resolution: Résolution (ex: 1216x704)
+
+        Returns:
+            Réponse JSON de l'API
+        """
+        session, semaphore = self._get_session()
+
+        async with semaphore:
+            async with session.post(
+                self.api_url,
+                json={
+                    "prompt": prompt,
+                    "style_type": style_type,
+                    "resolution": resolution
+                }
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Ideogram API error: {response.status} - {error_text}")
+                    raise Exception(f"Ideogram API error: {response.status}")
+
+                return await response.json()
+
+    async def close(self):
+        """Fermer la session de la loop courante"""
+        entry = self._sessions.pop()
+        if entry is not None:
+            await entry[0].close()
+
+
+_ideogram_service = None
+
+
+def get_ideogram_service() -> IdeogramService:
+    """Retourner l'instance IdeogramService du process (créée au premier appel)"""
+    global _ideogram_service
+    if _ideogram_service is None:
+        _ideogram_service = IdeogramService()
+    return _ideogram_service
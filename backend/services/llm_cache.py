@@ -0,0 +1,253 @@
+"""
+LLM Cache - Cache exact des réponses Claude (disque ou Redis), compressé, TTL + LRU
+Fichier: backend/services/llm_cache.py
+
+Toujours importer via `services.llm_cache` (comme llm_service) pour ne créer
+qu'un cache par process.
+"""
+import os
+import json
+import fcntl
+import time
+import zlib
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+
+import redis
+
+from backend.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class DiskLLMCacheBackend:
+    """
+    Réponses compressées en fichiers ; date de modification = dernier accès (LRU)
+
+    L'éviction parcourt le dossier au plus toutes les evict_interval secondes :
+    max_entries peut être dépassé entre deux passages.
+    """
+
+    def __init__(self, directory: str, max_entries: int, evict_interval: int = 300):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.evict_interval = evict_interval
+        self._evicted_at = None
+        self.stats_path = os.path.join(directory, 'stats.json')  # Compteurs partagés par les process
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json.z")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)  # Entrée récemment utilisée
+        except FileNotFoundError:
+            return None
+        return data
+
+    def set(self, key: str, data: bytes, ttl: int):
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, self._path(key))  # Écriture atomique
+
+        if self._evicted_at is None or time.monotonic() - self._evicted_at >= self.evict_interval:
+            self._evicted_at = time.monotonic()
+            self._evict()
+
+    def delete(self, key: str):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def _evict(self):
+        """Supprimer les entrées les moins récemment utilisées au-delà de max_entries"""
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith('.json.z'):
+                    try:
+                        entries.append((entry.stat().st_mtime, entry.path))
+                    except FileNotFoundError:
+                        continue
+
+        for _, path in sorted(entries)[:max(0, len(entries) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def count(self) -> int:
+        return sum(1 for name in os.listdir(self.directory) if name.endswith('.json.z'))
+
+    def incr(self, field: str):
+        """Incrémenter un compteur (fichier verrouillé : plusieurs workers écrivent)"""
+        with open(self.stats_path, 'a+', encoding='utf-8') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            f.seek(0)
+            counters = json.loads(f.read() or '{}')
+            counters[field] = counters.get(field, 0) + 1
+            f.seek(0)
+            f.truncate()
+            json.dump(counters, f)
+
+    def counters(self) -> Dict[str, int]:
+        try:
+            with open(self.stats_path, 'r', encoding='utf-8') as f:
+                fcntl.flock(f, fcntl.LOCK_SH)
+                return json.loads(f.read() or '{}')
+        except FileNotFoundError:
+            return {}
+
+
+class RedisLLMCacheBackend:
+    """Réponses compressées dans Redis (SETEX) ; sorted set des derniers accès pour le LRU"""
+
+    def __init__(self, client: redis.Redis, max_entries: int, prefix: str = 'llm_cache:'):
+        self.client = client
+        self.max_entries = max_entries
+        self.prefix = prefix
+        self.lru_key = f"{prefix}lru"
+        self.stats_key = f"{prefix}stats"
+
+    def get(self, key: str) -> Optional[bytes]:
+        data = self.client.get(self.prefix + key)
+        if data is not None:
+            self.client.zadd(self.lru_key, {key: time.time()})
+        return data
+
+    def set(self, key: str, data: bytes, ttl: int):
+        pipe = self.client.pipeline()
+        pipe.setex(self.prefix + key, ttl, data)
+        pipe.zadd(self.lru_key, {key: time.time()})
+        pipe.zcard(self.lru_key)
+        size = pipe.execute()[-1]
+
+        if size > self.max_entries:
+            evicted = [member for member, _ in self.client.zpopmin(self.lru_key, size - self.max_entries)]
+            self.client.delete(*[self.prefix + member.decode() for member in evicted])
+
+        # Entrées expirées par TTL : retirées du sorted set au fil des écritures
+        self.client.zremrangebyscore(self.lru_key, 0, time.time() - ttl)
+
+    def delete(self, key: str):
+        self.client.delete(self.prefix + key)
+        self.client.zrem(self.lru_key, key)
+
+    def count(self) -> int:
+        return self.client.zcard(self.lru_key)
+
+    def incr(self, field: str):
+        self.client.hincrby(self.stats_key, field, 1)
+
+    def counters(self) -> Dict[str, int]:
+        return {field.decode(): int(value) for field, value in self.client.hgetall(self.stats_key).items()}
+
+
+class LLMCache:
+    """
+    Cache des réponses messages.create, indexé par requête exacte
+
+    Clé : modèle, température, max_tokens et hash du prompt rendu (system,
+    messages, autres paramètres). Sert les formulaires renvoyés après un
+    timeout et les réécritures identiques d'une même URL ; une réponse
+    servie depuis le cache est identique à la première, même à température > 0.
+    Compteurs de hits/misses tenus par le backend (partagés par tous les workers).
+    """
+
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self._local_stats = {'hits': 0, 'misses': 0}  # Si le backend est indisponible
+
+    @staticmethod
+    def make_key(model: str, temperature: float, max_tokens: int, request: Dict[str, Any]) -> str:
+        """Clé de cache : paramètres de génération + hash du prompt rendu"""
+        prompt_hash = hashlib.sha256(
+            json.dumps(request, sort_keys=True, ensure_ascii=False, default=str).encode('utf-8')
+        ).hexdigest()
+        return hashlib.sha256(f"{model}:{temperature}:{max_tokens}:{prompt_hash}".encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Réponse enregistrée (dictionnaire Message), None si absente ou expirée"""
+        message = None
+        try:
+            data = self.backend.get(key)
+            if data is not None:
+                entry = json.loads(zlib.decompress(data))
+                if entry['stored_at'] + self.ttl >= time.time():
+                    message = entry['message']
+                else:
+                    self.backend.delete(key)
+        except Exception as e:
+            logger.warning(f"LLM cache read failed: {e}")
+
+        self._count('hits' if message is not None else 'misses')
+        return message
+
+    def set(self, key: str, message: Dict[str, Any]):
+        """Enregistrer une réponse (dictionnaire Message), compressée"""
+        try:
+            entry = {'stored_at': time.time(), 'message': message}
+            data = zlib.compress(json.dumps(entry, ensure_ascii=False).encode('utf-8'), 6)
+            self.backend.set(key, data, self.ttl)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+    def _count(self, field: str):
+        self._local_stats[field] += 1
+        try:
+            self.backend.incr(field)
+        except Exception:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """Compteurs hits / misses / hit_ratio et nombre d'entrées"""
+        counters = dict(self._local_stats)
+        try:
+            shared = self.backend.counters()
+            counters = {field: int(shared.get(field, 0)) for field in counters}
+        except Exception as e:
+            logger.warning(f"LLM cache stats read failed: {e}")
+
+        lookups = counters['hits'] + counters['misses']
+        try:
+            entries = self.backend.count()
+        except Exception:
+            entries = None
+
+        return {
+            'backend': Config.LLM_CACHE_BACKEND.lower(),
+            'hits': counters['hits'],
+            'misses': counters['misses'],
+            'hit_ratio': round(counters['hits'] / lookups, 4) if lookups else 0.0,
+            'entries': entries,
+            'max_entries': self.backend.max_entries,
+            'ttl': self.ttl
+        }
+
+
+_llm_cache = None
+
+
+def get_llm_cache() -> Optional[LLMCache]:
+    """Retourner le cache du process selon LLM_CACHE_BACKEND (None si désactivé, par défaut)"""
+    global _llm_cache
+    if _llm_cache is None:
+        backend_name = Config.LLM_CACHE_BACKEND.lower()
+
+        if backend_name == 'redis':
+            backend = RedisLLMCacheBackend(redis.Redis.from_url(Config.REDIS_URL), Config.LLM_CACHE_MAX_ENTRIES)
+        elif backend_name == 'disk':
+            backend = DiskLLMCacheBackend(Config.LLM_CACHE_DIR, Config.LLM_CACHE_MAX_ENTRIES)
+        else:
+            return None
+
+        _llm_cache = LLMCache(backend, ttl=Config.LLM_CACHE_TTL)
+    return _llm_cache
@@ -0,0 +1,186 @@
+"""
+LLM Service - Passerelle asynchrone vers l'API Anthropic
+Fichier: backend/services/llm_service.py
+"""
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional
+
+from anthropic import AsyncAnthropic
+from anthropic.types import Message
+
+from backend.config import Config
+from services.llm_cache import get_llm_cache
+from utils.loop_resources import LoopResources
+
+logger = logging.getLogger(__name__)
+
+
+class LLMService:
+    """Client Anthropic asynchrone partagé par toutes les étapes LLM des workflows"""
+
+    def __init__(self, api_key: Optional[str] = None, max_concurrency: Optional[int] = None):
+        self.api_key = api_key or Config.ANTHROPIC_API_KEY
+        self.max_concurrency = max_concurrency or Config.LLM_MAX_CONCURRENCY
+        self.max_retries = Config.MAX_RETRIES
+        self.cache = get_llm_cache()  # None sauf si LLM_CACHE_BACKEND est activé
+
+        # Un client (et son pool httpx) par event loop : les connexions
+        # asynchrones ne peuvent pas être partagées entre deux loops.
+        # Le client est fermé quand sa loop se ferme.
+        self._clients = LoopResources(lambda entry: entry[0].close())
+
+    def _get_client(self):
+        """Récupérer (ou créer) le client et le sémaphore de la loop courante"""
+        entry = self._clients.get()
+
+        if entry is None:
+            client = AsyncAnthropic(api_key=self.api_key, max_retries=self.max_retries)
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            entry = (client, semaphore)
+            self._clients.set(entry)
+
+        return entry
+
+    @staticmethod
+    def _system_blocks(system: str) -> List[Dict[str, Any]]:
+        """
+        Bloc system avec marqueur cache_control
+
+        Le préfixe du prompt (consignes du template) est mis en cache côté API
+        pendant quelques minutes : les appels suivants qui partagent ces consignes
+        (satellites d'un même cluster, workflows enchaînés) ne le refont pas
+        traiter ni facturer au plein tarif. Ignoré par l'API sous ~1024 tokens.
+        """
+        block = {'type': 'text', 'text': system}
+        if Config.LLM_PROMPT_CACHE:
+            block['cache_control'] = {'type': 'ephemeral'}
+        return [block]
+
+    async def create_message(self,
+                             model: str,
+                             max_tokens: int,
+                             messages: List[Dict[str, Any]],
+                             temperature: float = 1.0,
+                             system: Optional[str] = None,
+                             **kwargs) -> Any:
+        """
+        Appeler messages.create sans bloquer l'event loop
+
+        Args:
+            model: Modèle Claude à utiliser
+            max_tokens: Nombre maximum de tokens générés
+            messages: Messages de la conversation
+            temperature: Température d'échantillonnage
+            system: Consignes fixes, envoyées avec un marqueur de cache de prompt
+            **kwargs: Paramètres supplémentaires transmis à l'API
+
+        Returns:
+            Réponse Anthropic (Message)
+        """
+        client, semaphore = self._get_client()
+        if system:
+            kwargs['system'] = self._system_blocks(system)
+
+        cache_key, cached = await self._cache_lookup(model, temperature, max_tokens, messages, kwargs)
+        if cached is not None:
+            return cached
+
+        async with semaphore:
+            response = await client.messages.create(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=messages,
+                **kwargs
+            )
+
+        await self._cache_store(cache_key, response)
+        return response
+
+    async def stream_message(self,
+                             model: str,
+                             max_tokens: int,
+                             messages: List[Dict[str, Any]],
+                             temperature: float = 1.0,
+                             on_text: Optional[Callable[[str], None]] = None,
+                             system: Optional[str] = None,
+                             **kwargs) -> Any:
+        """
+        Appeler l'API en streaming (texte transmis au fil de la génération)
+
+        Args:
+            model: Modèle Claude à utiliser
+            max_tokens: Nombre maximum de tokens générés
+            messages: Messages de la conversation
+            temperature: Température d'échantillonnage
+            on_text: Callback appelé avec chaque fragment de texte reçu
+            system: Consignes fixes, envoyées avec un marqueur de cache de prompt
+            **kwargs: Paramètres supplémentaires transmis à l'API
+
+        Returns:
+            Réponse Anthropic complète (Message, comme create_message)
+        """
+        client, semaphore = self._get_client()
+        if system:
+            kwargs['system'] = self._system_blocks(system)
+
+        cache_key, cached = await self._cache_lookup(model, temperature, max_tokens, messages, kwargs)
+        if cached is not None:
+            # Réponse déjà connue : transmise d'un bloc au callback
+            if on_text:
+                for block in cached.content:
+                    if block.type == 'text':
+                        on_text(block.text)
+            return cached
+
+        async with semaphore:
+            async with client.messages.stream(
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                messages=messages,
+                **kwargs
+            ) as stream:
+                async for text in stream.text_stream:
+                    if on_text:
+                        on_text(text)
+                response = await stream.get_final_message()
+
+        await self._cache_store(cache_key, response)
+        return response
+
+    async def _cache_lookup(self, model: str, temperature: float, max_tokens: int,
+                            messages: List[Dict[str, Any]], kwargs: Dict[str, Any]):
+        """
+        Chercher la requête dans le cache de réponses
+
+        Returns:
+            (clé de cache, Message enregistré ou None) ; (None, None) si cache désactivé
+        """
+        if self.cache is None:
+            return None, None
+
+        cache_key = self.cache.make_key(model, temperature, max_tokens, {'messages': messages, **kwargs})
+        cached = await asyncio.to_thread(self.cache.get, cache_key)
+        if cached is None:
+            return cache_key, None
+
+        logger.info(f"LLM cache hit for {model} ({cache_key[:12]})")
+        return cache_key, Message.model_validate(cached)
+
+    async def _cache_store(self, cache_key: Optional[str], response: Any):
+        """Enregistrer une réponse complète (pas de réponse tronquée par max_tokens)"""
+        if cache_key is not None and response.stop_reason == 'end_turn':
+            await asyncio.to_thread(self.cache.set, cache_key, response.model_dump(mode='json'))
+
+
+_llm_service = None
+
+
+def get_llm_service() -> LLMService:
+    """Retourner l'instance LLMService du process (créée au premier appel)"""
+    global _llm_service
+    if _llm_service is None:
+        _llm_service = LLMService()
+    return _llm_service
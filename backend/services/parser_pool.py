@@ -0,0 +1,107 @@
+"""
+Parser Pool - Parsing HTML hors de l'event loop
+Fichier: backend/services/parser_pool.py
+"""
+import os
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from backend.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+def _is_daemon_process() -> bool:
+    """Process démon (multiprocessing ou billiard, utilisé par le prefork Celery) : pas d'enfants possibles"""
+    if multiprocessing.current_process().daemon:
+        return True
+    try:
+        from billiard.process import current_process
+    except ImportError:  # Celery non installé
+        return False
+    return bool(current_process().daemon)
+
+
+class ParserPool:
+    """
+    Pool de parsing local au worker
+
+    En mode 'process', une page énorme ne bloque ni ne fait tomber le worker :
+    seul le process de parsing est perdu (le pool est alors recréé). Les
+    fonctions soumises doivent être picklables (fonctions de module ou
+    staticmethods). Le mode 'thread' libère l'event loop sans isolation mémoire.
+    """
+
+    def __init__(self, mode: Optional[str] = None, max_workers: Optional[int] = None):
+        self.mode = (mode or Config.PARSER_POOL).lower()
+        self.max_workers = max_workers or Config.PARSER_MAX_WORKERS
+        self._executor: Optional[Executor] = None
+        self._pid = None
+
+    def _get_executor(self) -> Executor:
+        """Récupérer (ou créer) l'executor du process courant"""
+        if self._executor is not None and self._pid == os.getpid():
+            return self._executor
+
+        if self.mode == 'process' and _is_daemon_process():
+            # Process Celery (prefork) : pas de process enfants possibles
+            logger.warning("Parser pool: daemonic worker, falling back to threads")
+            self.mode = 'thread'
+
+        if self.mode == 'process':
+            # spawn : pas de fork d'un process qui a déjà des threads et une event loop
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix='html-parser'
+            )
+
+        self._pid = os.getpid()
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args) -> Any:
+        """
+        Exécuter func(*args) dans le pool sans bloquer l'event loop
+
+        Args:
+            func: Fonction de parsing (picklable en mode 'process')
+            *args: Arguments (ex: html, url)
+
+        Returns:
+            Résultat de func
+        """
+        if self.mode == 'inline':
+            return func(*args)
+
+        executor = self._get_executor()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            logger.error("Parser process died (page too large?), recreating the pool")
+            self.shutdown()
+            raise
+
+    def shutdown(self):
+        """Arrêter l'executor (sans attendre les tâches en cours)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+_parser_pool = None
+
+
+def get_parser_pool() -> ParserPool:
+    """Retourner l'instance ParserPool du process (créée au premier appel)"""
+    global _parser_pool
+    if _parser_pool is None:
+        _parser_pool = ParserPool()
+    return _parser_pool
@@ -0,0 +1,177 @@
+"""
+Progress Store - Progression des workflows dans Redis, recopiée en MySQL de façon espacée
+Fichier: backend/services/progress_store.py
+"""
+import json
+import time
+import logging
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import redis
+
+from backend.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class ProgressStore:
+    """
+    État courant des workflows (hash Redis par workflow, avec TTL)
+
+    Chaque appel de progression écrit dans Redis ; la table workflows n'est
+    mise à jour (via on_flush) qu'au passage en 'processing', à chaque
+    changement d'étape et au plus toutes les PROGRESS_DB_FLUSH_INTERVAL
+    secondes. La fin du workflow reste enregistrée en base par
+    complete_workflow / fail_workflow.
+
+    current_step et progress ne reculent jamais : le pilier et les satellites
+    du workflow 3 avancent en parallèle et leurs rappels arrivent dans le désordre.
+
+    Chaque écriture est aussi publiée sur un canal pub/sub par workflow, écouté
+    par le flux SSE de l'API (subscribe).
+    """
+
+    def __init__(self, on_flush: Optional[Callable[[str, int, int], None]] = None):
+        self.prefix = 'workflow_progress:'
+        self.ttl = Config.PROGRESS_TTL
+        self.flush_interval = Config.PROGRESS_DB_FLUSH_INTERVAL
+        self.on_flush = on_flush  # on_flush(workflow_id, progress, current_step)
+
+        self.client = redis.Redis.from_url(Config.REDIS_URL, decode_responses=True)
+        self._latest: Dict[str, Tuple[int, int]] = {}  # workflow_id -> (étape, progression) les plus avancées
+        self._flushed: Dict[str, Tuple[float, int]] = {}  # workflow_id -> (date, étape) de la dernière écriture MySQL
+
+    def _key(self, workflow_id: str) -> str:
+        return f"{self.prefix}{workflow_id}"
+
+    def _channel(self, workflow_id: str) -> str:
+        return f"{self.prefix}{workflow_id}:events"
+
+    def _write(self, workflow_id: str, fields: Dict[str, Any]):
+        """Écrire des champs du hash, renouveler son TTL et notifier les abonnés"""
+        fields = dict(fields, updated_at=time.time())
+        try:
+            pipe = self.client.pipeline()
+            pipe.hset(self._key(workflow_id), mapping={k: str(v) for k, v in fields.items()})
+            pipe.expire(self._key(workflow_id), self.ttl)
+            pipe.publish(self._channel(workflow_id), json.dumps(sorted(fields)))
+            pipe.execute()
+        except redis.RedisError as e:
+            logger.warning(f"Progress store write failed for {workflow_id}: {e}")
+
+    def start(self, workflow_id: str, total_steps: int):
+        """Initialiser la progression d'un workflow"""
+        self._forget(workflow_id)
+        self._write(workflow_id, {
+            'status': 'pending',
+            'current_step': 0,
+            'total_steps': total_steps,
+            'progress': 0
+        })
+
+    def update(self, workflow_id: str, step: int, status: str, progress: int,
+               data: Optional[Dict[str, Any]] = None):
+        """
+        Enregistrer la progression (callback des workflow managers)
+
+        Args:
+            workflow_id: ID du workflow
+            step: Étape courante
+            status: Statut de l'étape ('in_progress', 'completed')
+            progress: Pourcentage global
+            data: Résultat partiel de l'étape (petit dictionnaire JSON, optionnel)
+        """
+        # Étape et progression globales : jamais en dessous des valeurs déjà écrites
+        latest_step, latest_progress = self._latest.get(workflow_id, (0, 0))
+        current_step = max(step, latest_step)
+        progress = max(progress, latest_progress)
+        self._latest[workflow_id] = (current_step, progress)
+
+        fields = {
+            'status': 'processing',
+            'current_step': current_step,
+            'progress': progress,
+            f'step_{step}': status  # Un champ par étape : pas de lecture avant écriture
+        }
+        if data is not None:
+            fields[f'data_{step}'] = json.dumps(data, ensure_ascii=False)
+        self._write(workflow_id, fields)
+
+        # MySQL : au passage en 'processing', à chaque nouvelle étape, sinon au plus une fois par intervalle
+        now = time.monotonic()
+        flushed = self._flushed.get(workflow_id)
+        if self.on_flush and (flushed is None or current_step != flushed[1]
+                              or now - flushed[0] >= self.flush_interval):
+            self.on_flush(workflow_id, progress, current_step)
+            self._flushed[workflow_id] = (now, current_step)
+
+    def _forget(self, workflow_id: str):
+        self._latest.pop(workflow_id, None)
+        self._flushed.pop(workflow_id, None)
+
+    def complete(self, workflow_id: str, summary: Optional[Dict[str, Any]] = None):
+        """
+        Marquer le workflow comme terminé
+
+        Args:
+            workflow_id: ID du workflow
+            summary: Résumé du résultat affiché par la page d'attente (optionnel)
+        """
+        self._forget(workflow_id)
+        fields = {'status': 'completed', 'progress': 100}
+        if summary is not None:
+            fields['result'] = json.dumps(summary, ensure_ascii=False)
+        self._write(workflow_id, fields)
+
+    def fail(self, workflow_id: str, error: str):
+        """Marquer le workflow comme échoué"""
+        self._forget(workflow_id)
+        self._write(workflow_id, {'status': 'error', 'error': error})
+
+    def get(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Lire la progression d'un workflow
+
+        Returns:
+            Dictionnaire status, current_step, total_steps, progress, step_details
+            (et error, result), None si inconnu ou Redis indisponible
+        """
+        try:
+            raw = self.client.hgetall(self._key(workflow_id))
+        except redis.RedisError as e:
+            logger.warning(f"Progress store read failed for {workflow_id}: {e}")
+            return None
+
+        if not raw:
+            return None
+
+        step_details = {field: {'status': value} for field, value in raw.items() if field.startswith('step_')}
+        for field, value in raw.items():
+            if field.startswith('data_'):  # Résultat partiel de l'étape
+                step_details.setdefault(f'step_{field[5:]}', {})['data'] = json.loads(value)
+
+        progress = {
+            'status': raw.get('status', 'pending'),
+            'current_step': int(raw.get('current_step', 0)),
+            'total_steps': int(raw.get('total_steps', 0)),
+            'progress': int(raw.get('progress', 0)),
+            'step_details': step_details
+        }
+        if 'error' in raw:
+            progress['error'] = raw['error']
+        if 'result' in raw:
+            progress['result'] = json.loads(raw['result'])
+
+        return progress
+
+    def subscribe(self, workflow_id: str) -> redis.client.PubSub:
+        """
+        S'abonner aux écritures d'un workflow
+
+        Chaque message signale un changement : relire l'état avec get().
+        L'appelant ferme l'abonnement (pubsub.close()).
+        """
+        pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+        pubsub.subscribe(self._channel(workflow_id))
+        return pubsub
+
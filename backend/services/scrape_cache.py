@@ -0,0 +1,198 @@
+"""
+Scrape Cache - Cache des pages scrapées (disque ou Redis) avec revalidation HTTP
+Fichier: backend/services/scrape_cache.py
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from backend.config import Config
+
+logger = logging.getLogger(__name__)
+
+# Paramètres de tracking ignorés dans la clé de cache
+TRACKING_PARAMS = ('utm_', 'fbclid', 'gclid', 'mc_cid', 'mc_eid')
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normaliser une URL pour la clé de cache
+
+    Schéma et hôte en minuscules, port par défaut retiré, fragment et
+    paramètres de tracking supprimés, query triée, slash final retiré.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower() or 'http'
+    netloc = parts.netloc.lower()
+
+    if (scheme == 'http' and netloc.endswith(':80')) or (scheme == 'https' and netloc.endswith(':443')):
+        netloc = netloc.rsplit(':', 1)[0]
+
+    path = parts.path or '/'
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    )
+
+    return urlunsplit((scheme, netloc, path, urlencode(query), ''))
+
+
+class DiskCacheBackend:
+    """
+    Stockage des entrées en fichiers JSON dans un dossier local
+
+    Date de modification = dernier accès : au plus toutes les sweep_interval
+    secondes, une écriture supprime les fichiers non utilisés depuis plus que
+    leur TTL (donc expirés), puis les moins récemment utilisés au-delà de
+    max_entries (si défini). Entre deux passages, le dossier peut dépasser
+    max_entries ; les écritures ne parcourent pas tout le dossier.
+    """
+
+    def __init__(self, directory: str, max_entries: Optional[int] = None, sweep_interval: int = 300):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.sweep_interval = sweep_interval
+        self._swept_at = None
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+
+        if entry.get('expires_at', 0) < time.time():
+            os.remove(path)
+            return None
+
+        os.utime(path)  # Entrée récemment utilisée
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any], ttl: int):
+        entry = dict(entry, expires_at=time.time() + ttl)
+        tmp_path = f"{self._path(key)}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, self._path(key))  # Écriture atomique
+
+        if self._swept_at is None or time.monotonic() - self._swept_at >= self.sweep_interval:
+            self._swept_at = time.monotonic()
+            self._sweep(ttl)
+
+    def _sweep(self, ttl: int):
+        """Supprimer les entrées expirées, puis les moins récemment utilisées au-delà de max_entries"""
+        now = time.time()
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                    if mtime + ttl < now:
+                        os.remove(entry.path)
+                    else:
+                        entries.append((mtime, entry.path))
+                except FileNotFoundError:
+                    continue
+
+        if self.max_entries is not None:
+            for _, path in sorted(entries)[:max(0, len(entries) - self.max_entries)]:
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+
+
+class RedisCacheBackend:
+    """Stockage des entrées dans Redis (partagé entre workers et machines)"""
+
+    def __init__(self, redis_url: str, prefix: str = 'scrape_cache:'):
+        import redis
+        self.client = redis.Redis.from_url(redis_url)
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = self.client.get(self.prefix + key)
+        return json.loads(raw) if raw else None
+
+    def set(self, key: str, entry: Dict[str, Any], ttl: int):
+        self.client.setex(self.prefix + key, ttl, json.dumps(entry, ensure_ascii=False))
+
+
+class ScrapeCache:
+    """Cache des pages parsées, indexé par URL normalisée"""
+
+    def __init__(self, backend, ttl: int, max_age: int):
+        self.backend = backend
+        self.ttl = ttl  # Durée pendant laquelle une entrée est servie sans revalidation
+        self.max_age = max_age  # Durée de conservation (revalidation par GET conditionnel)
+
+    @staticmethod
+    def make_key(namespace: str, url: str) -> str:
+        """Clé de cache : hash du type de parsing + URL normalisée"""
+        return hashlib.sha256(f"{namespace}:{normalize_url(url)}".encode('utf-8')).hexdigest()
+
+    def get(self, namespace: str, url: str) -> Optional[Dict[str, Any]]:
+        """Récupérer une entrée (fraîche ou périmée), None si absente"""
+        try:
+            entry = self.backend.get(self.make_key(namespace, url))
+        except Exception as e:
+            logger.warning(f"Scrape cache read failed for {url}: {e}")
+            return None
+
+        if entry is not None:
+            entry['fresh'] = time.time() - entry.get('stored_at', 0) < self.ttl
+
+        return entry
+
+    def set(self, namespace: str, url: str, data: Dict[str, Any],
+            etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Enregistrer le résultat parsé d'une page"""
+        entry = {
+            'url': normalize_url(url),
+            'stored_at': time.time(),
+            'etag': etag,
+            'last_modified': last_modified,
+            'data': data
+        }
+        try:
+            self.backend.set(self.make_key(namespace, url), entry, self.max_age)
+        except Exception as e:
+            logger.warning(f"Scrape cache write failed for {url}: {e}")
+
+
+_scrape_cache = None
+
+
+def get_scrape_cache() -> Optional[ScrapeCache]:
+    """Retourner le cache du process selon SCRAPE_CACHE_BACKEND (None si désactivé)"""
+    global _scrape_cache
+    if _scrape_cache is None:
+        backend_name = Config.SCRAPE_CACHE_BACKEND.lower()
+
+        if backend_name == 'redis':
+            backend = RedisCacheBackend(Config.REDIS_URL)
+        elif backend_name == 'disk':
+            backend = DiskCacheBackend(Config.SCRAPE_CACHE_DIR, Config.SCRAPE_CACHE_MAX_ENTRIES)
+        else:
+            return None
+
+        _scrape_cache = ScrapeCache(
+            backend,
+            ttl=Config.SCRAPE_CACHE_TTL,
+            max_age=Config.SCRAPE_CACHE_MAX_AGE
+        )
+    return _scrape_cache
@@ -0,0 +1,116 @@
+"""
+Site Analysis Cache - Analyse de site (étape 2 du workflow 1) réutilisée tant que le site ne change pas
+Fichier: backend/services/site_analysis_cache.py
+"""
+import time
+import json
+import hashlib
+import logging
+from typing import Any, Dict, Optional
+from urllib.parse import urlsplit
+
+from backend.config import Config
+from services.scrape_cache import DiskCacheBackend, RedisCacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+def _hash(data: Any) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+def site_key(site_url: str) -> str:
+    """Identifiant du site : hôte en minuscules, sans www."""
+    host = urlsplit(site_url.strip()).netloc.lower() or site_url.strip().lower()
+    return host[4:] if host.startswith('www.') else host
+
+
+def content_fingerprint(main_content: Dict[str, Any], domain: str) -> str:
+    """
+    Empreinte du contenu scrapé de la page principale et du domaine d'activité
+
+    Change dès que le titre, la meta description, les titres ou le texte
+    de la page changent : l'analyse en cache n'est alors plus utilisée.
+    """
+    return _hash({
+        'domain': domain,
+        'title': main_content.get('title', ''),
+        'meta_description': main_content.get('meta_description', ''),
+        'headings': main_content.get('headings', {}),
+        'text': main_content.get('text_content', '')
+    })
+
+
+def request_hash(user_context: Dict[str, Any], internal_pages: Any, external_refs: Any) -> str:
+    """Hash du contexte propre à un article (les sections qui en dépendent ne valent que pour lui)"""
+    return _hash({
+        'keyword': user_context.get('keyword', ''),
+        'guideline': user_context.get('guideline', ''),
+        'internal_pages': internal_pages,
+        'external_refs': external_refs
+    })
+
+
+class SiteAnalysisCache:
+    """Analyses de site indexées par site + empreinte du contenu, fraîches pendant ttl secondes"""
+
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+
+    @staticmethod
+    def make_key(site: str, fingerprint: str) -> str:
+        return hashlib.sha256(f"{site}:{fingerprint}".encode('utf-8')).hexdigest()
+
+    def get(self, site: str, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Dernière analyse du site si son contenu n'a pas changé, None sinon"""
+        try:
+            entry = self.backend.get(self.make_key(site, fingerprint))
+        except Exception as e:
+            logger.warning(f"Site analysis cache read failed for {site}: {e}")
+            return None
+
+        if entry is None or time.time() - entry.get('analyzed_at', 0) > self.ttl:
+            return None
+        return entry
+
+    def set(self, site: str, fingerprint: str, insights: Dict[str, Any], request_hash: str):
+        """
+        Enregistrer l'analyse d'un site
+
+        Args:
+            site: Identifiant du site (site_key)
+            fingerprint: Empreinte du contenu analysé (content_fingerprint)
+            insights: Sections parsées de l'analyse
+            request_hash: Hash du contexte propre à l'article (mot-clé, brief, liens)
+        """
+        entry = {
+            'site': site,
+            'analyzed_at': time.time(),
+            'request_hash': request_hash,
+            'insights': insights
+        }
+        try:
+            self.backend.set(self.make_key(site, fingerprint), entry, self.ttl)
+        except Exception as e:
+            logger.warning(f"Site analysis cache write failed for {site}: {e}")
+
+
+_site_analysis_cache = None
+
+
+def get_site_analysis_cache() -> Optional[SiteAnalysisCache]:
+    """Retourner le cache du process selon SITE_ANALYSIS_CACHE_BACKEND (None si désactivé)"""
+    global _site_analysis_cache
+    if _site_analysis_cache is None:
+        backend_name = Config.SITE_ANALYSIS_CACHE_BACKEND.lower()
+
+        if backend_name == 'redis':
+            backend = RedisCacheBackend(Config.REDIS_URL, prefix='site_analysis:')
+        elif backend_name == 'disk':
+            backend = DiskCacheBackend(Config.SITE_ANALYSIS_CACHE_DIR)
+        else:
+            return None
+
+        _site_analysis_cache = SiteAnalysisCache(backend, ttl=Config.SITE_ANALYSIS_CACHE_TTL)
+    return _site_analysis_cache
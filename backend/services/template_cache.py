@@ -0,0 +1,191 @@
+"""
+Template Cache - Templates de prompts actifs, chargés une fois par worker
+Fichier: backend/services/template_cache.py
+"""
+import os
+import time
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from backend.config import Config
+from services.db_pool import get_db_pool
+from utils.prompt_template import compile_template
+
+logger = logging.getLogger(__name__)
+
+
+class TemplateCache:
+    """
+    Cache des templates de prompts indexé par (workflow_id, version)
+
+    Les versions actives sont relues en une seule requête au plus toutes les
+    TEMPLATE_CACHE_CHECK_INTERVAL secondes : entre deux vérifications, obtenir
+    un template ne coûte aucun aller-retour MySQL. Le contenu d'une version
+    n'est lu qu'une fois ; activer une nouvelle version (admin) change la clé.
+    Les définitions de prompt_variables sont relues quand une version change.
+    """
+
+    def __init__(self, check_interval: Optional[int] = None):
+        self.check_interval = Config.TEMPLATE_CACHE_CHECK_INTERVAL if check_interval is None else check_interval
+        self.db_pool = get_db_pool()
+
+        self._templates: Dict[Tuple[int, int], str] = {}  # (workflow_id, version) -> contenu
+        self._active: Dict[int, int] = {}  # workflow_id -> version active
+        self._variable_rows: Optional[List[Dict[str, Any]]] = None  # Lignes de prompt_variables
+        self._files: Dict[str, Tuple[float, str]] = {}  # chemin -> (mtime, contenu)
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def get_active(self, workflow_id: int) -> Optional[str]:
+        """
+        Template actif d'un workflow
+
+        Returns:
+            Contenu du template, None si aucun template actif ou base indisponible
+        """
+        self._refresh_active_versions()
+
+        version = self._active.get(workflow_id)
+        if version is None:
+            return None
+
+        key = (workflow_id, version)
+        content = self._templates.get(key)
+        if content is None:
+            content = self._load_content(workflow_id, version)
+            if content is not None:
+                self._templates[key] = content
+
+        return content
+
+    def get_variable_specs(self, workflow_id: int) -> Dict[str, Dict[str, Any]]:
+        """
+        Définitions des variables utilisables par un workflow (table prompt_variables)
+
+        Returns:
+            {nom: {'is_required', 'default_value'}} (vide si base indisponible)
+        """
+        self._refresh_active_versions()
+
+        return {
+            row['name']: row for row in self._variable_rows or []
+            if row['workflow_specific'] is None or row['workflow_specific'] == workflow_id
+        }
+
+    def read_file(self, path: str) -> str:
+        """Template fichier (fallback), relu seulement si le fichier a changé"""
+        mtime = os.path.getmtime(path)
+        cached = self._files.get(path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self._files[path] = (mtime, content)
+        return content
+
+    def _refresh_active_versions(self):
+        """Relire les versions actives si le dernier contrôle est trop ancien"""
+        now = time.monotonic()
+        if self._checked_at is not None and now - self._checked_at < self.check_interval:
+            return
+
+        with self._lock:
+            if self._checked_at is not None and now - self._checked_at < self.check_interval:
+                return
+
+            conn = None
+            try:
+                conn = self.db_pool.connection()
+                with conn.cursor() as cursor:
+                    cursor.execute("""
+                        SELECT workflow_id, MAX(version) AS version
+                        FROM prompt_templates
+                        WHERE is_active = TRUE
+                        GROUP BY workflow_id
+                    """)
+                    active = {row['workflow_id']: row['version'] for row in cursor.fetchall()}
+            except Exception as e:
+                # Base indisponible : garder les versions connues, réessayer au prochain intervalle
+                logger.error(f"Failed to check active template versions: {e}")
+                self._checked_at = now
+                return
+            finally:
+                if conn:
+                    conn.close()
+
+            if active != self._active or self._variable_rows is None:
+                self._variable_rows = self._load_variables()
+
+            for workflow_id, version in active.items():
+                if self._active.get(workflow_id) != version:
+                    logger.info(f"Active template for workflow {workflow_id}: version {version}")
+
+            # Oublier le contenu des versions désactivées
+            self._templates = {
+                key: content for key, content in self._templates.items()
+                if active.get(key[0]) == key[1]
+            }
+            self._active = active
+            self._checked_at = now
+
+    def _load_content(self, workflow_id: int, version: int) -> Optional[str]:
+        """Lire le contenu d'une version de template"""
+        conn = None
+        try:
+            conn = self.db_pool.connection()
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT content
+                    FROM prompt_templates
+                    WHERE workflow_id = %s AND version = %s
+                    LIMIT 1
+                """, (workflow_id, version))
+                result = cursor.fetchone()
+        except Exception as e:
+            logger.error(f"Failed to load template from database: {e}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+        if not result:
+            return None
+
+        logger.info(f"Loaded template from database: workflow {workflow_id}, version {version}")
+
+        undeclared = compile_template(result['content']).undeclared(self.get_variable_specs(workflow_id))
+        if undeclared and self._variable_rows:
+            logger.info(f"Template variables not declared in prompt_variables: {', '.join(undeclared)}")
+
+        return result['content']
+
+    def _load_variables(self) -> Optional[List[Dict[str, Any]]]:
+        """Lire les définitions de prompt_variables (None si indisponible)"""
+        conn = None
+        try:
+            conn = self.db_pool.connection()
+            with conn.cursor() as cursor:
+                cursor.execute("""
+                    SELECT name, is_required, default_value, workflow_specific
+                    FROM prompt_variables
+                """)
+                return list(cursor.fetchall())
+        except Exception as e:
+            logger.warning(f"Failed to load prompt variables: {e}")
+            return None
+        finally:
+            if conn:
+                conn.close()
+
+
+_template_cache = None
+
+
+def get_template_cache() -> TemplateCache:
+    """Retourner l'instance TemplateCache du process (créée au premier appel)"""
+    global _template_cache
+    if _template_cache is None:
+        _template_cache = TemplateCache()
+    return _template_cache
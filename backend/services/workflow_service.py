@@ -5,14 +5,16 @@ Fichier: backend/services/workflow_service.py
 import os
 import json
 import gzip
+import hashlib
 import logging
-from datetime import datetime
+import mimetypes
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from minio import Minio
 from minio.error import S3Error
 from io import BytesIO
-import pymysql
-from backend.config import Config
+from services.db_pool import get_db_pool
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +28,9 @@ class WorkflowService:
         self.secret_key = os.getenv('MINIO_SECRET_KEY', 'minioadmin123')
         self.bucket = os.getenv('MINIO_BUCKET', 'seo-workflows')
         self.secure = os.getenv('MINIO_SECURE', 'False').lower() == 'true'
+        self.upload_workers = int(os.getenv('MINIO_UPLOAD_WORKERS', 4))  # Uploads simultanés par workflow
+        self.presigned_expiry = int(os.getenv('MINIO_PRESIGNED_EXPIRY', 300))  # Validité des URLs signées (secondes)
+        self.db_pool = get_db_pool()
         
         self.client = Minio(
             self.endpoint,
@@ -47,16 +52,8 @@ class WorkflowService:
             logger.error(f"Erreur création bucket: {e}")
     
     def _get_db_connection(self):
-        """Créer une connexion MySQL"""
-        return pymysql.connect(
-            host=Config.DB_HOST,
-            port=Config.DB_PORT,
-            user=Config.DB_USER,
-            password=Config.DB_PASSWORD,
-            database=Config.DB_NAME,
-            charset='utf8mb4',
-            cursorclass=pymysql.cursors.DictCursor
-        )
+        """Emprunter une connexion MySQL au pool du process (close() la rend au pool)"""
+        return self.db_pool.connection()
     
     def create_workflow(self, user_id: int, workflow_id: str, workflow_type: str, 
                        input_params: Dict, total_steps: int = 3):
@@ -81,6 +78,20 @@ class WorkflowService:
         finally:
             conn.close()
     
+    def workflow_exists(self, workflow_id: str) -> bool:
+        """Vérifier qu'un workflow est enregistré en base (True si la base est indisponible)"""
+        try:
+            conn = self._get_db_connection()
+        except Exception as e:
+            logger.warning(f"Impossible de vérifier le workflow {workflow_id}: {e}")
+            return True
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM workflows WHERE workflow_id = %s", (workflow_id,))
+                return cursor.fetchone() is not None
+        finally:
+            conn.close()
+
     def update_progress(self, workflow_id: str, progress: int, current_step: int):
         """Mettre à jour la progression d'un workflow"""
         conn = self._get_db_connection()
@@ -100,64 +111,147 @@ class WorkflowService:
     def save_to_minio(self, workflow_id: str, filename: str, content: str, 
                      compress: bool = True) -> Dict:
         """Sauvegarder du contenu dans MinIO"""
+        result = self.save_artifacts(workflow_id, {filename: content}, compress)
+        if not result['success']:
+            return {'success': False, 'error': result['errors'][filename]}
+        return result['files'][filename]
+
+    def save_artifacts(self, workflow_id: str, artifacts: Dict[str, str],
+                       compress: bool = True) -> Dict:
+        """
+        Sauvegarder tous les fichiers d'un workflow dans MinIO
+
+        Chaque contenu distinct (SHA-256) n'est compressé et envoyé qu'une fois :
+        les fichiers identiques (ex: pillar.html / article_main.html) deviennent
+        des entrées du manifest pointant vers le même objet. Les objets sont
+        nommés par leur contenu (<sha256>.gz) : réenregistrer un fichier avec
+        un autre contenu crée un nouvel objet au lieu d'écraser celui que ses
+        copies référencent encore. Compression et
+        uploads en parallèle (MINIO_UPLOAD_WORKERS threads, client MinIO
+        partagé), puis une seule mise à jour du workflow (stats + manifest).
+
+        Args:
+            workflow_id: ID du workflow
+            artifacts: Contenu par nom de fichier
+            compress: Compresser en gzip (suffixe .gz)
+
+        Returns:
+            {'success', 'files': {nom: résultat}, 'errors': {nom: erreur}}
+        """
         conn = self._get_db_connection()
         try:
             with conn.cursor() as cursor:
-                cursor.execute("SELECT minio_path FROM workflows WHERE workflow_id = %s", (workflow_id,))
+                cursor.execute("SELECT minio_path, manifest FROM workflows WHERE workflow_id = %s", (workflow_id,))
                 result = cursor.fetchone()
                 if not result:
                     raise ValueError(f"Workflow {workflow_id} introuvable")
-                
-                minio_path = result['minio_path']
-            
-            # Chemin dans MinIO
-            object_name = f"{minio_path}{filename}"
-            
-            # Compression si demandée
-            if compress:
-                content_bytes = content.encode('utf-8')
-                compressed = gzip.compress(content_bytes)
-                data = BytesIO(compressed)
-                size = len(compressed)
-                object_name += '.gz'
-            else:
-                data = BytesIO(content.encode('utf-8'))
-                size = len(content.encode('utf-8'))
-            
-            # Upload vers MinIO
-            self.client.put_object(
-                self.bucket,
-                object_name,
-                data,
-                size,
-                content_type='application/gzip' if compress else 'text/html'
-            )
-            
-            # Mettre à jour les stats du workflow
-            with conn.cursor() as cursor:
-                sql = """
-                UPDATE workflows 
-                SET files_count = files_count + 1,
-                    total_size_bytes = COALESCE(total_size_bytes, 0) + %s
-                WHERE workflow_id = %s
-                """
-                cursor.execute(sql, (size, workflow_id))
-            conn.commit()
-            
-            logger.info(f"Fichier {filename} sauvegardé dans MinIO pour {workflow_id}")
-            
-            return {
+        finally:
+            conn.close()  # Pas de connexion MySQL gardée pendant les uploads
+
+        minio_path = result['minio_path']
+        manifest = self._load_manifest(result)
+        suffix = '.gz' if compress else ''
+
+        # Objets déjà stockés pour ce workflow, par contenu
+        stored = {(entry['sha256'], entry['compressed']): entry for entry in manifest.values()}
+        digests = {}  # nom de fichier -> SHA-256
+        uploads = {}  # SHA-256 -> (fichier d'origine, contenu) à envoyer
+        for filename, content in artifacts.items():
+            data = content.encode('utf-8')
+            digest = hashlib.sha256(data).hexdigest()
+            digests[filename] = digest
+            if (digest, compress) not in stored and digest not in uploads:
+                uploads[digest] = (f"{filename}{suffix}", data)
+
+        def upload(item):
+            digest, (source, data) = item
+            name = f"{digest}{suffix}"
+            try:
+                size = self._put_artifact(f"{minio_path}{name}", data, compress)
+                return digest, {'object': name, 'sha256': digest, 'size': size, 'compressed': compress,
+                                'source': source}, None
+            except S3Error as e:
+                logger.error(f"Erreur upload MinIO ({name}): {e}")
+                return digest, None, str(e)
+
+        upload_errors = {}
+        uploaded_bytes = 0
+        if uploads:
+            workers = max(1, min(self.upload_workers, len(uploads)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for digest, entry, error in executor.map(upload, uploads.items()):
+                    if error is None:
+                        stored[(digest, compress)] = entry
+                        uploaded_bytes += entry['size']
+                    else:
+                        upload_errors[digest] = error
+
+        files, errors, entries = {}, {}, {}
+        for filename, digest in digests.items():
+            entry = stored.get((digest, compress))
+            if entry is None:
+                errors[filename] = upload_errors[digest]
+                continue
+
+            entries[f"{filename}{suffix}"] = entry
+            files[filename] = {
                 'success': True,
-                'object_name': object_name,
-                'size': size,
-                'compressed': compress
+                'object_name': f"{minio_path}{entry['object']}",
+                'size': entry['size'],
+                'compressed': compress,
+                'deduplicated': entry.get('source', entry['object']) != f"{filename}{suffix}"
             }
-        
-        except S3Error as e:
-            logger.error(f"Erreur upload MinIO: {e}")
-            return {'success': False, 'error': str(e)}
-        finally:
-            conn.close()
+
+        if entries:
+            # Stats + manifest du workflow (une requête pour tout le lot)
+            conn = self._get_db_connection()
+            try:
+                with conn.cursor() as cursor:
+                    sql = """
+                    UPDATE workflows 
+                    SET files_count = files_count + %s,
+                        total_size_bytes = COALESCE(total_size_bytes, 0) + %s,
+                        manifest = JSON_MERGE_PATCH(COALESCE(manifest, JSON_OBJECT()), %s)
+                    WHERE workflow_id = %s
+                    """
+                    new_files = len([name for name in entries if name not in manifest])
+                    cursor.execute(sql, (new_files, uploaded_bytes, json.dumps(entries), workflow_id))
+                conn.commit()
+            finally:
+                conn.close()
+
+        logger.info(
+            f"{len(files)}/{len(artifacts)} fichier(s) sauvegardé(s) dans MinIO pour {workflow_id} "
+            f"({len(uploads) - len(upload_errors)} objet(s) envoyé(s), {uploaded_bytes} octets)"
+        )
+
+        return {
+            'success': not errors,
+            'files': files,
+            'errors': errors
+        }
+
+    def _put_artifact(self, object_name: str, data: bytes, compress: bool) -> int:
+        """Compresser (si demandé) et envoyer un fichier vers MinIO, retourne la taille stockée"""
+        if compress:
+            data = gzip.compress(data)
+
+        self.client.put_object(
+            self.bucket,
+            object_name,
+            BytesIO(data),
+            len(data),
+            content_type='application/gzip' if compress else 'text/html'
+        )
+        return len(data)
+
+    @staticmethod
+    def _load_manifest(row: Dict) -> Dict[str, Dict]:
+        """Manifest d'une ligne workflows ({} pour les workflows antérieurs au manifest)"""
+        manifest = row.get('manifest')
+        if isinstance(manifest, str):
+            manifest = json.loads(manifest)
+        return manifest or {}
     
     def complete_workflow(self, workflow_id: str, result_data: Dict, 
                          generation_time: int, tokens_used: int = 0):
@@ -251,7 +345,7 @@ class WorkflowService:
             # Vérifier le workflow
             with conn.cursor() as cursor:
                 cursor.execute(
-                    "SELECT minio_path, workflow_type FROM workflows WHERE workflow_id = %s AND user_id = %s",
+                    "SELECT minio_path, workflow_type, manifest FROM workflows WHERE workflow_id = %s AND user_id = %s",
                     (workflow_id, user_id)
                 )
                 result = cursor.fetchone()
@@ -261,39 +355,27 @@ class WorkflowService:
                 
                 minio_path = result['minio_path']
                 workflow_type = result['workflow_type']
+                manifest = self._load_manifest(result)
             
-            # Lister les fichiers dans MinIO
+            # Fichiers du manifest (copies dédupliquées comprises), sinon listing MinIO
+            if manifest:
+                files = [
+                    dict(self._describe_file(filename), size=entry['size'])
+                    for filename, entry in sorted(manifest.items())  # Même ordre que list_objects
+                ]
+                return {
+                    'success': True,
+                    'files': files,
+                    'workflow_type': workflow_type
+                }
+
             try:
                 objects = self.client.list_objects(self.bucket, prefix=minio_path, recursive=True)
                 
                 files = []
                 for obj in objects:
                     filename = obj.object_name.replace(minio_path, '')
-                    
-                    # Déterminer le type
-                    if 'pillar' in filename:
-                        file_type = 'pillar'
-                        label = 'Article Pilier'
-                    elif 'satellite' in filename:
-                        sat_num = filename.split('_')[1].split('.')[0]
-                        file_type = 'satellite'
-                        label = f'Article Satellite {sat_num}'
-                    elif 'article_main' in filename:
-                        file_type = 'main'
-                        label = 'Article Principal'
-                    elif 'article_rewritten' in filename:
-                        file_type = 'rewritten'
-                        label = 'Article Réécrit'
-                    else:
-                        file_type = 'other'
-                        label = filename
-                    
-                    files.append({
-                        'filename': filename,
-                        'type': file_type,
-                        'label': label,
-                        'size': obj.size
-                    })
+                    files.append(dict(self._describe_file(filename), size=obj.size))
                 
                 return {
                     'success': True,
@@ -308,47 +390,188 @@ class WorkflowService:
         finally:
             conn.close()
 
+    @staticmethod
+    def _describe_file(filename: str) -> Dict:
+        """Type et libellé d'un fichier de workflow d'après son nom"""
+        if 'pillar' in filename:
+            file_type = 'pillar'
+            label = 'Article Pilier'
+        elif 'satellite' in filename:
+            sat_num = filename.split('_')[1].split('.')[0]
+            file_type = 'satellite'
+            label = f'Article Satellite {sat_num}'
+        elif 'article_main' in filename:
+            file_type = 'main'
+            label = 'Article Principal'
+        elif 'article_rewritten' in filename:
+            file_type = 'rewritten'
+            label = 'Article Réécrit'
+        else:
+            file_type = 'other'
+            label = filename
+        
+        return {
+            'filename': filename,
+            'type': file_type,
+            'label': label
+        }
+
     
-    def get_file_from_minio(self, workflow_id: str, filename: str, user_id: int) -> Dict:
-        """Récupérer un fichier depuis MinIO"""
+    def get_workflow_bundle(self, workflow_id: str, user_id: int) -> Dict:
+        """
+        Tous les articles d'un workflow avec leurs métadonnées, en un appel
+
+        Servi depuis le manifest (pas de listing MinIO) ; chaque objet distinct
+        est lu une seule fois, en parallèle. Les fichiers identiques (ex:
+        article_main.html / pillar.html) sont rattachés à un seul article.
+
+        Returns:
+            {'success', 'workflow_type', 'articles': [{filename, type, label, size,
+            content, metadata, aliases}]}
+        """
         conn = self._get_db_connection()
         try:
-            # Vérifier que le workflow appartient à l'utilisateur
             with conn.cursor() as cursor:
                 cursor.execute(
-                    "SELECT minio_path FROM workflows WHERE workflow_id = %s AND user_id = %s",
+                    "SELECT minio_path, workflow_type, manifest FROM workflows WHERE workflow_id = %s AND user_id = %s",
                     (workflow_id, user_id)
                 )
                 result = cursor.fetchone()
-                
-                if not result:
-                    return {'success': False, 'error': 'Workflow non trouvé'}
-                
-                minio_path = result['minio_path']
-            
-            # Télécharger depuis MinIO
-            object_name = f"{minio_path}{filename}"
-            
-            try:
-                response = self.client.get_object(self.bucket, object_name)
-                content_bytes = response.read()
-                
-                # Décompresser si .gz
-                if filename.endswith('.gz'):
-                    import gzip
-                    content = gzip.decompress(content_bytes).decode('utf-8')
-                else:
-                    content = content_bytes.decode('utf-8')
-                
-                return {
-                    'success': True,
-                    'content': content,
-                    'size': len(content_bytes)
+        finally:
+            conn.close()
+
+        if not result:
+            return {'success': False, 'error': 'Workflow non trouvé'}
+
+        minio_path = result['minio_path']
+        manifest = self._load_manifest(result)
+
+        try:
+            if not manifest:
+                # Workflow antérieur au manifest : un listing MinIO
+                manifest = {
+                    obj.object_name.replace(minio_path, ''): {'object': obj.object_name.replace(minio_path, ''), 'size': obj.size}
+                    for obj in self.client.list_objects(self.bucket, prefix=minio_path, recursive=True)
                 }
-                
-            except S3Error as e:
-                logger.error(f"Fichier introuvable dans MinIO: {e}")
-                return {'success': False, 'error': 'Fichier non trouvé'}
-        
+
+            objects = sorted({entry['object'] for entry in manifest.values()})
+            workers = max(1, min(self.upload_workers, len(objects)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                contents = dict(zip(objects, executor.map(lambda name: self._read_object(f"{minio_path}{name}"), objects)))
+        except S3Error as e:
+            logger.error(f"Erreur lecture MinIO pour {workflow_id}: {e}")
+            return {'success': False, 'error': 'Fichiers non trouvés'}
+
+        articles = {}  # objet -> article
+        # Le fichier d'origine de l'objet (source, ou nom de l'objet avant le nommage par contenu) passe avant ses copies
+        for filename, entry in sorted(manifest.items(),
+                                      key=lambda item: (item[1].get('source', item[1]['object']) != item[0], item[0])):
+            if '.html' not in filename:
+                continue
+
+            if entry['object'] in articles:
+                articles[entry['object']]['aliases'].append(filename)
+                continue
+
+            metadata_entry = manifest.get(self._metadata_filename(filename))
+            articles[entry['object']] = dict(
+                self._describe_file(filename),
+                size=entry['size'],
+                content=contents[entry['object']],
+                metadata=json.loads(contents[metadata_entry['object']]) if metadata_entry else None,
+                aliases=[]
+            )
+
+        return {
+            'success': True,
+            'workflow_type': result['workflow_type'],
+            'articles': sorted(articles.values(), key=lambda article: article['filename'])
+        }
+
+    def _read_object(self, object_name: str) -> str:
+        """Lire un objet MinIO en texte (décompressé si .gz)"""
+        response = self.client.get_object(self.bucket, object_name)
+        try:
+            data = response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+        if object_name.endswith('.gz'):
+            data = gzip.decompress(data)
+        return data.decode('utf-8')
+
+    @staticmethod
+    def _metadata_filename(filename: str) -> str:
+        """Fichier de métadonnées associé à un article"""
+        if 'satellite' in filename:
+            return filename.replace('.html', '_metadata.json')
+        suffix = '.gz' if filename.endswith('.gz') else ''
+        if 'pillar' in filename:
+            return f'pillar_metadata.json{suffix}'
+        return f'metadata.json{suffix}'
+
+    def locate_file(self, workflow_id: str, filename: str, user_id: int) -> Dict:
+        """
+        Vérifier que le workflow appartient à l'utilisateur et trouver l'objet MinIO d'un fichier
+
+        Returns:
+            {'success', 'object_name', 'sha256' (None hors manifest), 'size'}
+        """
+        conn = self._get_db_connection()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(
+                    "SELECT minio_path, manifest FROM workflows WHERE workflow_id = %s AND user_id = %s",
+                    (workflow_id, user_id)
+                )
+                result = cursor.fetchone()
         finally:
             conn.close()
+
+        if not result:
+            return {'success': False, 'error': 'Workflow non trouvé'}
+
+        # Un fichier dédupliqué pointe vers l'objet d'origine
+        entry = self._load_manifest(result).get(filename) or {}
+        return {
+            'success': True,
+            'object_name': f"{result['minio_path']}{entry.get('object', filename)}",
+            'sha256': entry.get('sha256'),
+            'size': entry.get('size')
+        }
+
+    def open_file(self, object_name: str):
+        """
+        Ouvrir un objet MinIO en flux, tel que stocké (gzip non décodé)
+
+        Returns:
+            Réponse urllib3 (stream(), headers) ; l'appelant appelle close() et release_conn()
+        """
+        return self.client.get_object(self.bucket, object_name)
+
+    def presigned_file_url(self, object_name: str, filename: str) -> str:
+        """
+        URL MinIO signée et temporaire (MINIO_PRESIGNED_EXPIRY secondes) pour un fichier
+
+        L'objet .gz est servi avec Content-Encoding: gzip : le navigateur le décode.
+        """
+        original_name = filename[:-3] if filename.endswith('.gz') else filename
+        response_headers = {'response-content-type': self.file_content_type(original_name)}
+        if filename.endswith('.gz'):
+            response_headers['response-content-encoding'] = 'gzip'
+
+        return self.client.presigned_get_object(
+            self.bucket,
+            object_name,
+            expires=timedelta(seconds=self.presigned_expiry),
+            response_headers=response_headers
+        )
+
+    @staticmethod
+    def file_content_type(filename: str) -> str:
+        """Type MIME d'un fichier de workflow (texte en UTF-8)"""
+        content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type == 'application/json':
+            content_type += '; charset=utf-8'
+        return content_type
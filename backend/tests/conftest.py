@@ -0,0 +1,11 @@
+"""
+Configuration pytest - mêmes chemins d'import que app.py
+Fichier: backend/tests/conftest.py
+"""
+
+import sys
+import os
+
+backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(backend_dir))
+sys.path.insert(0, backend_dir)
@@ -0,0 +1,63 @@
+"""
+Tests FetchService : une session aiohttp par event loop, libérée à la fermeture de la loop
+Fichier: backend/tests/test_fetch_service.py
+"""
+
+import gc
+import asyncio
+import weakref
+
+from services.fetch_service import FetchService
+
+
+async def _open_session(service):
+    return service.get_session()
+
+
+def test_session_reused_within_loop():
+    service = FetchService()
+
+    async def twice():
+        return service.get_session(), service.get_session()
+
+    first, second = asyncio.run(twice())
+    assert first is second
+    assert first.closed
+    assert len(service._sessions) == 0
+
+
+def test_sessions_released_after_loop_close():
+    service = FetchService()
+    loops, sessions = [], []
+
+    for _ in range(5):
+        # Comme /api/preview-article : une loop créée pour la requête, puis fermée
+        loop = asyncio.new_event_loop()
+        session = loop.run_until_complete(_open_session(service))
+        loop.close()
+
+        assert session.closed
+        loops.append(weakref.ref(loop))
+        sessions.append(weakref.ref(session))
+        del loop, session
+
+    gc.collect()
+    assert len(service._sessions) == 0
+    assert all(ref() is None for ref in sessions)
+    assert all(ref() is None for ref in loops)
+
+
+def test_closed_session_replaced():
+    service = FetchService()
+    loop = asyncio.new_event_loop()
+    try:
+        first = loop.run_until_complete(_open_session(service))
+        loop.run_until_complete(first.close())
+        second = loop.run_until_complete(_open_session(service))
+        assert second is not first
+        assert len(service._sessions) == 1
+    finally:
+        loop.close()
+
+    assert second.closed
+    assert len(service._sessions) == 0
@@ -0,0 +1,124 @@
+"""
+Tests du parseur de sections <TAG>...</TAG> (utils/tagged_sections)
+Équivalence avec l'ancien parcours find() et cas aléatoires : réponses
+tronquées, balises fermantes manquantes, découpage en morceaux du streaming
+Fichier: backend/tests/test_tagged_sections.py
+"""
+
+import random
+
+import pytest
+
+from utils.tagged_sections import SectionStream, parse_sections
+from scripts.benchmark_tagged_sections import TAGS, build_response, legacy_parse
+
+SEEDS = range(20)
+
+
+def stream_in_chunks(text: str, rng: random.Random, max_size: int = 40) -> SectionStream:
+    """Passer la réponse au SectionStream en morceaux de taille aléatoire"""
+    stream = SectionStream(TAGS)
+    position = 0
+    while position < len(text):
+        size = rng.randint(1, max_size)
+        stream.feed(text[position:position + size])
+        position += size
+    stream.finish()
+    return stream
+
+
+@pytest.mark.parametrize('size_kb', [0.5, 2, 8, 60])
+def test_complete_response_matches_legacy_parse(size_kb):
+    text, expected = build_response(size_kb, random.Random(42))
+
+    sections, recovered = parse_sections(text, TAGS)
+
+    assert sections == legacy_parse(text, TAGS) == expected
+    assert recovered == []
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_chunked_stream_matches_single_parse(seed):
+    rng = random.Random(seed)
+    text, _ = build_response(rng.choice([0.5, 2, 8]), rng)
+
+    stream = stream_in_chunks(text, rng)
+
+    assert (stream.sections, stream.recovered) == parse_sections(text, TAGS)
+
+
+def test_tag_split_at_every_position():
+    """Une balise coupée entre deux morceaux est reportée au morceau suivant"""
+    text, expected = build_response(0.5, random.Random(3))
+    start = text.index('</META_DESCRIPTION>') - 5
+
+    for cut in range(start, start + 50):
+        stream = SectionStream(TAGS)
+        stream.feed(text[:cut])
+        stream.feed(text[cut:])
+        stream.finish()
+        assert stream.sections == expected, f'coupure en {cut}'
+        assert stream.recovered == []
+
+
+@pytest.mark.parametrize('seed', SEEDS)
+def test_truncated_response_keeps_complete_sections(seed):
+    """max_tokens atteint : sections complètes intactes, seule la dernière peut être partielle"""
+    rng = random.Random(seed)
+    text, expected = build_response(rng.choice([0.5, 2, 8]), rng)
+    text = text[:rng.randint(0, len(text))]
+
+    sections, recovered = parse_sections(text, TAGS)
+
+    assert len(recovered) <= 1
+    for tag, content in sections.items():
+        if tag in recovered:
+            assert expected[tag].startswith(content)
+        else:
+            assert content == expected[tag]
+
+    stream = stream_in_chunks(text, rng)
+    assert (stream.sections, stream.recovered) == (sections, recovered)
+
+
+@pytest.mark.parametrize('tag', TAGS)
+def test_truncated_inside_closing_tag(tag):
+    """Texte coupé au milieu d'une balise fermante : le début de balise n'est pas du contenu"""
+    text, expected = build_response(0.5, random.Random(5))
+    end = text.index(f'</{tag}>')
+
+    for length in range(1, len(tag) + 3):
+        sections, recovered = parse_sections(text[:end + length], TAGS)
+        assert sections[tag] == expected[tag]
+        assert recovered == [tag]
+
+
+@pytest.mark.parametrize('dropped', TAGS)
+def test_missing_close_tag_ends_at_next_section(dropped):
+    text, expected = build_response(2, random.Random(11))
+    text = text.replace(f'</{dropped}>', '')
+
+    sections, recovered = parse_sections(text, TAGS)
+
+    assert sections == expected
+    assert recovered == [dropped]
+
+    stream = stream_in_chunks(text, random.Random(dropped))
+    assert (stream.sections, stream.recovered) == (sections, recovered)
+
+
+def test_on_section_called_as_sections_close():
+    text, expected = build_response(0.5, random.Random(13))
+    closed = []
+
+    split = text.index('</HTML_CONTENT>') + len('</HTML_CONTENT>')
+
+    stream = SectionStream(TAGS, on_section=lambda tag, content: closed.append((tag, content)))
+    stream.feed(text[:split])
+
+    assert [tag for tag, _ in closed] == TAGS[:TAGS.index('HTML_CONTENT') + 1]
+    assert stream.partial('FAQ_SECTION') is None
+
+    stream.feed(text[split:])
+    stream.finish()
+    assert dict(closed) == expected
@@ -0,0 +1,198 @@
+"""
+HTML Extractor - Extraction rapide de contenu HTML avec lxml
+Fichier: backend/utils/html_extractor.py
+"""
+
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+import lxml.html
+from lxml import etree
+
+# Éléments ignorés lors du scraping d'une page de site
+PAGE_SKIP_TAGS = ('script', 'style', 'nav', 'footer', 'header')
+
+# Éléments ignorés lors de l'extraction d'un article
+ARTICLE_SKIP_TAGS = PAGE_SKIP_TAGS + ('aside', 'iframe', 'noscript', 'form')
+
+HEADING_TAGS = ('h1', 'h2', 'h3')
+
+# Ordre de préférence des blocs de contenu principal
+MAIN_CONTENT_SLOTS = ('article', 'main', 'div_class', 'div_id', 'body')
+
+
+def parse_html(html: str):
+    """Construire l'arbre lxml d'un document (None si vide ou illisible)"""
+    if not html or not html.strip():
+        return None
+
+    try:
+        return lxml.html.document_fromstring(html)
+    except ValueError:
+        # Chaîne unicode avec déclaration d'encodage XML
+        return lxml.html.document_fromstring(html.encode('utf-8'))
+    except etree.ParserError:
+        return None
+
+
+def _main_content_slot(tag: str, element) -> Optional[str]:
+    """Retourner le type de bloc principal que représente un élément (ou None)"""
+    if tag in ('article', 'main', 'body'):
+        return tag
+
+    if tag == 'div':
+        css_class = (element.get('class') or '').lower()
+        if 'content' in css_class or 'article' in css_class:
+            return 'div_class'
+
+        element_id = (element.get('id') or '').lower()
+        if 'content' in element_id or 'article' in element_id:
+            return 'div_id'
+
+    return None
+
+
+def extract_page(html: str,
+                 base_url: str = '',
+                 skip_tags: Iterable[str] = PAGE_SKIP_TAGS,
+                 main_content: bool = False) -> Dict[str, Any]:
+    """
+    Extraire en un seul parcours de l'arbre : titre, meta description,
+    titres h1-h3, texte, images et (optionnellement) le bloc de contenu principal
+
+    Args:
+        html: Code HTML de la page
+        base_url: URL de la page (pour résoudre les src d'images)
+        skip_tags: Éléments ignorés (avec leur contenu)
+        main_content: Détecter le bloc principal (article, main, div content/article, body)
+
+    Returns:
+        Dictionnaire avec title, meta_description, headings, text, images et main
+        (main = {'h1', 'text', 'html'} ou None)
+    """
+    result = {
+        'title': '',
+        'meta_description': '',
+        'headings': {tag: [] for tag in HEADING_TAGS},
+        'text': '',
+        'images': [],
+        'main': None
+    }
+
+    root = parse_html(html)
+    if root is None:
+        return result
+
+    skip_tags = frozenset(skip_tags)
+    chunks: List[str] = []
+    skipped = []
+    skip_depth = 0
+    title_found = False
+    meta_found = False
+
+    # Blocs candidats : premier élément rencontré pour chaque type
+    candidates: Dict[str, Dict[str, Any]] = {}
+    open_candidates: List[Dict[str, Any]] = []
+
+    for event, element in etree.iterwalk(root, events=('start', 'end')):
+        tag = element.tag
+        is_element = isinstance(tag, str)  # Exclut commentaires et instructions
+
+        if event == 'start':
+            if skip_depth:
+                if is_element and tag in skip_tags:
+                    skip_depth += 1
+                continue
+
+            if is_element and tag in skip_tags:
+                skip_depth = 1
+                skipped.append(element)
+                continue
+
+            if not is_element:
+                continue
+
+            if tag == 'title' and not title_found:
+                result['title'] = element.text_content().strip()
+                title_found = True
+            elif tag == 'meta' and not meta_found and (element.get('name') or '').lower() == 'description':
+                result['meta_description'] = element.get('content', '')
+                meta_found = True
+            elif tag in HEADING_TAGS:
+                heading_text = element.text_content().strip()
+                result['headings'][tag].append(heading_text)
+                if tag == 'h1':
+                    for candidate in open_candidates:
+                        if candidate['h1'] is None:
+                            candidate['h1'] = heading_text
+            elif tag == 'img':
+                src = element.get('src')
+                if src:
+                    result['images'].append({
+                        'src': urljoin(base_url, src),
+                        'alt': element.get('alt', '')
+                    })
+
+            if main_content:
+                slot = _main_content_slot(tag, element)
+                if slot and slot not in candidates:
+                    candidate = {'element': element, 'start': len(chunks), 'end': None, 'h1': None}
+                    candidates[slot] = candidate
+                    open_candidates.append(candidate)
+
+            if element.text:
+                chunks.append(element.text)
+
+        else:  # end
+            if skip_depth:
+                if is_element and tag in skip_tags:
+                    skip_depth -= 1
+                    if skip_depth == 0 and element.tail:
+                        chunks.append(element.tail)
+                continue
+
+            if open_candidates and open_candidates[-1]['element'] is element:
+                open_candidates.pop()['end'] = len(chunks)
+
+            if element.tail and element is not root:
+                chunks.append(element.tail)
+
+    result['text'] = ' '.join(''.join(chunks).split())
+
+    if main_content:
+        main = next((candidates[slot] for slot in MAIN_CONTENT_SLOTS if slot in candidates), None)
+
+        # Retirer les éléments ignorés pour sérialiser le bloc principal
+        for element in skipped:
+            element.drop_tree()
+
+        if main is not None:
+            main_element = main['element']
+            main_text = ''.join(chunks[main['start']:main['end']])
+        else:
+            main_element = root
+            main_text = ''.join(chunks)
+
+        result['main'] = {
+            'h1': main['h1'] if main is not None else (result['headings']['h1'] or [None])[0],
+            'text': ' '.join(main_text.split()),
+            'html': lxml.html.tostring(main_element, encoding='unicode', with_tail=False)
+        }
+
+    return result
+
+
+def extract_text(html: str) -> str:
+    """Texte brut d'un fragment HTML (espaces normalisés)"""
+    root = parse_html(html)
+    if root is None:
+        return ''
+    return ' '.join(root.text_content().split())
+
+
+def count_words(html: str) -> int:
+    """Compter les mots d'un contenu HTML (hors balises)"""
+    root = parse_html(html)
+    if root is None:
+        return 0
+    return len(root.text_content().split())
@@ -0,0 +1,61 @@
+"""
+Loop Resources - Ressources asynchrones (sessions, clients) rattachées à une event loop
+Fichier: backend/utils/loop_resources.py
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LoopResources:
+    """
+    Une ressource par event loop, fermée et oubliée quand sa loop se ferme
+
+    Les entrées sont indexées par id(loop) : une session aiohttp ou un client
+    httpx garde une référence forte vers sa loop, une WeakKeyDictionary ne
+    les libérerait donc jamais. loop.close() est enveloppé pour attendre
+    closer(ressource) sur la loop avant sa fermeture, puis retirer l'entrée
+    (cas des routes Flask qui créent une loop par requête sous gevent).
+    """
+
+    def __init__(self, closer: Callable[[Any], Awaitable[None]]):
+        self.closer = closer
+        self._entries: Dict[int, Any] = {}
+
+    def get(self) -> Optional[Any]:
+        """Ressource de la loop courante, None si aucune"""
+        return self._entries.get(id(asyncio.get_running_loop()))
+
+    def set(self, resource: Any):
+        """Rattacher une ressource à la loop courante"""
+        loop = asyncio.get_running_loop()
+        key = id(loop)
+        watched = key in self._entries
+        self._entries[key] = resource
+        if not watched:
+            self._watch(loop, key)
+
+    def pop(self) -> Optional[Any]:
+        """Détacher la ressource de la loop courante (sans la fermer)"""
+        return self._entries.pop(id(asyncio.get_running_loop()), None)
+
+    def _watch(self, loop: asyncio.AbstractEventLoop, key: int):
+        close_loop = loop.close
+
+        def close():
+            resource = self._entries.pop(key, None)
+            if resource is not None and not loop.is_closed() and not loop.is_running():
+                try:
+                    loop.run_until_complete(self.closer(resource))
+                except Exception as e:
+                    logger.warning(f"Closing loop resource failed: {e}")
+            loop.close = close_loop
+            close_loop()
+
+        loop.close = close
+
+    def __len__(self) -> int:
+        return len(self._entries)
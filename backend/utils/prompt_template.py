@@ -0,0 +1,118 @@
+"""
+Prompt Template - Templates de prompts compilés, rendus en un seul passage
+Fichier: backend/utils/prompt_template.py
+"""
+
+import re
+import logging
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Variable de template : {NOM_EN_MAJUSCULES}
+PLACEHOLDER_RE = re.compile(r'\{([A-Z][A-Z0-9_]*)\}')
+
+# Variables identiques d'une requête à l'autre (sur la durée du cache de prompt)
+STABLE_VARIABLES = frozenset({'CURRENT_DATE'})
+
+
+class PromptTemplate:
+    """
+    Template découpé une fois en segments littéraux et variables
+
+    Le rendu assemble les segments en un seul ''.join : les valeurs ne sont
+    jamais ré-analysées (une valeur contenant {KEYWORD} reste telle quelle).
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.literals: List[str] = []  # len(literals) == len(names) + 1
+        self.names: List[str] = []
+
+        position = 0
+        for match in PLACEHOLDER_RE.finditer(source):
+            self.literals.append(source[position:match.start()])
+            self.names.append(match.group(1))
+            position = match.end()
+        self.literals.append(source[position:])
+
+        self.variables = frozenset(self.names)
+
+    def render(self, variables: Dict[str, Any],
+               specs: Optional[Dict[str, Dict[str, Any]]] = None) -> str:
+        """
+        Injecter les variables dans le template
+
+        Args:
+            variables: Valeurs par nom de variable
+            specs: Définitions de prompt_variables (is_required, default_value) par nom
+
+        Returns:
+            Prompt final ; une variable sans valeur ni défaut reste {NOM}
+        """
+        values = self._values(variables, specs)
+        return self._join(values, 0, len(self.names))
+
+    def render_split(self, variables: Dict[str, Any],
+                     specs: Optional[Dict[str, Dict[str, Any]]] = None,
+                     stable: frozenset = STABLE_VARIABLES) -> Tuple[str, str]:
+        """
+        Rendre le template en deux blocs : consignes fixes et contexte de la requête
+
+        Le template est coupé après sa dernière variable propre à la requête.
+        La suite (règles de rédaction, format de sortie) ne dépend que de
+        variables stables : envoyée en bloc system, elle est mise en cache par
+        l'API et réutilisée d'un appel à l'autre.
+
+        Args:
+            variables: Valeurs par nom de variable
+            specs: Définitions de prompt_variables (is_required, default_value) par nom
+            stable: Variables qui peuvent rester dans le bloc fixe
+
+        Returns:
+            (consignes, contexte) ; consignes vide si le template finit par une variable de requête
+        """
+        values = self._values(variables, specs)
+        cut = max((i + 1 for i, name in enumerate(self.names) if name not in stable), default=0)
+        if cut == 0:
+            return '', self._join(values, 0, len(self.names))
+
+        return self._join(values, cut, len(self.names)).strip(), self._join(values, 0, cut, tail=False).strip()
+
+    def _values(self, variables: Dict[str, Any],
+                specs: Optional[Dict[str, Dict[str, Any]]]) -> Dict[str, str]:
+        """Valeurs de toutes les variables du template (défauts, {NOM} si absente)"""
+        values = {name: str(value) for name, value in variables.items() if name in self.variables}
+        missing = self.variables.difference(values)
+
+        for name in sorted(missing):
+            spec = (specs or {}).get(name) or {}
+            if spec.get('default_value') is not None:
+                values[name] = str(spec['default_value'])
+                continue
+
+            if spec.get('is_required'):
+                logger.warning(f"Required prompt variable missing: {name}")
+            values[name] = f'{{{name}}}'
+
+        return values
+
+    def _join(self, values: Dict[str, str], start: int, end: int, tail: bool = True) -> str:
+        """Assembler les variables start..end-1 entre leurs littéraux (tail: avec le littéral final)"""
+        parts = [self.literals[start]]
+        for i in range(start, end):
+            parts.append(values[self.names[i]])
+            if tail or i < end - 1:
+                parts.append(self.literals[i + 1])
+        return ''.join(parts)
+
+    def undeclared(self, specs: Dict[str, Dict[str, Any]]) -> List[str]:
+        """Variables du template absentes de prompt_variables"""
+        return sorted(self.variables.difference(specs))
+
+
+@lru_cache(maxsize=32)
+def compile_template(source: str) -> PromptTemplate:
+    """Compiler un template (mis en cache : un template n'est analysé qu'une fois)"""
+    return PromptTemplate(source)
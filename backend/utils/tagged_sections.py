@@ -0,0 +1,115 @@
+"""
+Tagged Sections - Lecture des réponses LLM balisées <SECTION>...</SECTION>
+Fichier: backend/utils/tagged_sections.py
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Balise de section : <NOM> ou </NOM>
+TAG_RE = re.compile(r'<(/?)([A-Z][A-Z0-9_]*)>')
+
+
+class SectionStream:
+    """
+    Découpage incrémental d'une réponse en sections, au fil du streaming
+
+    Chaque morceau de texte reçu n'est parcouru qu'une fois ; une balise coupée
+    entre deux morceaux est reportée au morceau suivant. Dès qu'une section se
+    ferme, on_section(nom, contenu) est appelé : la suite du traitement peut
+    démarrer sans attendre la fin de la génération.
+    """
+
+    def __init__(self, tags: Iterable[str],
+                 on_section: Optional[Callable[[str, str], None]] = None):
+        self.tags = frozenset(tags)
+        self.on_section = on_section
+
+        self.sections: Dict[str, str] = {}  # Sections fermées, dans l'ordre d'arrivée
+        self.current: Optional[str] = None  # Section ouverte
+        self.recovered: List[str] = []  # Sections sans balise fermante, gardées telles quelles
+        self._parts: List[str] = []  # Contenu reçu de la section ouverte
+        self._carry = ''  # Début de balise en fin de morceau
+        self._max_tag_length = max((len(tag) for tag in self.tags), default=0) + 3  # </NOM>
+
+    def feed(self, text: str):
+        """Ajouter un morceau de la réponse"""
+        data = self._carry + text
+        self._carry = ''
+        position = 0
+
+        for match in TAG_RE.finditer(data):
+            closing, name = match.groups()
+            if name not in self.tags:
+                continue
+
+            if self.current is not None:
+                self._parts.append(data[position:match.start()])
+            position = match.end()
+
+            if closing:
+                if name == self.current:
+                    self._close()
+            elif name not in self.sections:
+                if self.current is not None:
+                    self._close(recovered=True)  # Fermeture manquante : la section suivante la termine
+                self.current = name
+                self._parts = []
+
+        rest = data[position:]
+        # Garder un éventuel début de balise (ex: '</HTML_CON') pour le prochain morceau
+        start = rest.rfind('<')
+        if start != -1 and '>' not in rest[start:] and len(rest) - start < self._max_tag_length:
+            self._carry = rest[start:]
+            rest = rest[:start]
+
+        if self.current is not None:
+            self._parts.append(rest)
+
+    def finish(self):
+        """Fin de la réponse : garder la section restée ouverte (max_tokens atteint)"""
+        if self.current is not None:
+            # Texte coupé au milieu d'une balise (ex: '</FAQ_JS') : ce n'est pas du contenu
+            if not any(marker.startswith(self._carry) for tag in self.tags for marker in (f'<{tag}>', f'</{tag}>')):
+                self._parts.append(self._carry)
+            self._carry = ''
+            self._close(recovered=True)
+
+    def partial(self, tag: str) -> Optional[str]:
+        """Contenu d'une section, même encore ouverte (None si pas commencée)"""
+        if tag in self.sections:
+            return self.sections[tag]
+        if tag == self.current:
+            return ''.join(self._parts).strip()
+        return None
+
+    def _close(self, recovered: bool = False):
+        name, content = self.current, ''.join(self._parts).strip()
+        self.sections[name] = content
+        if recovered:
+            self.recovered.append(name)
+        self.current = None
+        self._parts = []
+
+        if self.on_section:
+            self.on_section(name, content)
+
+
+def parse_sections(text: str, tags: Iterable[str]) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Découper une réponse complète en sections, en un seul parcours
+
+    Une section sans balise fermante (réponse tronquée par max_tokens, balise
+    oubliée) est gardée jusqu'à la section suivante ou la fin du texte.
+
+    Args:
+        text: Réponse du LLM
+        tags: Noms des sections attendues (ex: 'SEO_TITLE')
+
+    Returns:
+        (sections nom -> contenu, noms des sections récupérées sans balise fermante)
+    """
+    stream = SectionStream(tags)
+    stream.feed(text)
+    stream.finish()
+    return stream.sections, stream.recovered
@@ -0,0 +1,61 @@
+"""
+Early image generation for streamed articles
+The image prompt only needs the article title and first paragraph, so the image can start
+as soon as HTML_CONTENT is streamed instead of after the whole LLM response
+"""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class EarlyImage:
+    """Featured image of one article, started from its streamed sections when possible"""
+
+    def __init__(self, image_gen, user_requirements: Dict[str, Any]):
+        self.image_gen = image_gen
+        self.user_requirements = user_requirements
+        self.task: Optional[asyncio.Future] = None
+        self._title = None
+
+    def on_section(self, tag: str, content: str):
+        """SectionStream callback: start the image once the title and HTML body are known"""
+        if tag == 'SEO_TITLE':
+            self._title = content
+        elif tag == 'HTML_CONTENT' and self._title is not None:
+            logger.info(f"Starting image generation mid-stream for: {self._title}")
+            self.start({'seo_title': self._title, 'html_content': content})
+
+    def start(self, article: Dict[str, Any]):
+        """Start the image from the article data, unless it is already running"""
+        if self.task is None:
+            self.task = asyncio.ensure_future(self.image_gen.generate_image(
+                article_data=article,
+                user_requirements=self.user_requirements
+            ))
+
+    async def result(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """Wait for the image (started from the final article if the stream did not start it)"""
+        self.start(article)
+        return await self.task
+
+    async def apply(self, article: Dict[str, Any]) -> Dict[str, Any]:
+        """Wait for the image and store image_url / image_prompt on the article"""
+        image_result = await self.result(article)
+
+        if image_result.get('success'):
+            article['image_url'] = image_result['image_url']
+            article['image_prompt'] = image_result.get('prompt_used', '')
+        else:
+            article['image_url'] = None
+            article['image_prompt'] = ''
+            logger.warning(f"Image generation failed for {article.get('seo_title', 'article')}")
+
+        return image_result
+
+    def cancel(self):
+        """Cancel the image if it is still running (article generation failed)"""
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
@@ -0,0 +1,73 @@
+"""
+Task Graph for workflow orchestration
+Runs workflow steps as a small dependency DAG: each task starts as soon as its dependencies complete
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterable
+
+
+class TaskGraph:
+    """Small asyncio dependency graph used by the workflow managers"""
+
+    def __init__(self):
+        self._nodes = {}
+
+    def add(self,
+            name: str,
+            func: Callable[..., Awaitable[Any]],
+            depends_on: Iterable[str] = ()) -> 'TaskGraph':
+        """
+        Register a task
+
+        Args:
+            name: Unique task name
+            func: Coroutine function, called with the results of its dependencies (in order)
+            depends_on: Names of tasks that must complete first (must already be registered)
+
+        Returns:
+            The graph itself, for chaining
+        """
+        depends_on = tuple(depends_on)
+
+        if name in self._nodes:
+            raise ValueError(f"Task '{name}' already registered")
+
+        # Dependencies must be registered first, which keeps the graph acyclic
+        for dep in depends_on:
+            if dep not in self._nodes:
+                raise ValueError(f"Task '{name}' depends on unknown task '{dep}'")
+
+        self._nodes[name] = (func, depends_on)
+        return self
+
+    async def run(self) -> Dict[str, Any]:
+        """
+        Run every task, independent branches concurrently
+
+        Returns:
+            Dictionary mapping task names to their results
+
+        Raises:
+            The first exception raised by a task; the remaining tasks are cancelled
+        """
+        tasks = {}
+
+        async def run_node(name: str) -> Any:
+            func, depends_on = self._nodes[name]
+            dep_results = [await tasks[dep] for dep in depends_on]
+            return await func(*dep_results)
+
+        for name in self._nodes:
+            tasks[name] = asyncio.ensure_future(run_node(name))
+
+        try:
+            await asyncio.gather(*tasks.values())
+        except BaseException:
+            for task in tasks.values():
+                task.cancel()
+            # Let cancelled tasks unwind before propagating the error
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+            raise
+
+        return {name: task.result() for name, task in tasks.items()}
@@ -7,21 +7,40 @@ import os
 import time
 import json
 import logging
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from anthropic import Anthropic
-import pymysql
+from services.llm_service import get_llm_service
+from services.template_cache import get_template_cache
+from utils.prompt_template import compile_template
+from utils.html_extractor import count_words
+from utils.tagged_sections import SectionStream
 
 logger = logging.getLogger(__name__)
 
 class ArticleGenerator:
     """Generates optimized articles using Claude with 4-expert approach: SEO, People First, LLMO, RAG"""
 
+    # Tagged sections of the Claude response (parsed key -> tag)
+    SECTIONS = {
+        'seo_title': 'SEO_TITLE',
+        'meta_description': 'META_DESCRIPTION',
+        'wordpress_excerpt': 'WORDPRESS_EXCERPT',
+        'html_content': 'HTML_CONTENT',
+        'faq_section': 'FAQ_SECTION',
+        'faq_json': 'FAQ_JSON',
+        'secondary_keywords': 'SECONDARY_KEYWORDS',
+        'entities': 'ENTITIES',
+        'internal_links_used': 'INTERNAL_LINKS_USED',
+        'schema_markup': 'SCHEMA_MARKUP',
+        'readability_score': 'READABILITY_SCORE'
+    }
+
     def __init__(self, workflow_id=1):
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.llm = get_llm_service()
         self.model = "claude-sonnet-4-5-20250929"  # Claude Sonnet 4.5
         self.max_tokens = 16000  # Increased to ensure all sections are generated
         self.workflow_id = workflow_id
+        self.templates = get_template_cache()
 
         # Ancienne méthode (fichiers) - conservée en fallback
         self.template_path = os.path.join(
@@ -33,7 +52,8 @@ class ArticleGenerator:
     async def generate_article(self,
                               scraped_data: Dict[str, Any],
                               analysis_data: Dict[str, Any],
-                              user_requirements: Dict[str, Any]) -> Dict[str, Any]:
+                              user_requirements: Dict[str, Any],
+                              on_section: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
         """
         Generate a complete SEO-optimized article based on scraped data and analysis
 
@@ -41,6 +61,7 @@ class ArticleGenerator:
             scraped_data: Output from website scraper (step 1)
             analysis_data: Output from content analyzer (step 2)
             user_requirements: User input (keyword, domain, guideline, links)
+            on_section: Called with (tag, content) as each section finishes streaming
 
         Returns:
             Complete article with metadata, SEO elements, and HTML content
@@ -50,24 +71,28 @@ class ArticleGenerator:
 
         try:
             # Build the generation prompt with 4-expert approach
-            generation_prompt = self._build_generation_prompt(
+            instructions, generation_prompt = self._build_generation_prompt(
                 scraped_data=scraped_data,
                 analysis_data=analysis_data,
                 user_requirements=user_requirements
             )
 
-            # Call Claude API
-            response = self.client.messages.create(
+            # Call Claude API (streamed: sections are reported as soon as they close)
+            sections = SectionStream(self.SECTIONS.values(), on_section=on_section)
+            response = await self.llm.stream_message(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=0.7,  # Balance between creativity and consistency
+                system=instructions,
                 messages=[
                     {
                         "role": "user",
                         "content": generation_prompt
                     }
-                ]
+                ],
+                on_text=sections.feed
             )
+            sections.finish()
 
             article_content = response.content[0].text
 
@@ -76,7 +101,7 @@ class ArticleGenerator:
             logger.info(f"Claude response length: {len(article_content)} characters")
 
             # Parse the structured article response
-            parsed_article = self._parse_article_response(article_content)
+            parsed_article = self._parse_article_response(sections.sections, sections.recovered)
 
             # Debug logging
             logger.info(f"Parsed FAQ JSON: {parsed_article.get('faq_json', 'NOT FOUND')}")
@@ -112,7 +137,8 @@ class ArticleGenerator:
                     'word_count': self._count_words(parsed_article.get('html_content', '')),
                     'tokens_used': response.usage.input_tokens + response.usage.output_tokens,
                     'input_tokens': response.usage.input_tokens,
-                    'output_tokens': response.usage.output_tokens
+                    'output_tokens': response.usage.output_tokens,
+                    'cache_read_input_tokens': getattr(response.usage, 'cache_read_input_tokens', 0) or 0
                 },
                 'raw_output': article_content  # For debugging purposes
             }
@@ -131,8 +157,8 @@ class ArticleGenerator:
     def _build_generation_prompt(self,
                                  scraped_data: Dict[str, Any],
                                  analysis_data: Dict[str, Any],
-                                 user_requirements: Dict[str, Any]) -> str:
-        """Build the comprehensive generation prompt with 4-expert methodology using template"""
+                                 user_requirements: Dict[str, Any]) -> Tuple[str, str]:
+        """Build the 4-expert generation prompt from the template: (fixed instructions, request context)"""
 
         # Extract key data
         insights = analysis_data.get('insights', {})
@@ -152,8 +178,7 @@ class ArticleGenerator:
             template = self._load_template_from_db()
             if not template:
                 logger.warning("No template found in database, falling back to file")
-                with open(self.template_path, 'r', encoding='utf-8') as f:
-                    template = f.read()
+                template = self.templates.read_file(self.template_path)
         except Exception as e:
             logger.error(f"Failed to load template: {e}")
             raise Exception(f"Template loading failed: {e}")
@@ -176,51 +201,14 @@ class ArticleGenerator:
             'CURRENT_DATE': datetime.now().strftime('%Y-%m-%d')
         }
 
-        # Inject variables into template
-        prompt = template
-        for key, value in variables.items():
-            prompt = prompt.replace(f'{{{key}}}', str(value))
-
-        return prompt
+        # Inject variables: instructions after the last request variable become the cached system block
+        return compile_template(template).render_split(
+            variables, self.templates.get_variable_specs(self.workflow_id)
+        )
 
     def _load_template_from_db(self) -> str:
         """Load the active template for this workflow from the database"""
-        try:
-            conn = pymysql.connect(
-                host=os.getenv('DB_HOST'),
-                port=int(os.getenv('DB_PORT', 3306)),
-                user=os.getenv('DB_USER'),
-                password=os.getenv('DB_PASSWORD'),
-                database=os.getenv('DB_NAME'),
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT content, version
-                    FROM prompt_templates
-                    WHERE workflow_id = %s AND is_active = TRUE
-                    ORDER BY version DESC
-                    LIMIT 1
-                """, (self.workflow_id,))
-
-                result = cursor.fetchone()
-
-                if result:
-                    logger.info(f"Loaded template from database: workflow {self.workflow_id}, version {result['version']}")
-                    return result['content']
-                else:
-                    logger.warning(f"No active template found in database for workflow {self.workflow_id}")
-                    return None
-
-        except Exception as e:
-            logger.error(f"Failed to load template from database: {e}")
-            return None
-
-        finally:
-            if conn:
-                conn.close()
+        return self.templates.get_active(self.workflow_id)
 
     def _format_list(self, items: List[str], prefix: str = '') -> str:
         """Format a list of items for the prompt"""
@@ -249,34 +237,18 @@ class ArticleGenerator:
 
         return '\n'.join(formatted)
 
-    def _parse_article_response(self, response: str) -> Dict[str, Any]:
+    def _parse_article_response(self, sections: Dict[str, str], recovered: List[str]) -> Dict[str, Any]:
         """Parse the structured article response from Claude"""
         parsed = {}
 
-        # Define sections to extract
-        sections = {
-            'seo_title': 'SEO_TITLE',
-            'meta_description': 'META_DESCRIPTION',
-            'wordpress_excerpt': 'WORDPRESS_EXCERPT',
-            'html_content': 'HTML_CONTENT',
-            'faq_section': 'FAQ_SECTION',
-            'faq_json': 'FAQ_JSON',
-            'secondary_keywords': 'SECONDARY_KEYWORDS',
-            'entities': 'ENTITIES',
-            'internal_links_used': 'INTERNAL_LINKS_USED',
-            'schema_markup': 'SCHEMA_MARKUP',
-            'readability_score': 'READABILITY_SCORE'
-        }
+        # Sections from the stream; those cut off by max_tokens are kept as far as they go
+        if recovered:
+            logger.warning(f"Recovered article sections without closing tag: {', '.join(recovered)}")
 
-        for key, tag in sections.items():
+        for key, tag in self.SECTIONS.items():
             try:
-                start_tag = f"<{tag}>"
-                end_tag = f"</{tag}>"
-                start_idx = response.find(start_tag)
-                end_idx = response.find(end_tag)
-
-                if start_idx != -1 and end_idx != -1:
-                    content = response[start_idx + len(start_tag):end_idx].strip()
+                if tag in sections:
+                    content = sections[tag]
 
                     # Special handling for different types
                     if key == 'secondary_keywords':
@@ -325,13 +297,4 @@ class ArticleGenerator:
 
     def _count_words(self, html_content: str) -> int:
         """Count words in HTML content (excluding tags)"""
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text = soup.get_text()
-            words = text.split()
-            return len(words)
-        except Exception as e:
-            logger.warning(f"Failed to count words: {e}")
-            # Fallback: simple word count
-            return len(html_content.split())
\ No newline at end of file
+        return count_words(html_content)
@@ -8,17 +8,22 @@ import time
 import logging
 from typing import Dict, List, Any
 from datetime import datetime
-from anthropic import Anthropic
+from services.llm_service import get_llm_service
+from services.site_analysis_cache import get_site_analysis_cache, site_key, content_fingerprint, request_hash
 
 logger = logging.getLogger(__name__)
 
 class ContentAnalyzer:
     """Analyzes website content using Claude to understand structure and extract insights"""
 
+    # Insights describing the site itself; the other sections depend on the article (keyword, brief, links)
+    SITE_SECTIONS = ('main_topics', 'target_audience', 'content_tone', 'seo_opportunities')
+
     def __init__(self):
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.llm = get_llm_service()
         self.model = "claude-sonnet-4-5-20250929"  # Claude Sonnet 4.5
         self.max_tokens = 4000
+        self.cache = get_site_analysis_cache()
 
     async def analyze_content(self, scraped_data: Dict[str, Any], user_context: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -35,11 +40,30 @@ class ContentAnalyzer:
         logger.info("Starting content analysis with Claude...")
 
         try:
+            # Reuse the last analysis of this site while its content has not changed
+            main_site = scraped_data.get('main_site', {})
+            site = site_key(main_site.get('url', ''))
+            fingerprint = content_fingerprint(main_site.get('content', {}), user_context.get('domain', ''))
+            context_hash = request_hash(
+                user_context,
+                self._format_internal_pages(scraped_data.get('internal_pages', [])),
+                self._format_external_references(scraped_data.get('external_references', []))
+            )
+
+            cached = self.cache.get(site, fingerprint) if self.cache else None
+            if cached:
+                insights = cached['insights']
+                if cached.get('request_hash') != context_hash:
+                    # Other article on the same site: keep the site-level insights only
+                    insights = {key: value for key, value in insights.items() if key in self.SITE_SECTIONS}
+                logger.info(f"Content analysis served from site cache for {site} ({len(insights)} sections)")
+                return self._build_result(insights, user_context, start_time, raw_analysis='', cached=True)
+
             # Prepare content for analysis
             analysis_prompt = self._build_analysis_prompt(scraped_data, user_context)
 
             # Call Claude API
-            response = self.client.messages.create(
+            response = await self.llm.create_message(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=0.3,
@@ -56,27 +80,12 @@ class ContentAnalyzer:
             # Parse the structured response
             insights = self._parse_analysis_response(analysis_result)
 
-            processing_time = round(time.time() - start_time, 2)
-
-            result = {
-                'success': True,
-                'processing_time': processing_time,
-                'timestamp': datetime.now().isoformat(),
-                'raw_analysis': analysis_result,
-                'insights': insights,
-                'user_context': user_context,
-                'content_summary': {
-                    'main_topics': insights.get('main_topics', []),
-                    'content_gaps': insights.get('content_gaps', []),
-                    'seo_opportunities': insights.get('seo_opportunities', []),
-                    'target_audience': insights.get('target_audience', ''),
-                    'content_tone': insights.get('content_tone', ''),
-                    'competitor_analysis': insights.get('competitor_analysis', {})
-                }
-            }
+            # Only complete analyses are reused: no truncated response, every site-level section present
+            if (self.cache and response.stop_reason == 'end_turn'
+                    and all(insights.get(key) for key in self.SITE_SECTIONS)):
+                self.cache.set(site, fingerprint, insights, context_hash)
 
-            logger.info(f"Content analysis completed in {processing_time}s")
-            return result
+            return self._build_result(insights, user_context, start_time, raw_analysis=analysis_result)
 
         except Exception as e:
             logger.error(f"Content analysis failed: {str(e)}")
@@ -86,6 +95,32 @@ class ContentAnalyzer:
                 'processing_time': round(time.time() - start_time, 2)
             }
 
+    def _build_result(self, insights: Dict[str, Any], user_context: Dict[str, Any], start_time: float,
+                      raw_analysis: str, cached: bool = False) -> Dict[str, Any]:
+        """Assemble the step result from the parsed insights"""
+        processing_time = round(time.time() - start_time, 2)
+
+        result = {
+            'success': True,
+            'processing_time': processing_time,
+            'timestamp': datetime.now().isoformat(),
+            'raw_analysis': raw_analysis,
+            'insights': insights,
+            'user_context': user_context,
+            'cached': cached,
+            'content_summary': {
+                'main_topics': insights.get('main_topics', []),
+                'content_gaps': insights.get('content_gaps', []),
+                'seo_opportunities': insights.get('seo_opportunities', []),
+                'target_audience': insights.get('target_audience', ''),
+                'content_tone': insights.get('content_tone', ''),
+                'competitor_analysis': insights.get('competitor_analysis', {})
+            }
+        }
+
+        logger.info(f"Content analysis completed in {processing_time}s")
+        return result
+
     def _build_analysis_prompt(self, scraped_data: Dict[str, Any], user_context: Dict[str, Any]) -> str:
         """Build the analysis prompt for Claude"""
 
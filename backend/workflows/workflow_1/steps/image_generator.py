@@ -9,6 +9,7 @@ import logging
 import requests
 from typing import Dict, Any
 from datetime import datetime
+from services.ideogram_service import get_ideogram_service
 
 logger = logging.getLogger(__name__)
 
@@ -16,8 +17,7 @@ class ImageGenerator:
     """Generates images using Ideogram API based on article content"""
 
     def __init__(self):
-        self.api_key = os.getenv('IDEOGRAM_API_KEY')
-        self.api_url = "https://api.ideogram.ai/v1/ideogram-v3/generate"
+        self.ideogram = get_ideogram_service()
         self.style_type = "REALISTIC"
         self.resolution = "1216x704"
 
@@ -43,26 +43,12 @@ class ImageGenerator:
 
             logger.info(f"Image prompt: {image_prompt[:200]}...")
 
-            # Call Ideogram API v3
-            response = requests.post(
-                self.api_url,
-                headers={
-                    "Api-Key": self.api_key,
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "prompt": image_prompt,
-                    "style_type": self.style_type,
-                    "resolution": self.resolution
-                },
-                timeout=60
+            # Call Ideogram API v3 (pooled, non-blocking)
+            result = await self.ideogram.generate(
+                prompt=image_prompt,
+                style_type=self.style_type,
+                resolution=self.resolution
             )
-
-            if response.status_code != 200:
-                logger.error(f"Ideogram API error: {response.status_code} - {response.text}")
-                raise Exception(f"Ideogram API error: {response.status_code}")
-
-            result = response.json()
             logger.info(f"Ideogram API response: {result}")
 
             # Extract image URL from v3 response
@@ -3,15 +3,15 @@ Step 1: Website Scraping Module
 Scrapes website content to understand the site structure and existing content
 """
 
-import requests
 import asyncio
-import aiohttp
 import time
 import logging
-from urllib.parse import urljoin, urlparse
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from urllib.parse import urlparse
+from typing import Dict, List, Any, Optional, Awaitable
 from datetime import datetime
+from backend.config import Config
+from services.fetch_service import get_fetch_service
+from utils.html_extractor import extract_page, PAGE_SKIP_TAGS
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +19,11 @@ class WebsiteScraper:
     """Handles website content scraping and analysis"""
 
     def __init__(self):
-        self.session = None
+        self.fetcher = get_fetch_service()  # Shared connection pool (per-host limits, keep-alive, DNS cache)
         self.timeout = 30
         self.max_retries = 3
-        self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        self.max_concurrency = Config.SCRAPER_MAX_CONCURRENCY
+        self.deadline = Config.SCRAPER_DEADLINE_SECONDS
 
     async def scrape_website(self, url: str, internal_links: List[str] = None, external_links: List[str] = None) -> Dict[str, Any]:
         """
@@ -40,67 +41,60 @@ class WebsiteScraper:
         logger.info(f"Starting website scraping for: {url}")
 
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                headers={'User-Agent': self.user_agent}
-            ) as session:
-                self.session = session
-
-                # Scrape main site
-                main_content = await self._scrape_single_page(url)
-                if not main_content.get('success'):
-                    return {
-                        'success': False,
-                        'error': f"Failed to scrape main site: {main_content.get('error')}"
-                    }
-
-                # Scrape internal links
-                internal_content = []
-                if internal_links:
-                    logger.info(f"Scraping {len(internal_links)} internal links...")
-                    for link in internal_links[:5]:  # Limit to 5 internal links
-                        try:
-                            content = await self._scrape_single_page(link)
-                            if content.get('success'):
-                                internal_content.append(content)
-                        except Exception as e:
-                            logger.warning(f"Failed to scrape internal link {link}: {e}")
-
-                # Analyze external links (no full scraping, just metadata)
-                external_analysis = []
-                if external_links:
-                    logger.info(f"Analyzing {len(external_links)} external links...")
-                    for link in external_links[:10]:  # Limit to 10 external links
-                        try:
-                            analysis = await self._analyze_external_link(link)
-                            if analysis:
-                                external_analysis.append(analysis)
-                        except Exception as e:
-                            logger.warning(f"Failed to analyze external link {link}: {e}")
-
-                # Compile results
-                processing_time = round(time.time() - start_time, 2)
-                result = {
-                    'success': True,
-                    'processing_time': processing_time,
-                    'timestamp': datetime.now().isoformat(),
-                    'main_site': {
-                        'url': url,
-                        'content': main_content,
-                        'domain': urlparse(url).netloc
-                    },
-                    'internal_pages': internal_content,
-                    'external_references': external_analysis,
-                    'stats': {
-                        'main_word_count': len(main_content.get('text_content', '').split()),
-                        'internal_pages_scraped': len(internal_content),
-                        'external_links_analyzed': len(external_analysis),
-                        'total_processing_time': processing_time
-                    }
+            # Scrape main site
+            main_content = await self._scrape_single_page(url)
+            if not main_content.get('success'):
+                return {
+                    'success': False,
+                    'error': f"Failed to scrape main site: {main_content.get('error')}"
                 }
 
-                logger.info(f"Website scraping completed in {processing_time}s")
-                return result
+            # Scrape internal links and analyze external links (no full scraping,
+            # just metadata) concurrently, within the step deadline
+            internal_links = (internal_links or [])[:5]  # Limit to 5 internal links
+            external_links = (external_links or [])[:10]  # Limit to 10 external links
+            if internal_links or external_links:
+                logger.info(f"Fetching {len(internal_links)} internal and {len(external_links)} external links...")
+
+            remaining = self.deadline - (time.time() - start_time)
+            results = await self._gather_within_deadline(
+                [self._scrape_single_page(link) for link in internal_links] +
+                [self._analyze_external_link(link) for link in external_links],
+                timeout=remaining
+            )
+
+            internal_content = [
+                content for content in results[:len(internal_links)]
+                if content and content.get('success')
+            ]
+            external_analysis = [
+                analysis for analysis in results[len(internal_links):]
+                if analysis
+            ]
+
+            # Compile results
+            processing_time = round(time.time() - start_time, 2)
+            result = {
+                'success': True,
+                'processing_time': processing_time,
+                'timestamp': datetime.now().isoformat(),
+                'main_site': {
+                    'url': url,
+                    'content': main_content,
+                    'domain': urlparse(url).netloc
+                },
+                'internal_pages': internal_content,
+                'external_references': external_analysis,
+                'stats': {
+                    'main_word_count': len(main_content.get('text_content', '').split()),
+                    'internal_pages_scraped': len(internal_content),
+                    'external_links_analyzed': len(external_analysis),
+                    'total_processing_time': processing_time
+                }
+            }
+
+            logger.info(f"Website scraping completed in {processing_time}s")
+            return result
 
         except Exception as e:
             logger.error(f"Website scraping failed: {str(e)}")
@@ -110,62 +104,60 @@ class WebsiteScraper:
                 'processing_time': round(time.time() - start_time, 2)
             }
 
+    async def _gather_within_deadline(self, coros: List[Awaitable], timeout: float) -> List[Any]:
+        """
+        Run coroutines concurrently and keep only those finished before the deadline
+
+        Returns:
+            Results in the same order as coros (None for failed or unfinished ones)
+        """
+        if not coros:
+            return []
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(coro):
+            try:
+                async with semaphore:
+                    return await coro
+            finally:
+                coro.close()  # No-op once awaited; avoids warnings for links dropped before starting
+
+        tasks = [asyncio.ensure_future(bounded(coro)) for coro in coros]
+        done, pending = await asyncio.wait(tasks, timeout=max(timeout, 0))
+
+        if pending:
+            logger.warning(f"Scraping deadline reached: {len(pending)} page(s) dropped")
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results = []
+        for task in tasks:
+            if task in done and not task.cancelled() and task.exception() is None:
+                results.append(task.result())
+            else:
+                if task in done and not task.cancelled():
+                    logger.warning(f"Failed to fetch link: {task.exception()}")
+                results.append(None)
+
+        return results
+
     async def _scrape_single_page(self, url: str) -> Dict[str, Any]:
-        """Scrape content from a single page"""
+        """Scrape content from a single page (served from the scrape cache when possible)"""
         try:
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    return {
-                        'success': False,
-                        'error': f"HTTP {response.status}",
-                        'url': url
-                    }
-
-                html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'html.parser')
-
-                # Remove script and style elements
-                for script in soup(["script", "style", "nav", "footer", "header"]):
-                    script.decompose()
-
-                # Extract key elements
-                title = soup.find('title')
-                meta_description = soup.find('meta', attrs={'name': 'description'})
-                h1_tags = soup.find_all('h1')
-                h2_tags = soup.find_all('h2')
-                h3_tags = soup.find_all('h3')
-
-                # Get clean text content
-                text_content = soup.get_text()
-                text_content = ' '.join(text_content.split())  # Clean whitespace
-
-                # Extract images
-                images = []
-                for img in soup.find_all('img'):
-                    src = img.get('src')
-                    alt = img.get('alt', '')
-                    if src:
-                        images.append({
-                            'src': urljoin(url, src),
-                            'alt': alt
-                        })
-
+            response = await self.fetcher.fetch_page(
+                url, self._parse_page, namespace='website_page', timeout=self.timeout
+            )
+            if response['status'] != 200:
                 return {
-                    'success': True,
-                    'url': url,
-                    'title': title.get_text().strip() if title else '',
-                    'meta_description': meta_description.get('content', '') if meta_description else '',
-                    'headings': {
-                        'h1': [h.get_text().strip() for h in h1_tags],
-                        'h2': [h.get_text().strip() for h in h2_tags],
-                        'h3': [h.get_text().strip() for h in h3_tags]
-                    },
-                    'text_content': text_content[:5000],  # Limit to 5000 chars
-                    'images': images[:10],  # Limit to 10 images
-                    'word_count': len(text_content.split()),
-                    'scraped_at': datetime.now().isoformat()
+                    'success': False,
+                    'error': f"HTTP {response['status']}",
+                    'url': url
                 }
 
+            return response['data']
+
         except Exception as e:
             logger.error(f"Failed to scrape {url}: {str(e)}")
             return {
@@ -174,27 +166,48 @@ class WebsiteScraper:
                 'url': url
             }
 
+    @staticmethod
+    def _parse_page(html_content: str, url: str) -> Dict[str, Any]:
+        """Extract title, meta, headings, text and images from a page"""
+        page = extract_page(html_content, base_url=url, skip_tags=PAGE_SKIP_TAGS)
+        text_content = page['text']
+
+        return {
+            'success': True,
+            'url': url,
+            'title': page['title'],
+            'meta_description': page['meta_description'],
+            'headings': page['headings'],
+            'text_content': text_content[:5000],  # Limit to 5000 chars
+            'images': page['images'][:10],  # Limit to 10 images
+            'word_count': len(text_content.split()),
+            'scraped_at': datetime.now().isoformat()
+        }
+
     async def _analyze_external_link(self, url: str) -> Optional[Dict[str, Any]]:
         """Analyze external link without full content scraping"""
         try:
-            async with self.session.get(url) as response:
-                if response.status != 200:
-                    return None
-
-                html_content = await response.text()
-                soup = BeautifulSoup(html_content, 'html.parser')
+            response = await self.fetcher.fetch_page(
+                url, self._parse_external_link, namespace='external_link', timeout=self.timeout
+            )
+            if response['status'] != 200:
+                return None
 
-                title = soup.find('title')
-                meta_description = soup.find('meta', attrs={'name': 'description'})
-
-                return {
-                    'url': url,
-                    'domain': urlparse(url).netloc,
-                    'title': title.get_text().strip() if title else '',
-                    'meta_description': meta_description.get('content', '') if meta_description else '',
-                    'analyzed_at': datetime.now().isoformat()
-                }
+            return response['data']
 
         except Exception as e:
             logger.warning(f"Failed to analyze external link {url}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    @staticmethod
+    def _parse_external_link(html_content: str, url: str) -> Dict[str, Any]:
+        """Extract title and meta description of an external page"""
+        page = extract_page(html_content, base_url=url)
+
+        return {
+            'url': url,
+            'domain': urlparse(url).netloc,
+            'title': page['title'],
+            'meta_description': page['meta_description'],
+            'analyzed_at': datetime.now().isoformat()
+        }
\ No newline at end of file
@@ -17,6 +17,7 @@ from .steps.website_scraper import WebsiteScraper
 from .steps.content_analyzer import ContentAnalyzer
 from .steps.article_generator import ArticleGenerator
 from .steps.image_generator import ImageGenerator
+from ..early_image import EarlyImage
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -51,6 +52,14 @@ class WorkflowManager:
         workflow_id = f"wf1_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         logger.info(f"Starting workflow {workflow_id} for site: {user_data.get('site_url')}")
 
+        # Featured image, started while the article is still streaming
+        image = EarlyImage(self.image_gen, user_requirements={
+            'site_url': user_data['site_url'],
+            'domain': user_data['domain'],
+            'keyword': user_data['keyword'],
+            'guideline': user_data['guideline']
+        })
+
         try:
             # Step 1: Website Scraping
             logger.info("Step 1: Scraping website content...")
@@ -94,6 +103,14 @@ class WorkflowManager:
             if progress_callback:
                 progress_callback(3, 'in_progress', 50)
 
+            sections_done = []
+
+            def on_section(tag, content):
+                image.on_section(tag, content)
+                sections_done.append(tag)
+                if progress_callback:
+                    progress_callback(3, 'in_progress', 50 + 25 * len(sections_done) // (len(self.generator.SECTIONS) + 1))
+
             generation_result = await self.generator.generate_article(
                 scraped_data=scraping_result,
                 analysis_data=analysis_result,
@@ -104,7 +121,8 @@ class WorkflowManager:
                     'guideline': user_data['guideline'],
                     'internal_links': user_data.get('internal_links', []),
                     'external_links': user_data.get('external_links', [])
-                }
+                },
+                on_section=on_section
             )
 
             if not generation_result.get('success'):
@@ -118,15 +136,7 @@ class WorkflowManager:
             if progress_callback:
                 progress_callback(4, 'in_progress', 75)
 
-            image_result = await self.image_gen.generate_image(
-                article_data=generation_result['article'],
-                user_requirements={
-                    'site_url': user_data['site_url'],
-                    'domain': user_data['domain'],
-                    'keyword': user_data['keyword'],
-                    'guideline': user_data['guideline']
-                }
-            )
+            image_result = await image.result(generation_result['article'])
 
             # Add image to article (even if failed, we provide None)
             if image_result.get('success'):
@@ -166,6 +176,7 @@ class WorkflowManager:
             return final_result
 
         except Exception as e:
+            image.cancel()
             logger.error(f"Workflow {workflow_id} failed: {str(e)}")
             return {
                 'workflow_id': workflow_id,
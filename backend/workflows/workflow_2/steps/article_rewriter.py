@@ -3,14 +3,16 @@ Step 2: Article Rewriter using Anthropic Claude
 Rewrites and optimizes articles for SEO, LLMO, RAG, and People-first
 """
 
-import os
 import time
 import json
 import logging
-from typing import Dict, Any
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from anthropic import Anthropic
-import pymysql
+from services.llm_service import get_llm_service
+from services.template_cache import get_template_cache
+from utils.prompt_template import compile_template
+from utils.html_extractor import count_words
+from utils.tagged_sections import SectionStream
 
 logger = logging.getLogger(__name__)
 
@@ -18,21 +20,37 @@ logger = logging.getLogger(__name__)
 class ArticleRewriter:
     """Rewrites articles using Claude with comprehensive optimization"""
 
+    # Tagged sections of the Claude response (parsed key -> tag)
+    SECTIONS = {
+        'seo_title': 'SEO_TITLE',
+        'meta_description': 'META_DESCRIPTION',
+        'wordpress_excerpt': 'WORDPRESS_EXCERPT',
+        'html_content': 'HTML_CONTENT',
+        'faq_section': 'FAQ_SECTION',
+        'faq_json': 'FAQ_JSON',
+        'secondary_keywords': 'SECONDARY_KEYWORDS',
+        'internal_links_added': 'INTERNAL_LINKS_ADDED',
+        'improvements': 'IMPROVEMENTS'
+    }
+
     def __init__(self, workflow_id=2):
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.llm = get_llm_service()
         self.model = "claude-sonnet-4-5-20250929"
         self.max_tokens = 16000
         self.workflow_id = workflow_id
+        self.templates = get_template_cache()
 
     async def rewrite_article(self,
                              article_data: Dict[str, Any],
-                             user_requirements: Dict[str, Any]) -> Dict[str, Any]:
+                             user_requirements: Dict[str, Any],
+                             on_section: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
         """
         Rewrite and optimize an existing article
 
         Args:
             article_data: Extracted article content from step 1
             user_requirements: User inputs (keyword, internal_links, etc.)
+            on_section: Called with (tag, content) as each section finishes streaming
 
         Returns:
             Rewritten article with all optimizations
@@ -42,23 +60,27 @@ class ArticleRewriter:
 
         try:
             # Build the rewriting prompt
-            rewriting_prompt = self._build_rewriting_prompt(
+            instructions, rewriting_prompt = self._build_rewriting_prompt(
                 article_data=article_data,
                 user_requirements=user_requirements
             )
 
-            # Call Claude API
-            response = self.client.messages.create(
+            # Call Claude API (streamed: sections are reported as soon as they close)
+            sections = SectionStream(self.SECTIONS.values(), on_section=on_section)
+            response = await self.llm.stream_message(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=0.7,
+                system=instructions,
                 messages=[
                     {
                         "role": "user",
                         "content": rewriting_prompt
                     }
-                ]
+                ],
+                on_text=sections.feed
             )
+            sections.finish()
 
             rewritten_content = response.content[0].text
 
@@ -67,7 +89,7 @@ class ArticleRewriter:
             logger.info(f"Claude response length: {len(rewritten_content)} characters")
 
             # Parse the structured response
-            parsed_article = self._parse_rewritten_response(rewritten_content)
+            parsed_article = self._parse_rewritten_response(sections.sections, sections.recovered)
 
             processing_time = round(time.time() - start_time, 2)
 
@@ -96,7 +118,8 @@ class ArticleRewriter:
                     'word_count': self._count_words(parsed_article.get('html_content', '')),
                     'tokens_used': response.usage.input_tokens + response.usage.output_tokens,
                     'input_tokens': response.usage.input_tokens,
-                    'output_tokens': response.usage.output_tokens
+                    'output_tokens': response.usage.output_tokens,
+                    'cache_read_input_tokens': getattr(response.usage, 'cache_read_input_tokens', 0) or 0
                 },
                 'raw_output': rewritten_content
             }
@@ -114,8 +137,8 @@ class ArticleRewriter:
 
     def _build_rewriting_prompt(self,
                                 article_data: Dict[str, Any],
-                                user_requirements: Dict[str, Any]) -> str:
-        """Build the comprehensive rewriting prompt using database template"""
+                                user_requirements: Dict[str, Any]) -> Tuple[str, str]:
+        """Build the comprehensive rewriting prompt using database template (fixed instructions, request context)"""
 
         # Load template from database
         try:
@@ -144,76 +167,25 @@ class ArticleRewriter:
         }
 
         # Inject variables into template
-        prompt = template
-        for key, value in variables.items():
-            prompt = prompt.replace(f'{{{key}}}', str(value))
-
-        return prompt
+        return compile_template(template).render_split(
+            variables, self.templates.get_variable_specs(self.workflow_id)
+        )
 
     def _load_template_from_db(self) -> str:
         """Load the active template for workflow 2 from the database"""
-        try:
-            conn = pymysql.connect(
-                host=os.getenv('DB_HOST'),
-                port=int(os.getenv('DB_PORT', 3306)),
-                user=os.getenv('DB_USER'),
-                password=os.getenv('DB_PASSWORD'),
-                database=os.getenv('DB_NAME'),
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT content, version
-                    FROM prompt_templates
-                    WHERE workflow_id = %s AND is_active = TRUE
-                    ORDER BY version DESC
-                    LIMIT 1
-                """, (self.workflow_id,))
-
-                result = cursor.fetchone()
-
-                if result:
-                    logger.info(f"Loaded template from database: workflow {self.workflow_id}, version {result['version']}")
-                    return result['content']
-                else:
-                    logger.warning(f"No active template found in database for workflow {self.workflow_id}")
-                    return None
+        return self.templates.get_active(self.workflow_id)
 
-        except Exception as e:
-            logger.error(f"Failed to load template from database: {e}")
-            return None
-
-        finally:
-            if conn:
-                conn.close()
-
-    def _parse_rewritten_response(self, response: str) -> Dict[str, Any]:
+    def _parse_rewritten_response(self, sections: Dict[str, str], recovered: List[str]) -> Dict[str, Any]:
         """Parse the structured rewritten article response from Claude"""
         parsed = {}
 
-        sections = {
-            'seo_title': 'SEO_TITLE',
-            'meta_description': 'META_DESCRIPTION',
-            'wordpress_excerpt': 'WORDPRESS_EXCERPT',
-            'html_content': 'HTML_CONTENT',
-            'faq_section': 'FAQ_SECTION',
-            'faq_json': 'FAQ_JSON',
-            'secondary_keywords': 'SECONDARY_KEYWORDS',
-            'internal_links_added': 'INTERNAL_LINKS_ADDED',
-            'improvements': 'IMPROVEMENTS'
-        }
+        if recovered:
+            logger.warning(f"Recovered rewritten article sections without closing tag: {', '.join(recovered)}")
 
-        for key, tag in sections.items():
+        for key, tag in self.SECTIONS.items():
             try:
-                start_tag = f"<{tag}>"
-                end_tag = f"</{tag}>"
-                start_idx = response.find(start_tag)
-                end_idx = response.find(end_tag)
-
-                if start_idx != -1 and end_idx != -1:
-                    content = response[start_idx + len(start_tag):end_idx].strip()
+                if tag in sections:
+                    content = sections[tag]
 
                     # Special handling for different types
                     if key == 'secondary_keywords':
@@ -250,12 +222,4 @@ class ArticleRewriter:
 
     def _count_words(self, html_content: str) -> int:
         """Count words in HTML content (excluding tags)"""
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text = soup.get_text()
-            words = text.split()
-            return len(words)
-        except Exception as e:
-            logger.warning(f"Failed to count words: {e}")
-            return len(html_content.split())
\ No newline at end of file
+        return count_words(html_content)
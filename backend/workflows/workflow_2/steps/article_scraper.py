@@ -3,13 +3,12 @@ Step 1: Article Scraper for Workflow 2
 Extracts article content from URL or accepts manual input
 """
 
-import asyncio
-import aiohttp
 import time
 import logging
 from typing import Dict, Any, Optional
-from bs4 import BeautifulSoup
 from datetime import datetime
+from services.fetch_service import get_fetch_service
+from utils.html_extractor import extract_page, extract_text, ARTICLE_SKIP_TAGS
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +17,8 @@ class ArticleScraper:
     """Handles article content extraction from URLs or manual input"""
 
     def __init__(self):
+        self.fetcher = get_fetch_service()
         self.timeout = 30
-        self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 
     async def extract_article(self,
                              input_mode: str,
@@ -77,84 +76,50 @@ class ArticleScraper:
     async def _scrape_article_from_url(self, url: str) -> Dict[str, Any]:
         """Scrape article content from URL - extracts ONLY article content"""
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                headers={'User-Agent': self.user_agent}
-            ) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status} error")
-
-                    html_content = await response.text()
-                    soup = BeautifulSoup(html_content, 'html.parser')
-
-                    # Remove unwanted elements (nav, footer, header, ads, etc.)
-                    for element in soup(['script', 'style', 'nav', 'footer', 'header',
-                                        'aside', 'iframe', 'noscript', 'form']):
-                        element.decompose()
-
-                    # Try to find the main article content
-                    article_element = (
-                        soup.find('article') or
-                        soup.find('main') or
-                        soup.find('div', class_=lambda c: c and ('content' in c.lower() or 'article' in c.lower())) or
-                        soup.find('div', id=lambda i: i and ('content' in i.lower() or 'article' in i.lower()))
-                    )
-
-                    if article_element:
-                        content_soup = article_element
-                    else:
-                        # Fallback to body
-                        content_soup = soup.find('body') or soup
-
-                    # Extract title
-                    title = None
-                    title_element = content_soup.find('h1')
-                    if title_element:
-                        title = title_element.get_text().strip()
-                    else:
-                        # Fallback to page title
-                        title_tag = soup.find('title')
-                        if title_tag:
-                            title = title_tag.get_text().strip()
-
-                    # Extract meta description
-                    meta_desc = soup.find('meta', attrs={'name': 'description'})
-                    meta_description = meta_desc.get('content', '') if meta_desc else ''
-
-                    # Get clean HTML content (preserve structure)
-                    html_content = str(content_soup)
-
-                    # Get clean text for word count
-                    text_content = content_soup.get_text()
-                    text_content = ' '.join(text_content.split())
-
-                    # Count words
-                    word_count = len(text_content.split())
-
-                    return {
-                        'title': title or 'Sans titre',
-                        'content_html': html_content,
-                        'content_text': text_content[:10000],  # Limit for safety
-                        'meta_description': meta_description,
-                        'word_count': word_count,
-                        'source_url': url,
-                        'extraction_method': 'url_scraping'
-                    }
+            response = await self.fetcher.fetch_page(
+                url, self._parse_article, namespace='article', timeout=self.timeout
+            )
+            if response['status'] != 200:
+                raise Exception(f"HTTP {response['status']} error")
+
+            return response['data']
 
         except Exception as e:
             logger.error(f"Failed to scrape article from {url}: {str(e)}")
             raise Exception(f"Article scraping failed: {str(e)}")
 
+    @staticmethod
+    def _parse_article(html_content: str, url: str) -> Dict[str, Any]:
+        """Extract the main article content from a page"""
+        page = extract_page(html_content, base_url=url, skip_tags=ARTICLE_SKIP_TAGS, main_content=True)
+
+        # Main block: <article>, <main>, div with content/article class or id, else <body>
+        main = page['main']
+
+        # Title: first <h1> of the main block, fallback to page title
+        title = main['h1'] or page['title']
+
+        # Get clean HTML content (preserve structure) and text
+        text_content = main['text']
+
+        # Count words
+        word_count = len(text_content.split())
+
+        return {
+            'title': title or 'Sans titre',
+            'content_html': main['html'],
+            'content_text': text_content[:10000],  # Limit for safety
+            'meta_description': page['meta_description'],
+            'word_count': word_count,
+            'source_url': url,
+            'extraction_method': 'url_scraping'
+        }
+
     def _process_manual_content(self, title: str, content: str) -> Dict[str, Any]:
         """Process manually provided article content"""
         try:
-            # Parse content if it's HTML
-            soup = BeautifulSoup(content, 'html.parser')
-
-            # Get text content
-            text_content = soup.get_text()
-            text_content = ' '.join(text_content.split())
+            # Parse content if it's HTML and get text content
+            text_content = extract_text(content)
 
             # Count words
             word_count = len(text_content.split())
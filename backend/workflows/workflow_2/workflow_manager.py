@@ -15,6 +15,7 @@ from datetime import datetime
 from .steps.article_scraper import ArticleScraper
 from .steps.article_rewriter import ArticleRewriter
 from .steps.image_generator import ImageGenerator
+from ..early_image import EarlyImage
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -48,6 +49,7 @@ class WorkflowManager:
         """
         workflow_id = f"wf2_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         logger.info(f"Starting workflow {workflow_id} for article rewriting")
+        image = None
 
         try:
             # Step 1: Article Extraction
@@ -73,12 +75,26 @@ class WorkflowManager:
             if progress_callback:
                 progress_callback(2, 'in_progress', 33)
 
+            # Featured image, started while the article is still streaming
+            image = EarlyImage(self.image_gen, user_requirements={
+                'keyword': user_data.get('keyword', ''),
+                'guideline': f"Réécriture optimisée de l'article: {extraction_result.get('title', '')}"
+            })
+            sections_done = []
+
+            def on_section(tag, content):
+                image.on_section(tag, content)
+                sections_done.append(tag)
+                if progress_callback:
+                    progress_callback(2, 'in_progress', 33 + 33 * len(sections_done) // (len(self.rewriter.SECTIONS) + 1))
+
             rewriting_result = await self.rewriter.rewrite_article(
                 article_data=extraction_result,
                 user_requirements={
                     'keyword': user_data.get('keyword', ''),
                     'internal_links': user_data.get('internal_links', [])
-                }
+                },
+                on_section=on_section
             )
 
             if not rewriting_result.get('success'):
@@ -92,13 +108,7 @@ class WorkflowManager:
             if progress_callback:
                 progress_callback(3, 'in_progress', 66)
 
-            image_result = await self.image_gen.generate_image(
-                article_data=rewriting_result['article'],
-                user_requirements={
-                    'keyword': user_data.get('keyword', ''),
-                    'guideline': f"Réécriture optimisée de l'article: {extraction_result.get('title', '')}"
-                }
-            )
+            image_result = await image.result(rewriting_result['article'])
 
             # Add image to article (even if failed, we provide None)
             if image_result.get('success'):
@@ -147,6 +157,8 @@ class WorkflowManager:
             return final_result
 
         except Exception as e:
+            if image:
+                image.cancel()
             logger.error(f"Workflow {workflow_id} failed: {str(e)}")
             return {
                 'workflow_id': workflow_id,
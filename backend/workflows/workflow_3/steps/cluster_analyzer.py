@@ -3,13 +3,12 @@ Step 1: Cluster Analyzer for Workflow 3
 Analyzes the pillar article and identifies 3 satellite themes
 """
 
-import asyncio
-import aiohttp
 import time
 import logging
 from typing import Dict, Any, List
-from bs4 import BeautifulSoup
 from datetime import datetime
+from services.fetch_service import get_fetch_service
+from utils.html_extractor import extract_page, ARTICLE_SKIP_TAGS
 
 logger = logging.getLogger(__name__)
 
@@ -18,8 +17,8 @@ class ClusterAnalyzer:
     """Analyzes pillar article and identifies satellite themes"""
 
     def __init__(self):
+        self.fetcher = get_fetch_service()
         self.timeout = 30
-        self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
 
     async def analyze_and_extract(self, pillar_url: str, keyword: str) -> Dict[str, Any]:
         """
@@ -79,65 +78,43 @@ class ClusterAnalyzer:
     async def _scrape_pillar_article(self, url: str) -> Dict[str, Any]:
         """Scrape the pillar article content"""
         try:
-            async with aiohttp.ClientSession(
-                timeout=aiohttp.ClientTimeout(total=self.timeout),
-                headers={'User-Agent': self.user_agent}
-            ) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        raise Exception(f"HTTP {response.status} error")
-
-                    html_content = await response.text()
-                    soup = BeautifulSoup(html_content, 'html.parser')
-
-                    # Remove unwanted elements
-                    for element in soup(['script', 'style', 'nav', 'footer', 'header',
-                                        'aside', 'iframe', 'noscript', 'form']):
-                        element.decompose()
-
-                    # Find main article content
-                    article_element = (
-                        soup.find('article') or
-                        soup.find('main') or
-                        soup.find('div', class_=lambda c: c and ('content' in c.lower() or 'article' in c.lower()))
-                    )
-
-                    content_soup = article_element if article_element else soup.find('body')
-
-                    # Extract title
-                    title = None
-                    title_element = content_soup.find('h1')
-                    if title_element:
-                        title = title_element.get_text().strip()
-                    else:
-                        title_tag = soup.find('title')
-                        if title_tag:
-                            title = title_tag.get_text().strip()
-
-                    # Extract meta description
-                    meta_desc = soup.find('meta', attrs={'name': 'description'})
-                    meta_description = meta_desc.get('content', '') if meta_desc else ''
-
-                    # Get HTML and text content
-                    html_content = str(content_soup)
-                    text_content = content_soup.get_text()
-                    text_content = ' '.join(text_content.split())
-
-                    # Count words
-                    word_count = len(text_content.split())
-
-                    return {
-                        'title': title or 'Sans titre',
-                        'content_html': html_content,
-                        'content_text': text_content[:15000],  # Limit for safety
-                        'meta_description': meta_description,
-                        'word_count': word_count
-                    }
+            response = await self.fetcher.fetch_page(
+                url, self._parse_pillar_article, namespace='pillar_article', timeout=self.timeout
+            )
+            if response['status'] != 200:
+                raise Exception(f"HTTP {response['status']} error")
+
+            return response['data']
 
         except Exception as e:
             logger.error(f"Failed to scrape pillar article: {str(e)}")
             raise Exception(f"Pillar article scraping failed: {str(e)}")
 
+    @staticmethod
+    def _parse_pillar_article(html_content: str, url: str) -> Dict[str, Any]:
+        """Extract the pillar article content from a page"""
+        page = extract_page(html_content, base_url=url, skip_tags=ARTICLE_SKIP_TAGS, main_content=True)
+
+        # Main block: <article>, <main>, div with content/article class or id, else <body>
+        main = page['main']
+
+        # Title: first <h1> of the main block, fallback to page title
+        title = main['h1'] or page['title']
+
+        # Get clean HTML content (preserve structure) and text
+        text_content = main['text']
+
+        # Count words
+        word_count = len(text_content.split())
+
+        return {
+            'title': title or 'Sans titre',
+            'content_html': main['html'],
+            'content_text': text_content[:15000],  # Limit for safety
+            'meta_description': page['meta_description'],
+            'word_count': word_count
+        }
+
     def _identify_satellite_themes(self, pillar_content: str, pillar_title: str, main_keyword: str) -> List[Dict[str, str]]:
         """
         Identify 3 complementary satellite themes based on pillar content
@@ -3,14 +3,16 @@ Step 2: Pillar Article Rewriter for Workflow 3
 Rewrites and optimizes the pillar article with links to satellites
 """
 
-import os
 import time
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
 from datetime import datetime
-from anthropic import Anthropic
-import pymysql
+from services.llm_service import get_llm_service
+from services.template_cache import get_template_cache
+from utils.prompt_template import compile_template
+from utils.html_extractor import count_words
+from utils.tagged_sections import SectionStream
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +20,29 @@ logger = logging.getLogger(__name__)
 class PillarRewriter:
     """Rewrites pillar article with optimization for cluster structure"""
 
+    # Tagged sections of the Claude response (parsed key -> tag)
+    SECTIONS = {
+        'seo_title': 'SEO_TITLE',
+        'meta_description': 'META_DESCRIPTION',
+        'wordpress_excerpt': 'WORDPRESS_EXCERPT',
+        'html_content': 'HTML_CONTENT',
+        'faq_section': 'FAQ_SECTION',
+        'faq_json': 'FAQ_JSON',
+        'satellite_links': 'SATELLITE_LINKS'
+    }
+
     def __init__(self, workflow_id=3):
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.llm = get_llm_service()
         self.model = "claude-sonnet-4-5-20250929"
         self.max_tokens = 16000
         self.workflow_id = workflow_id
+        self.templates = get_template_cache()
 
     async def rewrite_pillar(self,
                             pillar_data: Dict[str, Any],
                             satellite_themes: List[Dict[str, str]],
-                            main_keyword: str) -> Dict[str, Any]:
+                            main_keyword: str,
+                            on_section: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
         """
         Rewrite and optimize pillar article for cluster
 
@@ -35,6 +50,7 @@ class PillarRewriter:
             pillar_data: Extracted pillar article content
             satellite_themes: List of 3 satellite themes
             main_keyword: Main keyword for the cluster
+            on_section: Called with (tag, content) as each section finishes streaming
 
         Returns:
             Optimized pillar article
@@ -44,24 +60,28 @@ class PillarRewriter:
 
         try:
             # Build the rewriting prompt
-            rewriting_prompt = self._build_pillar_prompt(
+            instructions, rewriting_prompt = self._build_pillar_prompt(
                 pillar_data=pillar_data,
                 satellite_themes=satellite_themes,
                 main_keyword=main_keyword
             )
 
-            # Call Claude API
-            response = self.client.messages.create(
+            # Call Claude API (streamed: sections are reported as soon as they close)
+            sections = SectionStream(self.SECTIONS.values(), on_section=on_section)
+            response = await self.llm.stream_message(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=0.7,
+                system=instructions,
                 messages=[
                     {
                         "role": "user",
                         "content": rewriting_prompt
                     }
-                ]
+                ],
+                on_text=sections.feed
             )
+            sections.finish()
 
             rewritten_content = response.content[0].text
 	    
@@ -69,7 +89,7 @@ class PillarRewriter:
             logger.info(rewritten_content[:1000])
             logger.info(f"===== PILLAR CLAUDE RESPONSE LENGTH: {len(rewritten_content)} =====")	
 	    # Parse the structured response
-            parsed_article = self._parse_pillar_response(rewritten_content)
+            parsed_article = self._parse_pillar_response(sections.sections, sections.recovered)
 
             processing_time = round(time.time() - start_time, 2)
 
@@ -108,8 +128,8 @@ class PillarRewriter:
     def _build_pillar_prompt(self,
                             pillar_data: Dict[str, Any],
                             satellite_themes: List[Dict[str, str]],
-                            main_keyword: str) -> str:
-        """Build the pillar rewriting prompt"""
+                            main_keyword: str) -> Tuple[str, str]:
+        """Build the pillar rewriting prompt (fixed instructions, request context)"""
 
         # Load template from database
         try:
@@ -141,49 +161,13 @@ class PillarRewriter:
         }
 
         # Inject variables
-        prompt = template
-        for key, value in variables.items():
-            prompt = prompt.replace(f'{{{key}}}', str(value))
-
-        return prompt
+        return compile_template(template).render_split(
+            variables, self.templates.get_variable_specs(self.workflow_id)
+        )
 
     def _load_template_from_db(self) -> str:
         """Load template from database"""
-        try:
-            conn = pymysql.connect(
-                host=os.getenv('DB_HOST'),
-                port=int(os.getenv('DB_PORT', 3306)),
-                user=os.getenv('DB_USER'),
-                password=os.getenv('DB_PASSWORD'),
-                database=os.getenv('DB_NAME'),
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT content, version
-                    FROM prompt_templates
-                    WHERE workflow_id = %s AND is_active = TRUE
-                    ORDER BY version DESC
-                    LIMIT 1
-                """, (self.workflow_id,))
-
-                result = cursor.fetchone()
-
-                if result:
-                    logger.info(f"Loaded template from database: workflow {self.workflow_id}, version {result['version']}")
-                    return result['content']
-                else:
-                    return None
-
-        except Exception as e:
-            logger.error(f"Failed to load template from database: {e}")
-            return None
-
-        finally:
-            if conn:
-                conn.close()
+        return self.templates.get_active(self.workflow_id)
 
     def _get_fallback_pillar_template(self) -> str:
         """Fallback template if database is unavailable"""
@@ -212,29 +196,17 @@ Format de sortie:
 <SATELLITE_LINKS>lien1, lien2, lien3</SATELLITE_LINKS>
 """
 
-    def _parse_pillar_response(self, response: str) -> Dict[str, Any]:
+    def _parse_pillar_response(self, sections: Dict[str, str], recovered: List[str]) -> Dict[str, Any]:
         """Parse pillar article response from Claude"""
         parsed = {}
 
-        sections = {
-            'seo_title': 'SEO_TITLE',
-            'meta_description': 'META_DESCRIPTION',
-            'wordpress_excerpt': 'WORDPRESS_EXCERPT',
-            'html_content': 'HTML_CONTENT',
-            'faq_section': 'FAQ_SECTION',
-            'faq_json': 'FAQ_JSON',
-            'satellite_links': 'SATELLITE_LINKS'
-        }
+        if recovered:
+            logger.warning(f"Recovered pillar sections without closing tag: {', '.join(recovered)}")
 
-        for key, tag in sections.items():
+        for key, tag in self.SECTIONS.items():
             try:
-                start_tag = f"<{tag}>"
-                end_tag = f"</{tag}>"
-                start_idx = response.find(start_tag)
-                end_idx = response.find(end_tag)
-
-                if start_idx != -1 and end_idx != -1:
-                    content = response[start_idx + len(start_tag):end_idx].strip()
+                if tag in sections:
+                    content = sections[tag]
 
                     if key == 'faq_json':
                         try:
@@ -262,10 +234,4 @@ Format de sortie:
 
     def _count_words(self, html_content: str) -> int:
         """Count words in HTML"""
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text = soup.get_text()
-            return len(text.split())
-        except:
-            return len(html_content.split())
+        return count_words(html_content)
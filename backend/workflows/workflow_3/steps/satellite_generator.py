@@ -3,14 +3,18 @@ Step 3: Satellite Articles Generator for Workflow 3
 Generates 3 satellite articles based on identified themes
 """
 
-import os
 import time
+import asyncio
 import json
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Callable, Tuple
 from datetime import datetime
-from anthropic import Anthropic
-import pymysql
+from backend.config import Config
+from services.llm_service import get_llm_service
+from services.template_cache import get_template_cache
+from utils.prompt_template import compile_template
+from utils.html_extractor import count_words
+from utils.tagged_sections import SectionStream
 
 logger = logging.getLogger(__name__)
 
@@ -18,16 +22,31 @@ logger = logging.getLogger(__name__)
 class SatelliteGenerator:
     """Generates 3 satellite articles for the cluster"""
 
+    # Tagged sections of the Claude response (parsed key -> tag)
+    SECTIONS = {
+        'seo_title': 'SEO_TITLE',
+        'meta_description': 'META_DESCRIPTION',
+        'wordpress_excerpt': 'WORDPRESS_EXCERPT',
+        'html_content': 'HTML_CONTENT',
+        'faq_section': 'FAQ_SECTION',
+        'faq_json': 'FAQ_JSON',
+        'internal_links': 'INTERNAL_LINKS'
+    }
+
     def __init__(self, workflow_id=3):
-        self.client = Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        self.llm = get_llm_service()
         self.model = "claude-sonnet-4-5-20250929"
         self.max_tokens = 16000
         self.workflow_id = workflow_id
+        self.templates = get_template_cache()
+        self.max_concurrency = Config.SATELLITE_MAX_CONCURRENCY
 
     async def generate_satellites(self,
                                  pillar_data: Dict[str, Any],
                                  satellite_themes: List[Dict[str, str]],
-                                 main_keyword: str) -> Dict[str, Any]:
+                                 main_keyword: str,
+                                 on_satellite_ready: Optional[Callable[[Dict[str, Any]], None]] = None,
+                                 on_section: Optional[Callable[[int, str, str], None]] = None) -> Dict[str, Any]:
         """
         Generate 3 satellite articles
 
@@ -35,6 +54,8 @@ class SatelliteGenerator:
             pillar_data: Pillar article data (for context)
             satellite_themes: List of 3 themes
             main_keyword: Main cluster keyword
+            on_satellite_ready: Optional callback(article) called as soon as each satellite is generated
+            on_section: Optional callback(satellite_number, tag, content) called as each section finishes streaming
 
         Returns:
             List of 3 satellite articles
@@ -43,18 +64,36 @@ class SatelliteGenerator:
         logger.info("Starting satellite articles generation...")
 
         try:
-            satellites = []
-
-            # Generate each satellite article
-            for i, theme in enumerate(satellite_themes, 1):
-                logger.info(f"Generating satellite {i}/3: {theme['theme']}")
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            total = len(satellite_themes)
+
+            async def generate(i: int, theme: Dict[str, str]) -> Dict[str, Any]:
+                async with semaphore:
+                    logger.info(f"Generating satellite {i}/{total}: {theme['theme']}")
+                    satellite_article = await self._generate_single_satellite(
+                        theme=theme,
+                        pillar_title=pillar_data.get('title', ''),
+                        main_keyword=main_keyword,
+                        satellite_number=i,
+                        on_section=(lambda tag, content: on_section(i, tag, content)) if on_section else None
+                    )
+
+                if on_satellite_ready and satellite_article['success']:
+                    on_satellite_ready(satellite_article['article'])
+
+                return satellite_article
+
+            # Generate satellites concurrently (bounded by max_concurrency)
+            results = await asyncio.gather(
+                *[generate(i, theme) for i, theme in enumerate(satellite_themes, 1)],
+                return_exceptions=True
+            )
 
-                satellite_article = await self._generate_single_satellite(
-                    theme=theme,
-                    pillar_title=pillar_data.get('title', ''),
-                    main_keyword=main_keyword,
-                    satellite_number=i
-                )
+            satellites = []
+            for i, satellite_article in enumerate(results, 1):
+                # BaseException: a cancelled satellite comes back as CancelledError
+                if isinstance(satellite_article, BaseException):
+                    satellite_article = {'success': False, 'error': str(satellite_article) or type(satellite_article).__name__}
 
                 if satellite_article['success']:
                     satellites.append(satellite_article['article'])
@@ -72,7 +111,7 @@ class SatelliteGenerator:
                 'total_generated': len(satellites)
             }
 
-            logger.info(f"Satellite generation completed: {len(satellites)}/3 articles in {processing_time}s")
+            logger.info(f"Satellite generation completed: {len(satellites)}/{total} articles in {processing_time}s")
             return result
 
         except Exception as e:
@@ -87,35 +126,40 @@ class SatelliteGenerator:
                                         theme: Dict[str, str],
                                         pillar_title: str,
                                         main_keyword: str,
-                                        satellite_number: int) -> Dict[str, Any]:
+                                        satellite_number: int,
+                                        on_section: Optional[Callable[[str, str], None]] = None) -> Dict[str, Any]:
         """Generate a single satellite article"""
 
         try:
             # Build the satellite prompt
-            prompt = self._build_satellite_prompt(
+            instructions, prompt = self._build_satellite_prompt(
                 theme=theme,
                 pillar_title=pillar_title,
                 main_keyword=main_keyword,
                 satellite_number=satellite_number
             )
 
-            # Call Claude API
-            response = self.client.messages.create(
+            # Call Claude API (streamed: sections are reported as soon as they close)
+            sections = SectionStream(self.SECTIONS.values(), on_section=on_section)
+            response = await self.llm.stream_message(
                 model=self.model,
                 max_tokens=self.max_tokens,
                 temperature=0.7,
+                system=instructions,
                 messages=[
                     {
                         "role": "user",
                         "content": prompt
                     }
-                ]
+                ],
+                on_text=sections.feed
             )
+            sections.finish()
 
             response_content = response.content[0].text
 
             # Parse the response
-            parsed_article = self._parse_satellite_response(response_content)
+            parsed_article = self._parse_satellite_response(sections.sections, sections.recovered)
 
             # Log parsed data for debugging
             logger.info(f"Satellite {satellite_number} parsed - Title: {parsed_article.get('seo_title', 'MISSING')[:50]}")
@@ -157,8 +201,8 @@ class SatelliteGenerator:
                                 theme: Dict[str, str],
                                 pillar_title: str,
                                 main_keyword: str,
-                                satellite_number: int) -> str:
-        """Build satellite generation prompt"""
+                                satellite_number: int) -> Tuple[str, str]:
+        """Build satellite generation prompt (fixed instructions, request context)"""
 
         # Try loading from database, fallback to embedded template
         try:
@@ -181,48 +225,13 @@ class SatelliteGenerator:
         }
 
         # Inject variables
-        prompt = template
-        for key, value in variables.items():
-            prompt = prompt.replace(f'{{{key}}}', str(value))
-
-        return prompt
+        return compile_template(template).render_split(
+            variables, self.templates.get_variable_specs(self.workflow_id)
+        )
 
     def _load_template_from_db(self) -> str:
         """Load template from database"""
-        try:
-            conn = pymysql.connect(
-                host=os.getenv('DB_HOST'),
-                port=int(os.getenv('DB_PORT', 3306)),
-                user=os.getenv('DB_USER'),
-                password=os.getenv('DB_PASSWORD'),
-                database=os.getenv('DB_NAME'),
-                charset='utf8mb4',
-                cursorclass=pymysql.cursors.DictCursor
-            )
-
-            with conn.cursor() as cursor:
-                cursor.execute("""
-                    SELECT content, version
-                    FROM prompt_templates
-                    WHERE workflow_id = %s AND is_active = TRUE
-                    ORDER BY version DESC
-                    LIMIT 1
-                """, (self.workflow_id,))
-
-                result = cursor.fetchone()
-
-                if result:
-                    return result['content']
-                else:
-                    return None
-
-        except Exception as e:
-            logger.error(f"Failed to load template: {e}")
-            return None
-
-        finally:
-            if conn:
-                conn.close()
+        return self.templates.get_active(self.workflow_id)
 
     def _get_fallback_satellite_template(self) -> str:
         """Fallback template for satellite generation"""
@@ -255,29 +264,17 @@ Format de sortie:
 <INTERNAL_LINKS>lien1, lien2</INTERNAL_LINKS>
 """
 
-    def _parse_satellite_response(self, response: str) -> Dict[str, Any]:
+    def _parse_satellite_response(self, sections: Dict[str, str], recovered: List[str]) -> Dict[str, Any]:
         """Parse satellite article response"""
         parsed = {}
 
-        sections = {
-            'seo_title': 'SEO_TITLE',
-            'meta_description': 'META_DESCRIPTION',
-            'wordpress_excerpt': 'WORDPRESS_EXCERPT',
-            'html_content': 'HTML_CONTENT',
-            'faq_section': 'FAQ_SECTION',
-            'faq_json': 'FAQ_JSON',
-            'internal_links': 'INTERNAL_LINKS'
-        }
+        if recovered:
+            logger.warning(f"Recovered satellite sections without closing tag: {', '.join(recovered)}")
 
-        for key, tag in sections.items():
+        for key, tag in self.SECTIONS.items():
             try:
-                start_tag = f"<{tag}>"
-                end_tag = f"</{tag}>"
-                start_idx = response.find(start_tag)
-                end_idx = response.find(end_tag)
-
-                if start_idx != -1 and end_idx != -1:
-                    content = response[start_idx + len(start_tag):end_idx].strip()
+                if tag in sections:
+                    content = sections[tag]
 
                     if key == 'faq_json':
                         try:
@@ -305,10 +302,4 @@ Format de sortie:
 
     def _count_words(self, html_content: str) -> int:
         """Count words in HTML"""
-        try:
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            text = soup.get_text()
-            return len(text.split())
-        except:
-            return len(html_content.split())
+        return count_words(html_content)
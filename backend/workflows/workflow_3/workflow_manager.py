@@ -1,6 +1,6 @@
 """
 Workflow Manager for Cluster Generation (Workflow 3)
-Orchestrates: Analysis → Pillar Rewrite → 3 Satellites → Images
+Orchestrates: Analysis → (Pillar Rewrite ∥ 3 Satellites) → Images
 """
 
 import os
@@ -13,6 +13,8 @@ from .steps.cluster_analyzer import ClusterAnalyzer
 from .steps.pillar_rewriter import PillarRewriter
 from .steps.satellite_generator import SatelliteGenerator
 from .steps.image_generator import ImageGenerator
+from ..task_graph import TaskGraph
+from ..early_image import EarlyImage
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -36,7 +38,7 @@ class WorkflowManager:
                 - pillar_url: str (URL of pillar article)
                 - keyword: str (main keyword)
                 - generate_images: bool (optional, default True)
-            progress_callback: Optional callback function(step, status, progress_percent)
+            progress_callback: Optional callback function(step, status, progress_percent[, data])
 
         Returns:
             Cluster data with 1 pillar + 3 satellites
@@ -45,55 +47,113 @@ class WorkflowManager:
         logger.info(f"Starting workflow {workflow_id} for cluster generation")
 
         try:
-            # Step 1: Analyze pillar and identify satellite themes
-            logger.info("Step 1: Analyzing pillar article...")
-            if progress_callback:
-                progress_callback(1, 'in_progress', 10)
-
-            analysis_result = await self.analyzer.analyze_and_extract(
-                pillar_url=user_data.get('pillar_url'),
-                keyword=user_data.get('keyword')
-            )
-
-            if not analysis_result.get('success'):
-                raise Exception(f"Analysis failed: {analysis_result.get('error')}")
-
-            if progress_callback:
-                progress_callback(1, 'completed', 25)
-
-            # Step 2: Rewrite pillar article
-            logger.info("Step 2: Rewriting pillar article...")
-            if progress_callback:
-                progress_callback(2, 'in_progress', 25)
-
-            pillar_result = await self.pillar_rewriter.rewrite_pillar(
-                pillar_data=analysis_result['pillar_article'],
-                satellite_themes=analysis_result['satellite_themes'],
-                main_keyword=user_data.get('keyword')
-            )
-
-            if not pillar_result.get('success'):
-                raise Exception(f"Pillar rewriting failed: {pillar_result.get('error')}")
-
-            if progress_callback:
-                progress_callback(2, 'completed', 45)
-
-            # Step 3: Generate 3 satellite articles
-            logger.info("Step 3: Generating satellite articles...")
-            if progress_callback:
-                progress_callback(3, 'in_progress', 45)
-
-            satellites_result = await self.satellite_generator.generate_satellites(
-                pillar_data=analysis_result['pillar_article'],
-                satellite_themes=analysis_result['satellite_themes'],
-                main_keyword=user_data.get('keyword')
-            )
-
-            if not satellites_result.get('success'):
-                raise Exception(f"Satellite generation failed: {satellites_result.get('error')}")
-
-            if progress_callback:
-                progress_callback(3, 'completed', 75)
+            # Step 4 runs as a pipeline: each article's image starts as soon as its
+            # title and HTML have streamed, bounded by the shared Ideogram request pool
+            generate_images = user_data.get('generate_images', True)
+            images = {}  # 'pillar' / satellite number -> EarlyImage, created once the analysis is known
+
+            def schedule_image(key, article: Dict[str, Any]):
+                # Fallback when the stream did not start the image (missing title)
+                if key in images:
+                    images[key].start(article)
+
+            def on_satellite_section(number: int, tag: str, content: str):
+                if number in images:
+                    images[number].on_section(tag, content)
+
+            async def analyze():
+                # Step 1: Analyze pillar and identify satellite themes
+                logger.info("Step 1: Analyzing pillar article...")
+                if progress_callback:
+                    progress_callback(1, 'in_progress', 10)
+
+                analysis_result = await self.analyzer.analyze_and_extract(
+                    pillar_url=user_data.get('pillar_url'),
+                    keyword=user_data.get('keyword')
+                )
+
+                if not analysis_result.get('success'):
+                    raise Exception(f"Analysis failed: {analysis_result.get('error')}")
+
+                if progress_callback:
+                    # Partial result: the loading page shows the satellite count right away
+                    progress_callback(1, 'completed', 25, {'satellite_themes': analysis_result['satellite_themes']})
+
+                if generate_images:
+                    images['pillar'] = EarlyImage(self.image_gen, user_requirements={
+                        'keyword': user_data.get('keyword'),
+                        'guideline': f"Pillar: {analysis_result['pillar_article'].get('title', '')}"
+                    })
+                    for i, theme in enumerate(analysis_result['satellite_themes'], 1):
+                        images[i] = EarlyImage(self.image_gen, user_requirements={
+                            'keyword': user_data.get('keyword'),
+                            'guideline': f"Satellite: {theme['theme']}"
+                        })
+
+                return analysis_result
+
+            # Steps 2 & 3: pillar rewrite and satellite generation only depend on
+            # the analysis, so they run as two concurrent branches of a DAG
+            completed_branches = []
+
+            def branch_completed(step: int):
+                completed_branches.append(step)
+                if progress_callback:
+                    progress_callback(step, 'completed', 25 + 25 * len(completed_branches))
+
+            async def rewrite_pillar(analysis_result: Dict[str, Any]):
+                logger.info("Step 2: Rewriting pillar article...")
+                if progress_callback:
+                    progress_callback(2, 'in_progress', 25)
+
+                pillar_result = await self.pillar_rewriter.rewrite_pillar(
+                    pillar_data=analysis_result['pillar_article'],
+                    satellite_themes=analysis_result['satellite_themes'],
+                    main_keyword=user_data.get('keyword'),
+                    on_section=images['pillar'].on_section if generate_images else None
+                )
+
+                if not pillar_result.get('success'):
+                    raise Exception(f"Pillar rewriting failed: {pillar_result.get('error')}")
+
+                schedule_image('pillar', pillar_result['pillar_article'])
+                branch_completed(2)
+                return pillar_result
+
+            async def generate_satellites(analysis_result: Dict[str, Any]):
+                logger.info("Step 3: Generating satellite articles...")
+                if progress_callback:
+                    progress_callback(3, 'in_progress', 25)
+
+                satellites_result = await self.satellite_generator.generate_satellites(
+                    pillar_data=analysis_result['pillar_article'],
+                    satellite_themes=analysis_result['satellite_themes'],
+                    main_keyword=user_data.get('keyword'),
+                    on_satellite_ready=lambda article: schedule_image(article['number'], article),
+                    on_section=on_satellite_section
+                )
+
+                if not satellites_result.get('success'):
+                    raise Exception(f"Satellite generation failed: {satellites_result.get('error')}")
+
+                branch_completed(3)
+                return satellites_result
+
+            graph = TaskGraph()
+            graph.add('analysis', analyze)
+            graph.add('pillar', rewrite_pillar, depends_on=['analysis'])
+            graph.add('satellites', generate_satellites, depends_on=['analysis'])
+            try:
+                branch_results = await graph.run()
+            except Exception:
+                for image in images.values():
+                    image.cancel()
+                await asyncio.gather(*[image.task for image in images.values() if image.task], return_exceptions=True)
+                raise
+
+            analysis_result = branch_results['analysis']
+            pillar_result = branch_results['pillar']
+            satellites_result = branch_results['satellites']
 
             # Step 4: Generate images (optional)
             logger.info("Step 4: Generating images...")
@@ -102,26 +162,16 @@ class WorkflowManager:
 
             articles = [pillar_result['pillar_article']] + satellites_result['satellites']
 
-            if user_data.get('generate_images', True):
-                # Generate images for all articles
-                for i, article in enumerate(articles):
-                    logger.info(f"Generating image {i+1}/{len(articles)}")
+            if generate_images:
+                # Wait for the images still in flight
+                logger.info(f"Waiting for {len(articles)} image(s)")
+                images_used = ['pillar'] + [satellite['number'] for satellite in satellites_result['satellites']]
+                unused = [images[key] for key in images.keys() - images_used]
+                for image in unused:
+                    image.cancel()  # Satellite that failed after its HTML streamed
+                await asyncio.gather(*[image.task for image in unused if image.task], return_exceptions=True)
 
-                    image_result = await self.image_gen.generate_image(
-                        article_data=article,
-                        user_requirements={
-                            'keyword': user_data.get('keyword'),
-                            'guideline': f"{article['type'].capitalize()}: {article['seo_title']}"
-                        }
-                    )
-
-                    if image_result.get('success'):
-                        article['image_url'] = image_result['image_url']
-                        article['image_prompt'] = image_result.get('prompt_used', '')
-                    else:
-                        article['image_url'] = None
-                        article['image_prompt'] = ''
-                        logger.warning(f"Image generation failed for {article['type']}")
+                await asyncio.gather(*[images[key].apply(article) for key, article in zip(images_used, articles)])
             else:
                 logger.info("Image generation skipped")
 
@@ -146,7 +196,7 @@ class WorkflowManager:
                     'main_keyword': user_data.get('keyword'),
                     'pillar_source': user_data.get('pillar_url'),
                     'satellite_themes': analysis_result['satellite_themes'],
-                    'images_generated': user_data.get('generate_images', True)
+                    'images_generated': generate_images
                 },
                 'processing_time': {
                     'analysis': analysis_result.get('processing_time', 0),
@@ -0,0 +1,11 @@
+-- Migration: Manifest des fichiers de workflow
+-- Date: 2025-01-20
+-- Description: Ajoute le manifest JSON des fichiers stockés dans MinIO.
+--              Chaque contenu identique (même SHA-256) n'est stocké qu'une fois ;
+--              les autres noms de fichier pointent vers le même objet, nommé
+--              par son contenu (<sha256>.gz) pour ne jamais être écrasé.
+
+-- Format : {"article_main.html.gz": {"object": "<sha256>.gz", "sha256": "<sha256>", "size": 1234, "compressed": true, "source": "pillar.html.gz"}, ...}
+ALTER TABLE workflows
+    ADD COLUMN manifest JSON NULL COMMENT 'Fichiers du workflow : nom -> objet MinIO, hash, taille'
+    AFTER files_count;
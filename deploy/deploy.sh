@@ -206,7 +206,8 @@ EnvironmentFile=${APP_DIR}/.env
 ExecStart=${APP_DIR}/backend/venv/bin/gunicorn \
     --bind 127.0.0.1:${BACKEND_PORT} \
     --workers 4 \
-    --worker-class sync \
+    --worker-class gevent \
+    --worker-connections 1000 \
     --timeout 300 \
     --access-logfile ${APP_DIR}/logs/gunicorn-access.log \
     --error-logfile ${APP_DIR}/logs/gunicorn-error.log \
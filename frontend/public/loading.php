@@ -271,6 +271,7 @@ const workflowType = <?php echo $workflowType; ?>;
 let startTime = Date.now();
 let currentStep = 0;
 let pollingInterval = null;
+let progressSource = null;
 let elapsedTimeInterval = null;
 let workflowId = null;
 let modalShown = false;
@@ -328,7 +329,7 @@ async function checkForExistingWorkflow() {
                 if (resume) {
                     workflowId = processingWorkflow.workflow_id;
                     sessionStorage.removeItem('workflowFormData');
-                    pollProgress();
+                    watchProgress();
                     startElapsedTimeCounter();
                     setInterval(rotateTip, 8000);
                     return true;
@@ -385,7 +386,7 @@ async function startWorkflow(data) {
             }
         }, 3000);
 
-        pollProgress();
+        watchProgress();
 
     } catch (error) {
         console.error('Workflow error:', error);
@@ -395,7 +396,35 @@ async function startWorkflow(data) {
     }
 }
 
-async function pollProgress() {
+function watchProgress() {
+    if (!workflowId) return;
+
+    // Flux SSE : le serveur pousse chaque changement d'étape
+    if (!window.EventSource) {
+        pollProgress();
+        return;
+    }
+
+    progressSource = new EventSource(`/api/workflow-progress/${workflowId}/stream`);
+
+    progressSource.onmessage = (event) => {
+        try {
+            handleProgress(JSON.parse(event.data));
+        } catch (error) {
+            handleProgressError(error);
+        }
+    };
+
+    progressSource.onerror = () => {
+        // Coupure réseau : EventSource se reconnecte seul. Flux refusé : repli sur le polling
+        if (progressSource && progressSource.readyState === EventSource.CLOSED) {
+            progressSource = null;
+            pollProgress();
+        }
+    };
+}
+
+function pollProgress() {
     if (!workflowId) return;
 
     pollingInterval = setInterval(async () => {
@@ -404,65 +433,74 @@ async function pollProgress() {
             const response = await fetch(`/api/workflow-progress/${workflowId}`, {
                 headers: { 'Authorization': `Bearer ${token}` }
             });
-            const progress = await response.json();
+            handleProgress(await response.json());
+        } catch (error) {
+            handleProgressError(error);
+        }
+    }, 2000);
+}
 
-            if (progress.status === 'not_found') {
-                clearInterval(pollingInterval);
-                throw new Error('Workflow not found');
-            }
+function stopProgress() {
+    clearInterval(pollingInterval);
+    clearInterval(elapsedTimeInterval);
+    if (progressSource) {
+        progressSource.close();
+        progressSource = null;
+    }
+}
 
-            updateGlobalProgress(progress.progress_percent || 0);
+function handleProgress(progress) {
+    if (progress.status === 'not_found') {
+        throw new Error('Workflow not found');
+    }
 
-            if (progress.step_details) {
-                for (let i = 1; i <= 4; i++) {
-                    const stepKey = `step_${i}`;
-                    if (progress.step_details[stepKey]) {
-                        updateStepStatus(i, progress.step_details[stepKey].status);
+    updateGlobalProgress(progress.progress_percent || 0);
 
-                        if (workflowType === 3 && i === 1 && progress.step_details[stepKey].status === 'completed') {
-                            updateClusterInfo(progress);
-                        }
-                    }
+    if (progress.step_details) {
+        for (let i = 1; i <= 4; i++) {
+            const stepKey = `step_${i}`;
+            if (progress.step_details[stepKey]) {
+                updateStepStatus(i, progress.step_details[stepKey].status);
+
+                if (workflowType === 3 && i === 1 && progress.step_details[stepKey].status === 'completed') {
+                    updateClusterInfo(progress);
                 }
             }
+        }
+    }
 
-            if (progress.current_step) {
-                const totalSteps = workflowType === 2 ? 3 : 4;
-                document.getElementById('stat-step').textContent = `${progress.current_step}/${totalSteps}`;
-                currentStep = progress.current_step;
-            }
+    if (progress.current_step) {
+        const totalSteps = workflowType === 2 ? 3 : 4;
+        document.getElementById('stat-step').textContent = `${progress.current_step}/${totalSteps}`;
+        currentStep = progress.current_step;
+    }
 
-            if (progress.status === 'completed') {
-                clearInterval(pollingInterval);
-                clearInterval(elapsedTimeInterval);
+    if (progress.status === 'completed') {
+        stopProgress();
 
-                if (progress.result && progress.result.article && progress.result.article.word_count) {
-                    document.getElementById('stat-words').textContent = progress.result.article.word_count;
-                }
+        if (progress.result && progress.result.article && progress.result.article.word_count) {
+            document.getElementById('stat-words').textContent = progress.result.article.word_count;
+        }
 
-                localStorage.removeItem('current_workflow_id');
-                Toast.show('Article généré avec succès !', 'success');
+        localStorage.removeItem('current_workflow_id');
+        Toast.show('Article généré avec succès !', 'success');
 
-                setTimeout(() => {
-                    window.location.href = `workflows.php?highlight=${workflowId}`;
-                }, 1500);
-            }
+        setTimeout(() => {
+            window.location.href = `workflows.php?highlight=${workflowId}`;
+        }, 1500);
+    }
 
-            if (progress.status === 'error') {
-                clearInterval(pollingInterval);
-                clearInterval(elapsedTimeInterval);
-                throw new Error(progress.error || 'Workflow failed');
-            }
+    if (progress.status === 'error') {
+        throw new Error(progress.error || 'Workflow failed');
+    }
+}
 
-        } catch (error) {
-            clearInterval(pollingInterval);
-            clearInterval(elapsedTimeInterval);
-            console.error('Polling error:', error);
-            updateStepStatus(currentStep || 1, 'error');
-            Toast.show(`Erreur: ${error.message}`, 'error');
-            setTimeout(() => window.location.href = `option${workflowType}.php`, 3000);
-        }
-    }, 2000);
+function handleProgressError(error) {
+    stopProgress();
+    console.error('Progress error:', error);
+    updateStepStatus(currentStep || 1, 'error');
+    Toast.show(`Erreur: ${error.message}`, 'error');
+    setTimeout(() => window.location.href = `option${workflowType}.php`, 3000);
 }
 
 function updateStepStatus(stepNumber, status) {
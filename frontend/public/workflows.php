@@ -77,6 +77,7 @@ const statusConfig = {
 
 // Variables globales pour les fonctions de modal
 let currentHtmlContent = '';
+let workflowBundles = {};  // workflowId -> articles (bundle)
 let currentMetadata = null;
 
 // Charger les workflows
@@ -242,21 +243,24 @@ async function viewWorkflow(workflowId) {
     btn.disabled = true;
 
     try {
-        const filesResponse = await fetch(`${API_BASE_URL}/workflows/${workflowId}/files`, {
+        // Tous les articles et métadonnées en une requête
+        const bundleResponse = await fetch(`${API_BASE_URL}/workflows/${workflowId}/bundle`, {
             headers: { 'Authorization': `Bearer ${token}` }
         });
 
-        const filesData = await filesResponse.json();
+        const bundle = await bundleResponse.json();
 
-        if (!filesData.success) {
-            throw new Error(filesData.error || 'Erreur de chargement');
+        if (!bundle.success) {
+            throw new Error(bundle.error || 'Erreur de chargement');
         }
 
-        if (filesData.workflow_type === 'cluster' && filesData.files.length > 1) {
-            showClusterModal(workflowId, filesData.files);
+        workflowBundles[workflowId] = bundle.articles;
+
+        if (bundle.workflow_type === 'cluster' && bundle.articles.length > 1) {
+            showClusterModal(workflowId, bundle.articles);
         } else {
-            const mainFile = filesData.files.find(f => f.type === 'main' || f.type === 'pillar') || filesData.files[0];
-            await openArticle(workflowId, mainFile.filename);
+            const mainArticle = bundle.articles.find(a => a.type === 'main' || a.type === 'pillar') || bundle.articles[0];
+            await openArticle(workflowId, mainArticle.filename);
         }
     } catch (error) {
         alert('Erreur: ' + error.message);
@@ -268,15 +272,24 @@ async function viewWorkflow(workflowId) {
 
 // Ouvrir un article
 async function openArticle(workflowId, filename) {
+    // Article déjà chargé avec le bundle du workflow
+    const loaded = (workflowBundles[workflowId] || []).find(a => a.filename === filename || a.aliases.includes(filename));
+    if (loaded) {
+        showArticleModal(loaded.content, loaded.metadata);
+        return;
+    }
+
     try {
-        const htmlResponse = await fetch(`${API_BASE_URL}/workflows/${workflowId}/download?filename=${filename}`, {
+        // Fichier servi tel que stocké (gzip décodé par le navigateur)
+        const htmlResponse = await fetch(`${API_BASE_URL}/workflows/${workflowId}/files/${filename}`, {
             headers: { 'Authorization': `Bearer ${token}` }
         });
-        const htmlData = await htmlResponse.json();
 
-        if (!htmlData.success) {
-            throw new Error(htmlData.error || 'Erreur de téléchargement');
+        if (!htmlResponse.ok) {
+            const errorData = await htmlResponse.json().catch(() => ({}));
+            throw new Error(errorData.error || 'Erreur de téléchargement');
         }
+        const htmlContent = await htmlResponse.text();
 
         let metadata = null;
         const metadataFilename = filename.includes('satellite')
@@ -284,18 +297,17 @@ async function openArticle(workflowId, filename) {
             : (filename.includes('pillar') ? 'pillar_metadata.json.gz' : 'metadata.json.gz');
 
         try {
-            const metaResponse = await fetch(`${API_BASE_URL}/workflows/${workflowId}/download?filename=${metadataFilename}`, {
+            const metaResponse = await fetch(`${API_BASE_URL}/workflows/${workflowId}/files/${metadataFilename}`, {
                 headers: { 'Authorization': `Bearer ${token}` }
             });
-            const metaData = await metaResponse.json();
-            if (metaData.success) {
-                metadata = JSON.parse(metaData.content);
+            if (metaResponse.ok) {
+                metadata = await metaResponse.json();
             }
         } catch (e) {
             console.log('Pas de métadonnées disponibles');
         }
 
-        showArticleModal(htmlData.content, metadata);
+        showArticleModal(htmlContent, metadata);
 
     } catch (error) {
         alert('Erreur: ' + error.message);
@@ -563,24 +575,45 @@ function showClusterModal(workflowId, files) {
         if (e.target === modal) modal.remove();
     });
 }
-// Télécharger tout le cluster (TODO: implémenter côté backend)
+// Télécharger tout le cluster (ZIP produit en flux par le backend)
 async function downloadAllCluster(workflowId) {
-    alert('Fonctionnalité à venir : Téléchargement ZIP du cluster complet');
+    try {
+        const response = await fetch(`${API_BASE_URL}/workflows/${workflowId}/bundle?format=zip`, {
+            headers: { 'Authorization': `Bearer ${token}` }
+        });
+
+        if (!response.ok) {
+            const errorData = await response.json().catch(() => ({}));
+            throw new Error(errorData.error || 'Erreur de téléchargement');
+        }
+
+        const blob = await response.blob();
+        const url = window.URL.createObjectURL(blob);
+        const a = document.createElement('a');
+        a.href = url;
+        a.download = `${workflowId}_cluster.zip`;
+        document.body.appendChild(a);
+        a.click();
+        window.URL.revokeObjectURL(url);
+        document.body.removeChild(a);
+
+    } catch (error) {
+        alert('Erreur: ' + error.message);
+    }
 }
 // Télécharger un workflow
 async function downloadWorkflow(workflowId, filename = 'article_main.html.gz') {
     try {
-        const response = await fetch(`${API_BASE_URL}/workflows/${workflowId}/download?filename=${filename}`, {
+        const response = await fetch(`${API_BASE_URL}/workflows/${workflowId}/files/${filename}`, {
             headers: { 'Authorization': `Bearer ${token}` }
         });
 
-        const data = await response.json();
-
-        if (!data.success) {
-            throw new Error(data.error || 'Erreur de téléchargement');
+        if (!response.ok) {
+            const errorData = await response.json().catch(() => ({}));
+            throw new Error(errorData.error || 'Erreur de téléchargement');
         }
 
-        const blob = new Blob([data.content], { type: 'text/html' });
+        const blob = await response.blob();
         const url = window.URL.createObjectURL(blob);
         const a = document.createElement('a');
         a.href = url;